@@ -0,0 +1,93 @@
+/**
+ * @tekton/core - Resolver Cache Bounds Tests
+ * Resolves more unique screens than the screen cache holds and checks that
+ * every resolver cache stays within its limits
+ * [SPEC-LAYOUT-002] [PHASE-2]
+ *
+ * The 50k-screen heap benchmark lives in bench-cache.mjs.
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import {
+  clearAllCaches,
+  configureCache,
+  getCacheStats,
+  resetCacheStats,
+} from '../src/cache.js';
+import { resolveScreen } from '../src/screen-generation/resolver/index.js';
+import type { ScreenDefinition } from '../src/screen-generation/types.js';
+
+const SCREEN_COUNT = 1_000;
+const SCREEN_CACHE_SIZE = 100;
+const SHELLS = ['shell.web.dashboard', 'shell.web.app', 'shell.web.minimal'];
+const PAGES = ['page.dashboard', 'page.detail', 'page.settings'];
+const PATTERNS = ['section.grid-4', 'section.grid-3', 'section.container'];
+
+function makeScreen(i: number): ScreenDefinition {
+  return {
+    id: `stress-screen-${i}`,
+    name: `Stress Screen ${i}`,
+    shell: SHELLS[i % SHELLS.length]!,
+    page: PAGES[i % PAGES.length]!,
+    themeId: 'default',
+    sections: [
+      {
+        id: 'main',
+        pattern: PATTERNS[i % PATTERNS.length]!,
+        components: [
+          { type: 'Heading', props: { level: 1, children: `Title ${i}` } },
+          { type: 'Button', props: { variant: i % 2 ? 'primary' : 'secondary', children: 'Save' } },
+        ],
+      },
+    ],
+  };
+}
+
+describe('Resolver Caches - Bounds', () => {
+  let defaultScreenCacheSize: number;
+
+  beforeEach(() => {
+    defaultScreenCacheSize = getCacheStats().find(s => s.name === 'screen')!.maxEntries;
+    configureCache('screen', { maxEntries: SCREEN_CACHE_SIZE });
+    clearAllCaches();
+    resetCacheStats();
+  });
+
+  afterEach(() => {
+    configureCache('screen', { maxEntries: defaultScreenCacheSize });
+    clearAllCaches();
+    resetCacheStats();
+  });
+
+  it('should keep every cache within its limits while resolving unique screens', () => {
+    for (let i = 0; i < SCREEN_COUNT; i++) {
+      resolveScreen(makeScreen(i));
+    }
+
+    const stats = getCacheStats();
+    for (const s of stats) {
+      expect(s.size).toBeLessThanOrEqual(s.maxEntries);
+      expect(s.bytes).toBeLessThanOrEqual(s.maxBytes);
+    }
+
+    // Unique screens churn the screen cache; shared layouts are all hits
+    const screen = stats.find(s => s.name === 'screen')!;
+    expect(screen.size).toBe(SCREEN_CACHE_SIZE);
+    expect(screen.evictions).toBe(SCREEN_COUNT - SCREEN_CACHE_SIZE);
+    expect(stats.find(s => s.name === 'layout')!.size).toBeLessThanOrEqual(
+      SHELLS.length + PAGES.length + PATTERNS.length
+    );
+  });
+
+  it('should serve repeated screens from the cache', () => {
+    for (let round = 0; round < 2; round++) {
+      for (let i = 0; i < SCREEN_CACHE_SIZE; i++) {
+        resolveScreen(makeScreen(i));
+      }
+    }
+
+    const screen = getCacheStats().find(s => s.name === 'screen')!;
+    expect(screen.misses).toBe(SCREEN_CACHE_SIZE);
+    expect(screen.hits).toBe(SCREEN_CACHE_SIZE);
+  });
+});
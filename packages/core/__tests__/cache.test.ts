@@ -0,0 +1,150 @@
+/**
+ * @tekton/core - Bounded Cache Tests
+ * LRU eviction, byte limits, statistics and structural keys
+ * [SPEC-LAYOUT-002] [PHASE-2]
+ */
+
+import { describe, it, expect, beforeEach } from 'vitest';
+import {
+  BoundedCache,
+  configureCache,
+  clearAllCaches,
+  getCacheStats,
+  propsKey,
+  resetCacheStats,
+  stringEntryBytes,
+} from '../src/cache.js';
+import { resolveLayout } from '../src/layout-resolver.js';
+import { resolveScreen } from '../src/screen-generation/resolver/index.js';
+import type { ScreenDefinition } from '../src/screen-generation/types.js';
+
+function makeScreen(id: string): ScreenDefinition {
+  return {
+    id,
+    name: `Screen ${id}`,
+    shell: 'shell.web.dashboard',
+    page: 'page.dashboard',
+    themeId: 'default',
+    sections: [
+      {
+        id: 'main',
+        pattern: 'section.grid-4',
+        components: [{ type: 'Button', props: { variant: 'primary', children: id } }],
+      },
+    ],
+  };
+}
+
+describe('BoundedCache', () => {
+  it('should evict the least recently used entry', () => {
+    const cache = new BoundedCache<string, number>('test', { maxEntries: 2 });
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.get('a');
+    cache.set('c', 3);
+
+    expect(cache.has('a')).toBe(true);
+    expect(cache.has('b')).toBe(false);
+    expect(cache.stats()).toMatchObject({ size: 2, evictions: 1 });
+  });
+
+  it('should enforce byte limits', () => {
+    const cache = new BoundedCache<string, string>('test', {
+      maxBytes: 40,
+      sizeOf: stringEntryBytes,
+    });
+    cache.set('a', 'xxxxxxxxx'); // 20 bytes
+    cache.set('b', 'xxxxxxxxx'); // 20 bytes
+    cache.set('c', 'xxxxxxxxx'); // 20 bytes
+
+    expect(cache.size).toBe(2);
+    expect(cache.stats().bytes).toBe(40);
+
+    // Entries larger than the whole cache are not stored
+    cache.set('d', 'x'.repeat(100));
+    expect(cache.has('d')).toBe(false);
+    expect(cache.size).toBe(2);
+  });
+
+  it('should track hits, misses and hit rate', () => {
+    const cache = new BoundedCache<string, number>('test');
+    cache.set('a', 1);
+    cache.get('a');
+    cache.get('b');
+
+    expect(cache.stats()).toMatchObject({ hits: 1, misses: 1, hitRate: 0.5 });
+
+    cache.resetStats();
+    expect(cache.stats()).toMatchObject({ hits: 0, misses: 0, hitRate: 0 });
+  });
+
+  it('should shrink when reconfigured', () => {
+    const cache = new BoundedCache<string, number>('test', { maxEntries: 10 });
+    for (let i = 0; i < 10; i++) {
+      cache.set(`k${i}`, i);
+    }
+
+    cache.configure({ maxEntries: 3 });
+    expect(cache.size).toBe(3);
+    expect(cache.has('k9')).toBe(true);
+
+    cache.configure({ maxEntries: 0 });
+    cache.set('k', 1);
+    expect(cache.size).toBe(0);
+  });
+});
+
+describe('Cache registry', () => {
+  beforeEach(() => {
+    clearAllCaches();
+    resetCacheStats();
+  });
+
+  it('should expose statistics for resolver caches', () => {
+    const names = getCacheStats().map(s => s.name);
+    expect(names).toEqual(expect.arrayContaining(['screen', 'component', 'binding', 'layout']));
+  });
+
+  it('should record hits for repeated resolutions', () => {
+    resolveLayout('shell.web.dashboard');
+    resolveLayout('shell.web.dashboard');
+
+    const layout = getCacheStats().find(s => s.name === 'layout')!;
+    expect(layout).toMatchObject({ hits: 1, misses: 1, size: 1 });
+  });
+
+  it('should keep resolver caches within configured limits', () => {
+    configureCache('screen', { maxEntries: 5 });
+    try {
+      for (let i = 0; i < 20; i++) {
+        resolveScreen(makeScreen(`screen-${i}`));
+      }
+
+      const screen = getCacheStats().find(s => s.name === 'screen')!;
+      expect(screen.size).toBe(5);
+      expect(screen.evictions).toBe(15);
+    } finally {
+      configureCache('screen', { maxEntries: 500 });
+    }
+  });
+
+  it('should reject unknown cache names', () => {
+    expect(() => configureCache('missing', { maxEntries: 1 })).toThrow(/Unknown cache/);
+  });
+});
+
+describe('propsKey', () => {
+  it('should distinguish values by type', () => {
+    expect(propsKey({ a: 1 })).not.toBe(propsKey({ a: '1' }));
+    expect(propsKey({ a: true })).not.toBe(propsKey({ a: 'true' }));
+  });
+
+  it('should ignore undefined values like JSON', () => {
+    expect(propsKey({ a: 'x', b: undefined })).toBe(propsKey({ a: 'x' }));
+  });
+
+  it('should fall back to JSON for nested values', () => {
+    expect(propsKey({ a: { b: 1 } })).toBe('json:{"a":{"b":1}}');
+    expect(propsKey({ a: { b: 1 } })).not.toBe(propsKey({ a: { b: 2 } }));
+  });
+});
@@ -15,6 +15,9 @@ import {
   formatCSS,
   validateCSS,
   generateAllLayoutCSS,
+  emitLayoutCSS,
+  emitAllLayoutCSS,
+  getPrebuiltLayoutCSS,
 } from '../src/layout-css-generator.js';
 import { getAllShellTokens } from '../src/layout-tokens/shells.js';
 import { getAllPageLayoutTokens } from '../src/layout-tokens/pages.js';
@@ -669,3 +672,69 @@ describe('CSS Output Quality', () => {
     expect(css.length).toBeLessThan(100000);
   });
 });
+
+// ============================================================================
+// Test: Streaming Emitter
+// ============================================================================
+
+describe('emitLayoutCSS', () => {
+  const tokens = () => [
+    ...getAllShellTokens(),
+    ...getAllPageLayoutTokens(),
+    ...getAllSectionPatternTokens(),
+  ];
+
+  it('should yield chunks that concatenate to generateLayoutCSS output', () => {
+    for (const options of [{}, { indent: '    ' }, { includeVariables: false }]) {
+      const chunks = Array.from(emitLayoutCSS(tokens(), options));
+
+      expect(chunks.length).toBeGreaterThan(1);
+      expect(chunks.join('')).toBe(generateLayoutCSS(tokens(), options));
+    }
+  });
+
+  it('should match the formatCSS layout of the unformatted generators', () => {
+    const raw =
+      generateCSSVariables(tokens()) +
+      generateShellClasses(getAllShellTokens()) +
+      generatePageClasses(getAllPageLayoutTokens()) +
+      generateSectionClasses(getAllSectionPatternTokens()) +
+      generateMediaQueries(tokens());
+
+    expect(Array.from(emitAllLayoutCSS()).join('')).toBe(formatCSS(raw));
+  });
+
+  it('should emit balanced chunks', () => {
+    for (const chunk of emitAllLayoutCSS()) {
+      expect(validateCSS(chunk)).toBe(true);
+    }
+  });
+
+  it('should emit nothing for empty token lists', () => {
+    expect(Array.from(emitLayoutCSS([]))).toEqual([]);
+  });
+});
+
+// ============================================================================
+// Test: Prebuilt Stylesheet
+// ============================================================================
+
+describe('getPrebuiltLayoutCSS', () => {
+  it('should serve a frozen, content-hashed stylesheet', () => {
+    const prebuilt = getPrebuiltLayoutCSS();
+
+    expect(prebuilt.css).toBe(generateAllLayoutCSS());
+    expect(prebuilt.hash).toMatch(/^[0-9a-f]{64}$/);
+    expect(prebuilt.fileName).toBe(`tekton-layout.${prebuilt.hash.slice(0, 8)}.css`);
+    expect(prebuilt.bytes).toBe(Buffer.byteLength(prebuilt.css));
+    expect(Object.isFrozen(prebuilt)).toBe(true);
+  });
+
+  it('should memoize per option set', () => {
+    expect(getPrebuiltLayoutCSS()).toBe(getPrebuiltLayoutCSS({ indent: '  ' }));
+
+    const compact = getPrebuiltLayoutCSS({ includeMediaQueries: false });
+    expect(compact.hash).not.toBe(getPrebuiltLayoutCSS().hash);
+    expect(compact.css).not.toContain('@media');
+  });
+});
@@ -0,0 +1,90 @@
+/**
+ * @tekton/core - Layout Token Index Tests
+ * Precompiled token references match a full traversal
+ * [SPEC-LAYOUT-001] [PHASE-7]
+ */
+
+import { describe, it, expect } from 'vitest';
+import {
+  getTokenReferences,
+  getLayoutReferences,
+  collectTokenReferences,
+  type IndexedLayoutToken,
+} from '../src/layout-token-index.js';
+import { getAllShellTokens } from '../src/layout-tokens/shells.js';
+import { getAllMobileShellTokens } from '../src/layout-tokens/mobile-shells.js';
+import { getAllPageLayoutTokens } from '../src/layout-tokens/pages.js';
+import { getAllSectionPatternTokens } from '../src/layout-tokens/sections.js';
+
+// ============================================================================
+// Baseline (full traversal, as the resolvers did before the index)
+// ============================================================================
+
+function traverseReferences(obj: unknown): Set<string> {
+  const refs = new Set<string>();
+
+  function traverse(value: unknown): void {
+    if (typeof value === 'string' && /^[a-z]+\.[a-z-]+(\.[a-z0-9-]+)*$/.test(value)) {
+      refs.add(value);
+    } else if (typeof value === 'object' && value !== null) {
+      for (const prop of Object.values(value)) {
+        traverse(prop);
+      }
+    }
+  }
+
+  traverse(obj);
+  return refs;
+}
+
+const ALL_TOKENS: IndexedLayoutToken[] = [
+  ...getAllShellTokens(),
+  ...getAllMobileShellTokens(),
+  ...getAllPageLayoutTokens(),
+  ...getAllSectionPatternTokens(),
+];
+
+// ============================================================================
+// Correctness
+// ============================================================================
+
+describe('Layout Token Index', () => {
+  it('should match a full traversal for every built-in layout', () => {
+    for (const token of ALL_TOKENS) {
+      const entry = getLayoutReferences(token.id);
+
+      expect(entry, token.id).toBeDefined();
+      expect([...entry!.refs]).toEqual([...traverseReferences(token)]);
+      for (const [cssVar, ref] of Object.entries(entry!.cssVariables)) {
+        expect(cssVar).toBe(`--${ref.replace(/\./g, '-')}`);
+      }
+    }
+  });
+
+  it('should memoize references per token object', () => {
+    const [section] = getAllSectionPatternTokens();
+
+    expect(getTokenReferences(section!)).toBe(getTokenReferences(section!));
+  });
+
+  it('should compile custom tokens on demand', () => {
+    const [section] = getAllSectionPatternTokens();
+    const custom = { ...section!, css: { ...section!.css, gap: 'atomic.spacing.99' } };
+
+    expect(getTokenReferences(custom).refs.has('atomic.spacing.99')).toBe(true);
+    expect(getLayoutReferences(custom.id)!.refs.has('atomic.spacing.99')).toBe(false);
+  });
+
+  it('should union references in order', () => {
+    const [page] = getAllPageLayoutTokens();
+    const sections = getAllSectionPatternTokens().slice(0, 3);
+
+    expect([...collectTokenReferences([page!, ...sections])]).toEqual([
+      ...traverseReferences({ page, sections }),
+    ]);
+  });
+
+  it('should return undefined for unknown layouts', () => {
+    expect(getLayoutReferences('section.missing')).toBeUndefined();
+  });
+});
@@ -0,0 +1,180 @@
+/**
+ * @tekton/core - Theme Registry Tests
+ * Memoized theme loading, invalidation and derived data
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { mkdtempSync, rmSync, writeFileSync, utimesSync } from 'node:fs';
+import { tmpdir } from 'node:os';
+import { join } from 'node:path';
+import { ThemeRegistry, getThemeTokenLookup } from '../src/theme-registry.js';
+import { resolveTokenRef, type ThemeV2 } from '../src/theme-v2.js';
+
+function makeTheme(id: string, name = 'Test Theme'): ThemeV2 {
+  return {
+    id,
+    name,
+    schemaVersion: '2.1',
+    brandTone: 'minimal',
+    tokens: {
+      atomic: {
+        color: { brand: { '500': { l: 0.5, c: 0.15, h: 220 } } },
+        spacing: { '4': '16px' },
+        radius: { md: '8px' },
+      },
+      semantic: {
+        background: { canvas: 'atomic.color.brand.500' },
+      },
+    },
+    stateLayer: {},
+    motion: {},
+    elevation: { level: { '1': '0 1px 2px rgba(0,0,0,0.1)' } },
+    border: {},
+    typography: {},
+    density: {},
+  };
+}
+
+describe('ThemeRegistry', () => {
+  let themesDir: string;
+
+  const writeTheme = (theme: ThemeV2) =>
+    writeFileSync(join(themesDir, `${theme.id}.json`), JSON.stringify(theme));
+
+  beforeEach(() => {
+    themesDir = mkdtempSync(join(tmpdir(), 'tekton-themes-'));
+    writeTheme(makeTheme('theme-a', 'Theme A'));
+    writeTheme(makeTheme('theme-b', 'Theme B'));
+  });
+
+  afterEach(() => {
+    rmSync(themesDir, { recursive: true, force: true });
+  });
+
+  describe('get', () => {
+    it('should parse a theme once and serve repeats from memory', () => {
+      const registry = new ThemeRegistry({ themesDir });
+
+      const first = registry.get('theme-a');
+      const second = registry.get('theme-a');
+
+      expect(first?.name).toBe('Theme A');
+      expect(second).toBe(first);
+      expect(registry.getStats()).toMatchObject({ hits: 1, misses: 1, requests: 2 });
+    });
+
+    it('should return null for missing or invalid themes', () => {
+      const registry = new ThemeRegistry({ themesDir });
+
+      expect(registry.get('missing')).toBeNull();
+      expect(registry.get('../theme-a')).toBeNull();
+      expect(registry.get('')).toBeNull();
+    });
+
+    it('should reject themes with the wrong schema version', () => {
+      writeFileSync(
+        join(themesDir, 'legacy.json'),
+        JSON.stringify({ ...makeTheme('legacy'), schemaVersion: '1.0' })
+      );
+      const registry = new ThemeRegistry({ themesDir });
+
+      expect(registry.get('legacy')).toBeNull();
+    });
+
+    it('should reload a theme when the file changes', () => {
+      const registry = new ThemeRegistry({ themesDir });
+      expect(registry.get('theme-a')?.name).toBe('Theme A');
+
+      writeTheme(makeTheme('theme-a', 'Theme A (edited)'));
+      const future = new Date(Date.now() + 5000);
+      utimesSync(join(themesDir, 'theme-a.json'), future, future);
+
+      expect(registry.get('theme-a')?.name).toBe('Theme A (edited)');
+      expect(registry.getStats().reloads).toBe(1);
+    });
+
+    it('should drop a theme when the file is removed', () => {
+      const registry = new ThemeRegistry({ themesDir });
+      registry.get('theme-a');
+
+      rmSync(join(themesDir, 'theme-a.json'));
+
+      expect(registry.get('theme-a')).toBeNull();
+    });
+  });
+
+  describe('eviction', () => {
+    it('should keep at most maxEntries themes', () => {
+      const registry = new ThemeRegistry({ themesDir, maxEntries: 1 });
+
+      registry.get('theme-a');
+      registry.get('theme-b');
+
+      expect(registry.getStats()).toMatchObject({ size: 1, evictions: 1 });
+    });
+
+    it('should invalidate on demand', () => {
+      const registry = new ThemeRegistry({ themesDir });
+      registry.get('theme-a');
+
+      registry.invalidate('theme-a');
+      registry.get('theme-a');
+
+      expect(registry.getStats().misses).toBe(2);
+    });
+  });
+
+  describe('list', () => {
+    it('should list all valid themes', () => {
+      const registry = new ThemeRegistry({ themesDir });
+
+      const ids = registry
+        .list()
+        .map(t => t.id)
+        .sort();
+
+      expect(ids).toEqual(['theme-a', 'theme-b']);
+    });
+
+    it('should report existence without parsing', () => {
+      const registry = new ThemeRegistry({ themesDir });
+
+      expect(registry.has('theme-a')).toBe(true);
+      expect(registry.has('missing')).toBe(false);
+      expect(registry.getStats()).toMatchObject({ requests: 2, hits: 0, misses: 0 });
+    });
+  });
+
+  describe('derived data', () => {
+    it('should precompute token lookups matching resolveTokenRef', () => {
+      const registry = new ThemeRegistry({ themesDir });
+      const compiled = registry.getCompiled('theme-a')!;
+      const plain = makeTheme('theme-a', 'Theme A');
+
+      for (const ref of [
+        'atomic.color.brand.500',
+        'atomic.spacing.4',
+        'semantic.background.canvas',
+        'elevation.level.1',
+        'tokens.atomic.radius.md',
+        'atomic.color.brand',
+        'atomic.missing.value',
+      ]) {
+        expect(resolveTokenRef(ref, compiled.theme)).toBe(resolveTokenRef(ref, plain));
+      }
+      expect(getThemeTokenLookup(compiled.theme)).toBe(compiled.tokenLookup);
+    });
+
+    it('should build CSS variables for token layers', () => {
+      const registry = new ThemeRegistry({ themesDir });
+      const { cssVariables } = registry.getCompiled('theme-a')!;
+
+      expect(cssVariables['--atomic-spacing-4']).toBe('16px');
+      expect(cssVariables['--atomic-color-brand-500']).toBe('oklch(0.5 0.15 220)');
+      expect(cssVariables['--semantic-background-canvas']).toBe('var(--atomic-color-brand-500)');
+      for (const value of Object.values(cssVariables)) {
+        expect(value).not.toMatch(/^(atomic|semantic|component)\./);
+      }
+    });
+  });
+});
@@ -0,0 +1,103 @@
+/**
+ * @tekton/core - Worker Pool Tests
+ * Job dispatch, failure handling and shutdown
+ */
+
+import { describe, it, expect, beforeAll, afterAll, afterEach } from 'vitest';
+import { mkdtempSync, rmSync, writeFileSync } from 'node:fs';
+import { tmpdir } from 'node:os';
+import { join } from 'node:path';
+import { pathToFileURL } from 'node:url';
+import { WorkerPool } from '../src/worker-pool.js';
+
+type Job = { value: number; mode?: 'throw' | 'bad-id' | 'exit' | 'slow' };
+
+// Plain ESM worker speaking the WorkerPoolRequest/WorkerPoolResponse protocol
+const WORKER_SOURCE = `
+import { parentPort } from 'node:worker_threads';
+parentPort.on('message', ({ id, job }) => {
+  if (job.mode === 'exit') process.exit(3);
+  if (job.mode === 'throw') return parentPort.postMessage({ id, error: 'job failed' });
+  if (job.mode === 'bad-id') return parentPort.postMessage({ id: id + 1000, result: 0 });
+  const reply = () => parentPort.postMessage({ id, result: job.value * 2 });
+  if (job.mode === 'slow') setTimeout(reply, 200); else reply();
+});
+`;
+
+describe('WorkerPool', () => {
+  let dir: string;
+  let workerUrl: URL;
+  let pool: WorkerPool<Job, number>;
+
+  beforeAll(() => {
+    dir = mkdtempSync(join(tmpdir(), 'tekton-worker-pool-'));
+    writeFileSync(join(dir, 'worker.mjs'), WORKER_SOURCE);
+    writeFileSync(join(dir, 'broken.mjs'), `throw new Error('cannot load');`);
+    workerUrl = pathToFileURL(join(dir, 'worker.mjs'));
+  });
+
+  afterAll(() => {
+    rmSync(dir, { recursive: true, force: true });
+  });
+
+  afterEach(async () => {
+    await pool.terminate();
+  });
+
+  it('should run jobs on workers and return results in order', async () => {
+    pool = new WorkerPool(workerUrl, { size: 2 });
+
+    const results = await Promise.all([1, 2, 3, 4, 5].map(value => pool.run({ value })));
+
+    expect(results).toEqual([2, 4, 6, 8, 10]);
+    expect(pool.stats()).toMatchObject({ size: 2, workers: 2, busy: 0, queued: 0 });
+  });
+
+  it('should reject only the job whose handler failed', async () => {
+    pool = new WorkerPool(workerUrl, { size: 1 });
+
+    await Promise.all([
+      expect(pool.run({ value: 1, mode: 'throw' })).rejects.toThrow('job failed'),
+      expect(pool.run({ value: 2 })).resolves.toBe(4),
+    ]);
+  });
+
+  it('should reject a job answered with an unknown id and keep serving', async () => {
+    pool = new WorkerPool(workerUrl, { size: 1, name: 'Test pool' });
+
+    await expect(pool.run({ value: 1, mode: 'bad-id' })).rejects.toThrow(
+      'Test pool: unexpected response id'
+    );
+    await expect(pool.run({ value: 3 })).resolves.toBe(6);
+  });
+
+  it('should reject the running job when its worker exits and replace the worker', async () => {
+    pool = new WorkerPool(workerUrl, { size: 1 });
+    await pool.run({ value: 1 });
+
+    await expect(pool.run({ value: 1, mode: 'exit' })).rejects.toThrow('exited with code 3');
+    await expect(pool.run({ value: 5 })).resolves.toBe(10);
+  });
+
+  it('should reject queued jobs when the worker script fails to load', async () => {
+    pool = new WorkerPool(pathToFileURL(join(dir, 'broken.mjs')), { size: 1 });
+
+    await Promise.all([
+      expect(pool.run({ value: 1 })).rejects.toThrow('cannot load'),
+      expect(pool.run({ value: 2 })).rejects.toThrow('cannot load'),
+    ]);
+    expect(pool.stats()).toMatchObject({ workers: 0, busy: 0, queued: 0 });
+  });
+
+  it('should reject running and queued jobs on terminate', async () => {
+    pool = new WorkerPool(workerUrl, { size: 1, name: 'Test pool' });
+
+    const rejections = Promise.all([
+      expect(pool.run({ value: 1, mode: 'slow' })).rejects.toThrow('Test pool terminated'),
+      expect(pool.run({ value: 2 })).rejects.toThrow('Test pool terminated'),
+    ]);
+    await pool.terminate();
+
+    await rejections;
+  });
+});
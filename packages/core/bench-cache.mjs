@@ -0,0 +1,84 @@
+#!/usr/bin/env node
+/**
+ * Resolver Cache Benchmark
+ *
+ * Resolves 50k unique synthetic screens and reports throughput, cache
+ * statistics and heap usage at 10k intervals. Memory should stay flat once
+ * the caches are full; the script exits with code 1 if the heap grows more
+ * than 64MB after the first checkpoint. Requires a build (`pnpm build`).
+ *
+ * Usage: node --expose-gc bench-cache.mjs [count]
+ *   node --expose-gc bench-cache.mjs          # 50000 screens
+ *   node --expose-gc bench-cache.mjs 200000   # custom count
+ */
+
+import { clearAllCaches, getCacheStats, resetCacheStats, resolveScreen } from './dist/index.js';
+
+const SCREEN_COUNT = Number(process.argv[2]) || 50_000;
+const CHECKPOINT = 10_000;
+const MAX_GROWTH_MB = 64;
+const SHELLS = ['shell.web.dashboard', 'shell.web.app', 'shell.web.minimal'];
+const PAGES = ['page.dashboard', 'page.detail', 'page.settings'];
+const PATTERNS = ['section.grid-4', 'section.grid-3', 'section.container'];
+
+function makeScreen(i) {
+  return {
+    id: `stress-screen-${i}`,
+    name: `Stress Screen ${i}`,
+    shell: SHELLS[i % SHELLS.length],
+    page: PAGES[i % PAGES.length],
+    themeId: 'default',
+    sections: [
+      {
+        id: 'main',
+        pattern: PATTERNS[i % PATTERNS.length],
+        components: [
+          { type: 'Heading', props: { level: 1, children: `Title ${i}` } },
+          { type: 'Button', props: { variant: i % 2 ? 'primary' : 'secondary', children: 'Save' } },
+        ],
+      },
+    ],
+  };
+}
+
+function heapMB() {
+  globalThis.gc?.();
+  return process.memoryUsage().heapUsed / 1024 / 1024;
+}
+
+if (!globalThis.gc) {
+  console.log('Run with --expose-gc for stable heap numbers');
+}
+
+clearAllCaches();
+resetCacheStats();
+
+const checkpoints = [];
+const start = performance.now();
+
+for (let i = 0; i < SCREEN_COUNT; i++) {
+  resolveScreen(makeScreen(i));
+  if ((i + 1) % CHECKPOINT === 0) {
+    checkpoints.push(heapMB());
+  }
+}
+
+const duration = performance.now() - start;
+
+console.log(
+  `Resolved ${SCREEN_COUNT} screens in ${duration.toFixed(0)}ms ` +
+    `(${Math.round(SCREEN_COUNT / (duration / 1000))} screens/s)`
+);
+console.log(`Heap at ${CHECKPOINT} intervals: ${checkpoints.map(mb => `${mb.toFixed(1)}MB`).join(', ')}`);
+for (const s of getCacheStats()) {
+  console.log(
+    `  ${s.name.padEnd(22)} size ${s.size}/${s.maxEntries}  hits ${s.hits}  ` +
+      `misses ${s.misses}  evictions ${s.evictions}`
+  );
+}
+
+const growth = checkpoints.length > 1 ? checkpoints[checkpoints.length - 1] - checkpoints[0] : 0;
+if (growth >= MAX_GROWTH_MB) {
+  console.log(`Heap grew ${growth.toFixed(1)}MB after the first checkpoint (limit ${MAX_GROWTH_MB}MB)`);
+  process.exitCode = 1;
+}
@@ -0,0 +1,117 @@
+#!/usr/bin/env node
+/**
+ * Layout CSS Benchmark
+ *
+ * Reports throughput (MB/s) and peak heap growth for the built-in layout
+ * stylesheet: the previous concatenate-then-formatCSS/validateCSS pipeline
+ * (reproduced with the unformatted generate* helpers), generateAllLayoutCSS,
+ * streaming through emitAllLayoutCSS, and getPrebuiltLayoutCSS. All paths
+ * are checked for byte-identical output first; the script exits with code 1
+ * if they differ. Requires a build (`pnpm build`).
+ *
+ * Usage: node --expose-gc bench-layout-css.mjs [iterations]
+ *   node --expose-gc bench-layout-css.mjs        # 500 passes
+ *   node --expose-gc bench-layout-css.mjs 5000   # custom count
+ */
+
+import {
+  emitAllLayoutCSS,
+  formatCSS,
+  generateAllLayoutCSS,
+  generateLayoutCSSVariables,
+  generateMediaQueries,
+  generatePageClasses,
+  generateSectionClasses,
+  generateShellClasses,
+  getAllPageLayoutTokens,
+  getAllSectionPatternTokens,
+  getAllShellTokens,
+  getPrebuiltLayoutCSS,
+  validateCSS,
+} from './dist/index.js';
+
+const ITERATIONS = Number(process.argv[2]) || 500;
+
+/**
+ * Previous generateAllLayoutCSS: build unformatted CSS, then re-parse it
+ */
+function baselineGenerateAllLayoutCSS() {
+  const shells = getAllShellTokens();
+  const pages = getAllPageLayoutTokens();
+  const sections = getAllSectionPatternTokens();
+  const tokens = [...shells, ...pages, ...sections];
+
+  const css =
+    generateLayoutCSSVariables(tokens) +
+    '\n' +
+    generateShellClasses(shells) +
+    generatePageClasses(pages) +
+    generateSectionClasses(sections) +
+    generateMediaQueries(tokens);
+
+  const formatted = formatCSS(css);
+  if (!validateCSS(formatted)) {
+    throw new Error('Generated CSS has unbalanced braces');
+  }
+  return formatted;
+}
+
+function streamAllLayoutCSS(onChunk) {
+  let bytes = 0;
+  for (const chunk of emitAllLayoutCSS()) {
+    bytes += chunk.length;
+    onChunk();
+  }
+  return bytes;
+}
+
+const expected = baselineGenerateAllLayoutCSS();
+if (
+  generateAllLayoutCSS() !== expected ||
+  Array.from(emitAllLayoutCSS()).join('') !== expected ||
+  getPrebuiltLayoutCSS().css !== expected
+) {
+  console.log('Output differs from the formatCSS baseline');
+  process.exit(1);
+}
+
+if (!globalThis.gc) {
+  console.log('Run with --expose-gc for stable heap numbers');
+}
+
+/**
+ * Time a pass, then repeat it sampling the heap (sampling is kept out of
+ * the timed loop)
+ */
+function measure(label, run) {
+  let bytes = 0;
+  const start = performance.now();
+  for (let i = 0; i < ITERATIONS; i++) {
+    bytes += run(() => {});
+  }
+  const ms = performance.now() - start;
+
+  globalThis.gc?.();
+  const baseHeap = process.memoryUsage().heapUsed;
+  let peakHeap = baseHeap;
+  const sample = () => {
+    peakHeap = Math.max(peakHeap, process.memoryUsage().heapUsed);
+  };
+  for (let i = 0; i < ITERATIONS; i++) {
+    run(sample);
+    sample();
+  }
+
+  console.log(
+    `  ${label.padEnd(22)} ${(bytes / (ms / 1000) / 1024 / 1024).toFixed(1).padStart(8)} MB/s  ` +
+      `${(ms / ITERATIONS).toFixed(3)}ms/pass  ` +
+      `peak heap +${((peakHeap - baseHeap) / 1024 / 1024).toFixed(1)}MB`
+  );
+}
+
+console.log(`Built-in layout stylesheet: ${expected.length} bytes, ${ITERATIONS} passes`);
+
+measure('formatCSS baseline', () => baselineGenerateAllLayoutCSS().length);
+measure('generateAllLayoutCSS', () => generateAllLayoutCSS().length);
+measure('emitAllLayoutCSS', streamAllLayoutCSS);
+measure('getPrebuiltLayoutCSS', () => getPrebuiltLayoutCSS().css.length);
@@ -0,0 +1,168 @@
+#!/usr/bin/env node
+/**
+ * Layout Token Index Benchmark
+ *
+ * Times uncached resolveLayout and generateAllLayoutCSS over all built-in
+ * layouts with the precompiled token index, against the previous path that
+ * re-traversed every token object (extractTokenReferences /
+ * extractCSSVariables / generateLayoutCSSVariables, reproduced below).
+ * Both paths are checked for identical output first; the script exits with
+ * code 1 if they differ. Requires a build (`pnpm build`).
+ *
+ * Usage: node bench-layout-index.mjs [iterations]
+ *   node bench-layout-index.mjs         # 2000 passes
+ *   node bench-layout-index.mjs 10000   # custom count
+ */
+
+import { isDeepStrictEqual } from 'node:util';
+import {
+  clearLayoutCache,
+  emitLayoutCSS,
+  generateAllLayoutCSS,
+  getAllPageLayoutTokens,
+  getAllSectionPatternTokens,
+  getAllShellTokens,
+  getPageLayoutToken,
+  getSectionPatternToken,
+  getShellToken,
+  resolveLayout,
+} from './dist/index.js';
+
+const ITERATIONS = Number(process.argv[2]) || 2000;
+const TOKEN_REFERENCE_PATTERN = /^[a-z]+\.[a-z-]+(\.[a-z0-9-]+)*$/;
+
+// ============================================================================
+// Baseline (full traversal, as before the index)
+// ============================================================================
+
+function resolveTokenReference(ref) {
+  return `--${ref.replace(/\./g, '-')}`;
+}
+
+function traverseStrings(obj, visit) {
+  if (typeof obj === 'string') {
+    if (TOKEN_REFERENCE_PATTERN.test(obj)) {
+      visit(obj);
+    }
+  } else if (typeof obj === 'object' && obj !== null) {
+    for (const value of Object.values(obj)) {
+      traverseStrings(value, visit);
+    }
+  }
+}
+
+function extractTokenReferences(obj) {
+  const refs = new Set();
+  traverseStrings(obj, ref => refs.add(ref));
+  return refs;
+}
+
+function extractCSSVariables(obj) {
+  const vars = new Set();
+  traverseStrings(obj, ref => vars.add(resolveTokenReference(ref)));
+  return vars;
+}
+
+function generateLayoutCSSVariables(refs) {
+  const cssVariables = {};
+  for (const ref of refs) {
+    cssVariables[resolveTokenReference(ref)] = ref;
+  }
+  return cssVariables;
+}
+
+function baselineResolveLayout(layoutId) {
+  if (layoutId.startsWith('shell.')) {
+    const shell = getShellToken(layoutId);
+    const cssVariables = generateLayoutCSSVariables(extractTokenReferences(shell));
+    return { shell, sections: [], responsive: shell.responsive, cssVariables };
+  }
+  if (layoutId.startsWith('page.')) {
+    const page = getPageLayoutToken(layoutId);
+    const sections = page.sections.map(slot => getSectionPatternToken(slot.pattern));
+    const cssVariables = generateLayoutCSSVariables(extractTokenReferences({ page, sections }));
+    return { page, sections, responsive: page.responsive, cssVariables };
+  }
+  const section = getSectionPatternToken(layoutId);
+  const cssVariables = generateLayoutCSSVariables(extractTokenReferences(section));
+  return { sections: [section], responsive: section.responsive, cssVariables };
+}
+
+function baselineVariablesCSS(tokens) {
+  const vars = new Set();
+  for (const token of tokens) {
+    extractCSSVariables(token).forEach(v => vars.add(v));
+  }
+
+  let css = ':root {\n';
+  for (const cssVar of Array.from(vars).sort()) {
+    css += `  ${cssVar}: ${cssVar.replace(/^--/, '').replace(/-/g, '.')};\n`;
+  }
+  return `${css}}\n`;
+}
+
+/**
+ * generateAllLayoutCSS with the :root block built by traversal
+ * Classes and media queries do not use token references.
+ */
+function baselineGenerateAllLayoutCSS() {
+  const tokens = [
+    ...getAllShellTokens(),
+    ...getAllPageLayoutTokens(),
+    ...getAllSectionPatternTokens(),
+  ];
+  const rest = emitLayoutCSS(tokens, { includeVariables: false });
+  return baselineVariablesCSS(tokens) + Array.from(rest).join('');
+}
+
+// ============================================================================
+// Benchmark
+// ============================================================================
+
+const layoutIds = [
+  ...getAllShellTokens(),
+  ...getAllPageLayoutTokens(),
+  ...getAllSectionPatternTokens(),
+].map(token => token.id);
+
+clearLayoutCache();
+const mismatch = layoutIds.find(
+  id => !isDeepStrictEqual(baselineResolveLayout(id).cssVariables, resolveLayout(id).cssVariables)
+);
+if (mismatch || baselineGenerateAllLayoutCSS() !== generateAllLayoutCSS()) {
+  console.log(`Output differs from the traversal baseline${mismatch ? ` (${mismatch})` : ''}`);
+  process.exit(1);
+}
+
+function time(fn) {
+  fn();
+  const start = performance.now();
+  for (let i = 0; i < ITERATIONS; i++) {
+    fn();
+  }
+  return (performance.now() - start) / ITERATIONS;
+}
+
+function report(label, baselineMs, indexedMs) {
+  console.log(
+    `  ${label.padEnd(22)} traversal ${baselineMs.toFixed(3)}ms  index ${indexedMs.toFixed(3)}ms  ` +
+      `(${(baselineMs / indexedMs).toFixed(2)}x)`
+  );
+}
+
+console.log(`${layoutIds.length} built-in layouts, ${ITERATIONS} passes (time per pass)`);
+
+report(
+  'resolve (uncached)',
+  time(() => layoutIds.forEach(baselineResolveLayout)),
+  time(() => {
+    clearLayoutCache();
+    layoutIds.forEach(resolveLayout);
+  })
+);
+
+report(
+  'generateAllLayoutCSS',
+  time(baselineGenerateAllLayoutCSS),
+  time(() => generateAllLayoutCSS())
+);
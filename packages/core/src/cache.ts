@@ -0,0 +1,336 @@
+/**
+ * @tekton/core - Bounded Cache
+ * Shared LRU cache subsystem for resolvers with size limits and statistics
+ * [SPEC-LAYOUT-002] [PHASE-2]
+ */
+
+// ============================================================================
+// Types
+// ============================================================================
+
+/**
+ * Cache limits
+ * An entry is evicted (least recently used first) as soon as either
+ * limit is exceeded. Byte limits require a sizeOf estimator.
+ */
+export interface CacheLimits {
+  /** Maximum number of entries (default: 1000) */
+  maxEntries?: number;
+
+  /** Maximum estimated bytes (default: unlimited) */
+  maxBytes?: number;
+}
+
+/**
+ * Cache construction options
+ */
+export interface CacheOptions<K, V> extends CacheLimits {
+  /** Estimate the retained size of an entry in bytes */
+  sizeOf?: (key: K, value: V) => number;
+}
+
+/**
+ * Cache statistics snapshot
+ */
+export interface CacheStats {
+  /** Cache name (e.g., "screen", "binding", "layout") */
+  name: string;
+
+  /** Successful lookups */
+  hits: number;
+
+  /** Failed lookups */
+  misses: number;
+
+  /** Entries removed to stay within limits */
+  evictions: number;
+
+  /** hits / (hits + misses) */
+  hitRate: number;
+
+  /** Current entry count */
+  size: number;
+
+  /** Current estimated bytes (0 without sizeOf) */
+  bytes: number;
+
+  /** Configured entry limit */
+  maxEntries: number;
+
+  /** Configured byte limit (Infinity when unlimited) */
+  maxBytes: number;
+}
+
+const DEFAULT_MAX_ENTRIES = 1000;
+
+// ============================================================================
+// Bounded Cache
+// ============================================================================
+
+/**
+ * LRU cache with entry and byte limits
+ * Relies on Map insertion order: the first key is always the least recently used.
+ *
+ * @example
+ * ```typescript
+ * const cache = new BoundedCache<string, string>('binding', { maxEntries: 100 });
+ * cache.set('a', 'var(--a)');
+ * cache.get('a'); // 'var(--a)'
+ * cache.stats(); // { name: 'binding', hits: 1, misses: 0, ... }
+ * ```
+ */
+export class BoundedCache<K, V> {
+  readonly name: string;
+  private readonly entries = new Map<K, { value: V; bytes: number }>();
+  private readonly sizeOf?: (key: K, value: V) => number;
+  private maxEntries: number;
+  private maxBytes: number;
+  private bytes = 0;
+  private hits = 0;
+  private misses = 0;
+  private evictions = 0;
+
+  constructor(name: string, options: CacheOptions<K, V> = {}) {
+    this.name = name;
+    this.sizeOf = options.sizeOf;
+    this.maxEntries = options.maxEntries ?? DEFAULT_MAX_ENTRIES;
+    this.maxBytes = options.maxBytes ?? Infinity;
+  }
+
+  /**
+   * Get a cached value and mark it as recently used
+   */
+  get(key: K): V | undefined {
+    const entry = this.entries.get(key);
+    if (entry === undefined) {
+      this.misses++;
+      return undefined;
+    }
+
+    this.hits++;
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  /**
+   * Check for a key without affecting LRU order or statistics
+   */
+  has(key: K): boolean {
+    return this.entries.has(key);
+  }
+
+  /**
+   * Store a value, evicting least recently used entries beyond the limits
+   */
+  set(key: K, value: V): void {
+    if (this.maxEntries <= 0) {
+      return;
+    }
+
+    this.delete(key);
+
+    const bytes = this.sizeOf ? this.sizeOf(key, value) : 0;
+    if (bytes > this.maxBytes) {
+      // Larger than the whole cache: don't flush everything for it
+      return;
+    }
+
+    this.entries.set(key, { value, bytes });
+    this.bytes += bytes;
+    this.evict();
+  }
+
+  delete(key: K): boolean {
+    const entry = this.entries.get(key);
+    if (entry === undefined) {
+      return false;
+    }
+    this.entries.delete(key);
+    this.bytes -= entry.bytes;
+    return true;
+  }
+
+  /**
+   * Remove all entries (statistics are kept)
+   */
+  clear(): void {
+    this.entries.clear();
+    this.bytes = 0;
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  /**
+   * Update limits, evicting immediately if the cache is over them
+   */
+  configure(limits: CacheLimits): void {
+    if (limits.maxEntries !== undefined) {
+      this.maxEntries = limits.maxEntries;
+    }
+    if (limits.maxBytes !== undefined) {
+      this.maxBytes = limits.maxBytes;
+    }
+    if (this.maxEntries <= 0) {
+      this.clear();
+    }
+    this.evict();
+  }
+
+  stats(): CacheStats {
+    const lookups = this.hits + this.misses;
+    return {
+      name: this.name,
+      hits: this.hits,
+      misses: this.misses,
+      evictions: this.evictions,
+      hitRate: lookups === 0 ? 0 : this.hits / lookups,
+      size: this.entries.size,
+      bytes: this.bytes,
+      maxEntries: this.maxEntries,
+      maxBytes: this.maxBytes,
+    };
+  }
+
+  resetStats(): void {
+    this.hits = 0;
+    this.misses = 0;
+    this.evictions = 0;
+  }
+
+  private evict(): void {
+    while (this.entries.size > this.maxEntries || this.bytes > this.maxBytes) {
+      const oldest = this.entries.keys().next();
+      if (oldest.done) {
+        break;
+      }
+      this.delete(oldest.value);
+      this.evictions++;
+    }
+  }
+}
+
+// ============================================================================
+// Cache Registry
+// ============================================================================
+
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+const caches = new Map<string, BoundedCache<any, any>>();
+
+/**
+ * Create a named cache registered for statistics and configuration
+ *
+ * @param name - Unique cache name
+ * @param options - Limits and optional byte estimator
+ */
+export function createCache<K, V>(name: string, options: CacheOptions<K, V> = {}): BoundedCache<K, V> {
+  if (caches.has(name)) {
+    throw new Error(`Cache '${name}' is already registered`);
+  }
+  const cache = new BoundedCache<K, V>(name, options);
+  caches.set(name, cache);
+  return cache;
+}
+
+/**
+ * Get statistics for all registered caches
+ *
+ * @example
+ * ```typescript
+ * getCacheStats();
+ * // [{ name: 'screen', hits: 120, misses: 8, evictions: 0, ... }, ...]
+ * ```
+ */
+export function getCacheStats(): CacheStats[] {
+  return [...caches.values()].map(cache => cache.stats());
+}
+
+/**
+ * Change limits of a registered cache
+ *
+ * @param name - Cache name
+ * @param limits - New entry and/or byte limits
+ * @throws Error if the cache is not registered
+ */
+export function configureCache(name: string, limits: CacheLimits): void {
+  const cache = caches.get(name);
+  if (!cache) {
+    throw new Error(
+      `Unknown cache '${name}'. Available caches: ${[...caches.keys()].join(', ')}`
+    );
+  }
+  cache.configure(limits);
+}
+
+/**
+ * Clear every registered cache
+ */
+export function clearAllCaches(): void {
+  for (const cache of caches.values()) {
+    cache.clear();
+  }
+}
+
+/**
+ * Reset hit/miss/eviction counters of every registered cache
+ */
+export function resetCacheStats(): void {
+  for (const cache of caches.values()) {
+    cache.resetStats();
+  }
+}
+
+// ============================================================================
+// Size Estimation
+// ============================================================================
+
+/**
+ * Estimate bytes retained by a string key/value pair (UTF-16)
+ */
+export function stringEntryBytes(key: string, value: string): number {
+  return (key.length + value.length) * 2;
+}
+
+// ============================================================================
+// Structural Keys
+// ============================================================================
+
+/**
+ * Build a cache key for a props record
+ * Flat records of primitives (the common case) are keyed without JSON
+ * serialization; records with nested values fall back to JSON.stringify.
+ *
+ * @example
+ * ```typescript
+ * propsKey({ variant: 'primary', size: 'md' }) === propsKey({ variant: 'primary', size: 'md' });
+ * ```
+ */
+export function propsKey(props: Record<string, unknown> | undefined): string {
+  if (!props) {
+    return '';
+  }
+
+  let key = '';
+  for (const name of Object.keys(props)) {
+    const value = props[name];
+    switch (typeof value) {
+      case 'string':
+        key += `${name}\u0001s${value}\u0000`;
+        break;
+      case 'number':
+        key += `${name}\u0001n${value}\u0000`;
+        break;
+      case 'boolean':
+        key += `${name}\u0001b${value}\u0000`;
+        break;
+      case 'undefined':
+        // Omitted, matching JSON.stringify
+        break;
+      default:
+        return `json:${JSON.stringify(props)}`;
+    }
+  }
+  return key;
+}
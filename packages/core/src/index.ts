@@ -57,6 +57,41 @@ export {
   type BuiltinThemeId,
 } from './theme.js';
 
+// Theme Registry (memoized theme loading)
+export {
+  ThemeRegistry,
+  getThemeRegistry,
+  configureThemeRegistry,
+  getThemeTokenLookup,
+  type CompiledTheme,
+  type ThemeRegistryOptions,
+  type ThemeRegistryStats,
+} from './theme-registry.js';
+
+// Worker Pool (worker_threads job pool)
+export {
+  WorkerPool,
+  defaultWorkerPoolSize,
+  serveWorkerJobs,
+  type WorkerPoolOptions,
+  type WorkerPoolRequest,
+  type WorkerPoolResponse,
+  type WorkerPoolStats,
+} from './worker-pool.js';
+
+// Resolver Caches (bounded LRU with statistics)
+export {
+  BoundedCache,
+  createCache,
+  getCacheStats,
+  configureCache,
+  clearAllCaches,
+  resetCacheStats,
+  type CacheLimits,
+  type CacheOptions,
+  type CacheStats,
+} from './cache.js';
+
 // Blueprint
 export {
   createBlueprint,
@@ -318,10 +353,22 @@ export {
   type ResolvedLayout,
 } from './layout-resolver.js';
 
+// Layout Token Index (precompiled token references)
+export {
+  getTokenReferences,
+  getLayoutReferences,
+  collectTokenReferences,
+  type IndexedLayoutToken,
+  type LayoutTokenReferences,
+} from './layout-token-index.js';
+
 // Layout CSS Generator (SPEC-LAYOUT-001 - PHASE-8)
 export {
   generateLayoutCSS,
   generateAllLayoutCSS,
+  emitLayoutCSS,
+  emitAllLayoutCSS,
+  getPrebuiltLayoutCSS,
   generateCSSVariables as generateLayoutCSSVariables,
   generateShellClasses,
   generatePageClasses,
@@ -331,6 +378,7 @@ export {
   validateCSS,
   type LayoutToken,
   type CSSGenerationOptions,
+  type PrebuiltLayoutCSS,
 } from './layout-css-generator.js';
 
 // Screen Generation (SPEC-LAYOUT-002 - PHASE-1 to PHASE-4)
@@ -4,6 +4,7 @@
  * [SPEC-LAYOUT-001] [PHASE-8]
  */
 
+import { createHash } from 'node:crypto';
 import type {
   ShellToken,
   PageLayoutToken,
@@ -18,6 +19,7 @@ import { resolveTokenReference } from './layout-resolver.js';
 import { getAllShellTokens } from './layout-tokens/shells.js';
 import { getAllPageLayoutTokens } from './layout-tokens/pages.js';
 import { getAllSectionPatternTokens } from './layout-tokens/sections.js';
+import { getTokenReferences } from './layout-token-index.js';
 import { BREAKPOINT_VALUES } from './layout-tokens/responsive.js';
 
 // ============================================================================
@@ -47,30 +49,6 @@ export interface CSSGenerationOptions {
 // Utility Functions
 // ============================================================================
 
-/**
- * Extract CSS variable references from token references in an object
- *
- * @param obj - Object to extract token references from
- * @returns Set of unique CSS variable names
- */
-function extractCSSVariables(obj: unknown): Set<string> {
-  const vars = new Set<string>();
-
-  function traverse(value: unknown): void {
-    if (typeof value === 'string' && /^[a-z]+\.[a-z-]+(\.[a-z0-9-]+)*$/.test(value)) {
-      // This is a token reference - convert to CSS variable
-      vars.add(resolveTokenReference(value));
-    } else if (typeof value === 'object' && value !== null) {
-      for (const prop of Object.values(value)) {
-        traverse(prop);
-      }
-    }
-  }
-
-  traverse(obj);
-  return vars;
-}
-
 /**
  * Convert token reference to CSS var() function call
  *
@@ -136,208 +114,290 @@ export function formatCSS(css: string, indent = '  '): string {
 }
 
 // ============================================================================
-// CSS Generation Functions
+// CSS Rules
 // ============================================================================
 
 /**
- * Generate CSS custom properties in :root from layout tokens
- *
- * @param tokens - Array of layout tokens
- * @returns CSS :root block with custom properties
+ * CSS rule in structured form
+ * Shared by the string generators and the streaming emitter, so rules are
+ * built once and indented while they are written out.
  */
-export function generateCSSVariables(tokens: LayoutToken[]): string {
+interface CSSRule {
+  selector: string;
+  /** Declarations without indentation; continuation lines follow a '\n' */
+  declarations: string[];
+}
+
+/**
+ * Media query block with its nested rules
+ */
+interface MediaBlock {
+  query: string;
+  rules: CSSRule[];
+}
+
+/**
+ * Build the :root rule with CSS custom properties for layout tokens
+ */
+function variablesRule(tokens: LayoutToken[]): CSSRule | null {
   const vars = new Set<string>();
 
-  // Extract all CSS variables from all tokens
+  // Collect precompiled CSS variables of all tokens
   for (const token of tokens) {
-    const tokenVars = extractCSSVariables(token);
-    tokenVars.forEach(v => vars.add(v));
+    for (const cssVar of Object.keys(getTokenReferences(token).cssVariables)) {
+      vars.add(cssVar);
+    }
   }
 
   if (vars.size === 0) {
-    return '';
+    return null;
   }
 
-  // Generate :root block
-  let css = ':root {\n';
-
   // Sort variables for consistent output
-  const sortedVars = Array.from(vars).sort();
-
-  for (const cssVar of sortedVars) {
+  const declarations: string[] = [];
+  for (const cssVar of Array.from(vars).sort()) {
     // Extract original token reference from CSS variable name
     // --atomic-spacing-16 → atomic.spacing.16
     const tokenRef = cssVar.replace(/^--/, '').replace(/-/g, '.');
-    css += `  ${cssVar}: ${tokenRef};\n`;
+    declarations.push(`${cssVar}: ${tokenRef};`);
   }
 
-  css += '}\n';
-
-  return css;
+  return { selector: ':root', declarations };
 }
 
 /**
- * Generate utility classes for shell tokens
- *
- * @param shells - Array of shell tokens
- * @returns CSS classes for shells
+ * Build the utility class rule for a shell token
  */
-export function generateShellClasses(shells: ShellToken[]): string {
-  let css = '';
-
-  for (const shell of shells) {
-    // Generate class name: .shell-{platform}-{name}
-    // shell.web.dashboard → .shell-web-dashboard
-    const className = shell.id.replace(/\./g, '-');
-
-    css += `.${className} {\n`;
-    css += `  display: grid;\n`;
-
-    // Generate grid template areas based on regions
-    const areas: string[] = [];
-    const positions = new Map<string, string[]>();
-
-    // Group regions by position
-    for (const region of shell.regions) {
-      const pos = region.position;
-      if (!positions.has(pos)) {
-        positions.set(pos, []);
-      }
-      positions.get(pos)!.push(region.name);
-    }
-
-    // Build grid template areas
-    // Example: "header header" "sidebar main"
-    if (positions.has('top')) {
-      const topRegions = positions.get('top')!;
-      areas.push(`"${topRegions.join(' ')}"`);
-    }
+function shellRule(shell: ShellToken): CSSRule {
+  // Generate class name: .shell-{platform}-{name}
+  // shell.web.dashboard → .shell-web-dashboard
+  const className = shell.id.replace(/\./g, '-');
+  const declarations = ['display: grid;'];
+
+  // Group regions by position
+  const positions = new Map<string, string[]>();
+  for (const region of shell.regions) {
+    const pos = region.position;
+    if (!positions.has(pos)) {
+      positions.set(pos, []);
+    }
+    positions.get(pos)!.push(region.name);
+  }
 
-    // Middle row with left, center, right
-    const middleRow: string[] = [];
-    if (positions.has('left')) {
-      middleRow.push(...positions.get('left')!);
-    }
-    if (positions.has('center')) {
-      middleRow.push(...positions.get('center')!);
-    }
-    if (positions.has('right')) {
-      middleRow.push(...positions.get('right')!);
-    }
-    if (middleRow.length > 0) {
-      areas.push(`"${middleRow.join(' ')}"`);
-    }
+  // Build grid template areas
+  // Example: "header header" "sidebar main"
+  const areas: string[] = [];
+  if (positions.has('top')) {
+    areas.push(`"${positions.get('top')!.join(' ')}"`);
+  }
 
-    if (positions.has('bottom')) {
-      const bottomRegions = positions.get('bottom')!;
-      areas.push(`"${bottomRegions.join(' ')}"`);
-    }
+  // Middle row with left, center, right
+  const middleRow: string[] = [];
+  if (positions.has('left')) {
+    middleRow.push(...positions.get('left')!);
+  }
+  if (positions.has('center')) {
+    middleRow.push(...positions.get('center')!);
+  }
+  if (positions.has('right')) {
+    middleRow.push(...positions.get('right')!);
+  }
+  if (middleRow.length > 0) {
+    areas.push(`"${middleRow.join(' ')}"`);
+  }
 
-    if (areas.length > 0) {
-      css += `  grid-template-areas:\n`;
-      for (const area of areas) {
-        css += `    ${area}\n`;
-      }
-    }
+  if (positions.has('bottom')) {
+    areas.push(`"${positions.get('bottom')!.join(' ')}"`);
+  }
 
-    css += `}\n\n`;
+  if (areas.length > 0) {
+    declarations.push(['grid-template-areas:', ...areas].join('\n'));
   }
 
-  return css;
+  return { selector: `.${className}`, declarations };
 }
 
 /**
- * Generate utility classes for page tokens
- *
- * @param pages - Array of page layout tokens
- * @returns CSS classes for pages
+ * Build the utility class rule for a page token
  */
-export function generatePageClasses(pages: PageLayoutToken[]): string {
-  let css = '';
-
-  for (const page of pages) {
-    // Generate class name: .page-{name}
-    // page.dashboard → .page-dashboard
-    const className = page.id.replace(/\./g, '-');
+function pageRule(page: PageLayoutToken): CSSRule {
+  // Generate class name: .page-{name}
+  // page.dashboard → .page-dashboard
+  const className = page.id.replace(/\./g, '-');
+  const declarations = ['display: flex;', 'flex-direction: column;'];
+
+  // Add gap if specified in tokenBindings
+  if (page.tokenBindings.sectionSpacing) {
+    declarations.push(`gap: ${tokenRefToVar(page.tokenBindings.sectionSpacing as string)};`);
+  }
 
-    css += `.${className} {\n`;
-    css += `  display: flex;\n`;
-    css += `  flex-direction: column;\n`;
+  return { selector: `.${className}`, declarations };
+}
 
-    // Add gap if specified in tokenBindings
-    if (page.tokenBindings.sectionSpacing) {
-      const gapVar = tokenRefToVar(page.tokenBindings.sectionSpacing as string);
-      css += `  gap: ${gapVar};\n`;
-    }
+/**
+ * Build declarations for section CSS (base or breakpoint override)
+ */
+function sectionDeclarations(sectionCSS: Partial<SectionCSS>): string[] {
+  const declarations: string[] = [];
 
-    css += `}\n\n`;
+  if (sectionCSS.display) {
+    declarations.push(`display: ${sectionCSS.display};`);
+  }
+  if (sectionCSS.gridTemplateColumns) {
+    declarations.push(`grid-template-columns: ${sectionCSS.gridTemplateColumns};`);
+  }
+  if (sectionCSS.gridTemplateRows) {
+    declarations.push(`grid-template-rows: ${sectionCSS.gridTemplateRows};`);
+  }
+  if (sectionCSS.gap) {
+    declarations.push(`gap: ${tokenRefToVar(sectionCSS.gap)};`);
+  }
+  if (sectionCSS.flexDirection) {
+    declarations.push(`flex-direction: ${sectionCSS.flexDirection};`);
+  }
+  if (sectionCSS.alignItems) {
+    declarations.push(`align-items: ${sectionCSS.alignItems};`);
+  }
+  if (sectionCSS.justifyContent) {
+    declarations.push(`justify-content: ${sectionCSS.justifyContent};`);
+  }
+  if (sectionCSS.maxWidth) {
+    declarations.push(`max-width: ${tokenRefToVar(sectionCSS.maxWidth)};`);
+  }
+  if (sectionCSS.padding) {
+    declarations.push(`padding: ${tokenRefToVar(sectionCSS.padding)};`);
   }
 
-  return css;
+  return declarations;
 }
 
 /**
- * Generate utility classes for section pattern tokens
- *
- * @param sections - Array of section pattern tokens
- * @returns CSS classes for sections
+ * Build the utility class rule for a section pattern token
  */
-export function generateSectionClasses(sections: SectionPatternToken[]): string {
-  let css = '';
-
-  for (const section of sections) {
-    // Generate class name: .section-{pattern}
-    // section.grid-3 → .section-grid-3
-    const className = section.id.replace(/\./g, '-');
+function sectionRule(section: SectionPatternToken): CSSRule {
+  // Generate class name: .section-{pattern}
+  // section.grid-3 → .section-grid-3
+  const className = section.id.replace(/\./g, '-');
+  return { selector: `.${className}`, declarations: sectionDeclarations(section.css) };
+}
 
-    css += `.${className} {\n`;
+/**
+ * Build responsive media query blocks for all breakpoints
+ * Only section tokens contribute breakpoint overrides.
+ */
+function mediaBlocks(tokens: LayoutToken[]): MediaBlock[] {
+  const blocks: MediaBlock[] = [];
 
-    // Add CSS properties from section.css
-    const sectionCSS = section.css;
+  // Breakpoint names in order
+  const breakpoints: Array<'sm' | 'md' | 'lg' | 'xl' | '2xl'> = ['sm', 'md', 'lg', 'xl', '2xl'];
 
-    if (sectionCSS.display) {
-      css += `  display: ${sectionCSS.display};\n`;
-    }
+  for (const bp of breakpoints) {
+    const rules: CSSRule[] = [];
 
-    if (sectionCSS.gridTemplateColumns) {
-      css += `  grid-template-columns: ${sectionCSS.gridTemplateColumns};\n`;
-    }
+    for (const token of tokens) {
+      if ('platform' in token || 'purpose' in token || !('type' in token)) {
+        continue;
+      }
 
-    if (sectionCSS.gridTemplateRows) {
-      css += `  grid-template-rows: ${sectionCSS.gridTemplateRows};\n`;
-    }
+      // Get responsive config for this breakpoint
+      const responsiveCss = token.responsive[bp] as Partial<SectionCSS> | undefined;
+      if (!responsiveCss || Object.keys(responsiveCss).length === 0) {
+        continue;
+      }
 
-    if (sectionCSS.gap) {
-      const gapValue = tokenRefToVar(sectionCSS.gap);
-      css += `  gap: ${gapValue};\n`;
+      rules.push({
+        selector: `.${token.id.replace(/\./g, '-')}`,
+        declarations: sectionDeclarations(responsiveCss),
+      });
     }
 
-    if (sectionCSS.flexDirection) {
-      css += `  flex-direction: ${sectionCSS.flexDirection};\n`;
+    // Only add media query if there's content
+    if (rules.length > 0) {
+      blocks.push({ query: `@media (min-width: ${BREAKPOINT_VALUES[bp]}px)`, rules });
     }
+  }
 
-    if (sectionCSS.alignItems) {
-      css += `  align-items: ${sectionCSS.alignItems};\n`;
-    }
+  return blocks;
+}
 
-    if (sectionCSS.justifyContent) {
-      css += `  justify-content: ${sectionCSS.justifyContent};\n`;
+/**
+ * Write a rule as unformatted CSS (2-space declarations, blank line after)
+ */
+function ruleToString(rule: CSSRule, outer = ''): string {
+  let css = `${outer}${rule.selector} {\n`;
+  for (const declaration of rule.declarations) {
+    const [first, ...continuation] = declaration.split('\n');
+    css += `${outer}  ${first}\n`;
+    for (const line of continuation) {
+      css += `${outer}    ${line}\n`;
     }
+  }
+  return `${css}${outer}}\n\n`;
+}
 
-    if (sectionCSS.maxWidth) {
-      const maxWidthValue = tokenRefToVar(sectionCSS.maxWidth);
-      css += `  max-width: ${maxWidthValue};\n`;
+/**
+ * Write a rule as formatted CSS (same layout as formatCSS)
+ *
+ * @param outer - Indentation of the selector and closing brace
+ * @param inner - Indentation of each declaration line
+ */
+function formatRule(rule: CSSRule, outer: string, inner: string): string {
+  let css = `${outer}${rule.selector} {\n`;
+  for (const declaration of rule.declarations) {
+    for (const line of declaration.split('\n')) {
+      css += `${inner}${line}\n`;
     }
+  }
+  return `${css}${outer}}\n`;
+}
 
-    if (sectionCSS.padding) {
-      const paddingValue = tokenRefToVar(sectionCSS.padding);
-      css += `  padding: ${paddingValue};\n`;
-    }
+// ============================================================================
+// CSS Generation Functions
+// ============================================================================
 
-    css += `}\n\n`;
+/**
+ * Generate CSS custom properties in :root from layout tokens
+ *
+ * @param tokens - Array of layout tokens
+ * @returns CSS :root block with custom properties
+ */
+export function generateCSSVariables(tokens: LayoutToken[]): string {
+  const rule = variablesRule(tokens);
+  if (!rule) {
+    return '';
   }
 
-  return css;
+  return ruleToString(rule).slice(0, -1);
+}
+
+/**
+ * Generate utility classes for shell tokens
+ *
+ * @param shells - Array of shell tokens
+ * @returns CSS classes for shells
+ */
+export function generateShellClasses(shells: ShellToken[]): string {
+  return shells.map(shell => ruleToString(shellRule(shell))).join('');
+}
+
+/**
+ * Generate utility classes for page tokens
+ *
+ * @param pages - Array of page layout tokens
+ * @returns CSS classes for pages
+ */
+export function generatePageClasses(pages: PageLayoutToken[]): string {
+  return pages.map(page => ruleToString(pageRule(page))).join('');
+}
+
+/**
+ * Generate utility classes for section pattern tokens
+ *
+ * @param sections - Array of section pattern tokens
+ * @returns CSS classes for sections
+ */
+export function generateSectionClasses(sections: SectionPatternToken[]): string {
+  return sections.map(section => ruleToString(sectionRule(section))).join('');
 }
 
 /**
@@ -349,184 +409,130 @@ export function generateSectionClasses(sections: SectionPatternToken[]): string
 export function generateMediaQueries(tokens: LayoutToken[]): string {
   let css = '';
 
-  // Breakpoint names in order
-  const breakpoints: Array<'sm' | 'md' | 'lg' | 'xl' | '2xl'> = ['sm', 'md', 'lg', 'xl', '2xl'];
-
-  for (const bp of breakpoints) {
-    const minWidth = BREAKPOINT_VALUES[bp];
-    let mediaQueryContent = '';
-
-    // Process each token
-    for (const token of tokens) {
-      // Get responsive config for this breakpoint
-      const responsiveConfig = token.responsive[bp];
-      if (!responsiveConfig || Object.keys(responsiveConfig).length === 0) {
-        continue;
-      }
-
-      // Generate class name based on token type
-      let className = '';
-      if ('platform' in token) {
-        // ShellToken
-        className = token.id.replace(/\./g, '-');
-      } else if ('purpose' in token) {
-        // PageLayoutToken
-        className = token.id.replace(/\./g, '-');
-      } else if ('type' in token) {
-        // SectionPatternToken
-        const sectionToken = token as SectionPatternToken;
-        className = sectionToken.id.replace(/\./g, '-');
-
-        // Generate section CSS for this breakpoint
-        const responsiveCss = responsiveConfig as Partial<SectionCSS>;
-
-        if (Object.keys(responsiveCss).length > 0) {
-          mediaQueryContent += `  .${className} {\n`;
-
-          if (responsiveCss.display) {
-            mediaQueryContent += `    display: ${responsiveCss.display};\n`;
-          }
-
-          if (responsiveCss.gridTemplateColumns) {
-            mediaQueryContent += `    grid-template-columns: ${responsiveCss.gridTemplateColumns};\n`;
-          }
-
-          if (responsiveCss.gridTemplateRows) {
-            mediaQueryContent += `    grid-template-rows: ${responsiveCss.gridTemplateRows};\n`;
-          }
-
-          if (responsiveCss.gap) {
-            const gapValue = tokenRefToVar(responsiveCss.gap);
-            mediaQueryContent += `    gap: ${gapValue};\n`;
-          }
-
-          if (responsiveCss.flexDirection) {
-            mediaQueryContent += `    flex-direction: ${responsiveCss.flexDirection};\n`;
-          }
-
-          if (responsiveCss.alignItems) {
-            mediaQueryContent += `    align-items: ${responsiveCss.alignItems};\n`;
-          }
-
-          if (responsiveCss.justifyContent) {
-            mediaQueryContent += `    justify-content: ${responsiveCss.justifyContent};\n`;
-          }
-
-          if (responsiveCss.maxWidth) {
-            const maxWidthValue = tokenRefToVar(responsiveCss.maxWidth);
-            mediaQueryContent += `    max-width: ${maxWidthValue};\n`;
-          }
-
-          if (responsiveCss.padding) {
-            const paddingValue = tokenRefToVar(responsiveCss.padding);
-            mediaQueryContent += `    padding: ${paddingValue};\n`;
-          }
-
-          mediaQueryContent += `  }\n\n`;
-        }
-      }
-    }
-
-    // Only add media query if there's content
-    if (mediaQueryContent.trim().length > 0) {
-      css += `@media (min-width: ${minWidth}px) {\n`;
-      css += mediaQueryContent;
-      css += `}\n\n`;
+  for (const block of mediaBlocks(tokens)) {
+    css += `${block.query} {\n`;
+    for (const rule of block.rules) {
+      css += ruleToString(rule, '  ');
     }
+    css += `}\n\n`;
   }
 
   return css;
 }
 
 /**
- * Generate complete CSS from layout tokens
+ * Emit formatted layout CSS in chunks
+ * Yields one chunk per top-level rule or media query, already indented, so
+ * callers can write to a stream without building the whole stylesheet.
+ * Braces are balanced by construction.
  *
  * @param tokens - Array of layout tokens (shells, pages, sections)
  * @param options - CSS generation options
- * @returns Complete CSS string with variables, utilities, and media queries
+ * @returns Generator of CSS chunks; their concatenation equals generateLayoutCSS()
  *
  * @example
  * ```typescript
- * import { getAllShellTokens, getAllPageLayoutTokens, getAllSectionPatternTokens } from './layout-tokens/index.js';
- *
- * const shells = getAllShellTokens();
- * const pages = getAllPageLayoutTokens();
- * const sections = getAllSectionPatternTokens();
+ * import { Readable } from 'node:stream';
  *
- * const css = generateLayoutCSS([...shells, ...pages, ...sections]);
- * console.log(css);
+ * Readable.from(emitLayoutCSS(tokens)).pipe(response);
  * ```
  */
-export function generateLayoutCSS(
+export function* emitLayoutCSS(
   tokens: LayoutToken[],
   options: CSSGenerationOptions = {}
-): string {
+): Generator<string, void, undefined> {
   const {
     includeVariables = true,
     includeClasses = true,
     includeMediaQueries = true,
     indent = '  ',
   } = options;
+  const nestedIndent = indent + indent;
 
-  let css = '';
-
-  // Separate tokens by type
-  const shells = tokens.filter(t => 'platform' in t) as ShellToken[];
-  const pages = tokens.filter(t => 'purpose' in t) as PageLayoutToken[];
-  const sections = tokens.filter(t => 'type' in t) as SectionPatternToken[];
-
-  // 1. Generate CSS variables
+  // 1. CSS variables
   if (includeVariables) {
-    const variablesCSS = generateCSSVariables(tokens);
-    if (variablesCSS) {
-      css += variablesCSS + '\n';
+    const rule = variablesRule(tokens);
+    if (rule) {
+      yield formatRule(rule, '', indent);
     }
   }
 
-  // 2. Generate utility classes
-  if (includeClasses) {
-    // Shell classes
-    if (shells.length > 0) {
-      const shellCSS = generateShellClasses(shells);
-      if (shellCSS) {
-        css += shellCSS;
-      }
-    }
+  if (!includeClasses) {
+    return;
+  }
 
-    // Page classes
-    if (pages.length > 0) {
-      const pageCSS = generatePageClasses(pages);
-      if (pageCSS) {
-        css += pageCSS;
-      }
+  // 2. Utility classes: shells, pages, then sections
+  for (const token of tokens) {
+    if ('platform' in token) {
+      yield formatRule(shellRule(token), '', indent);
     }
-
-    // Section classes
-    if (sections.length > 0) {
-      const sectionCSS = generateSectionClasses(sections);
-      if (sectionCSS) {
-        css += sectionCSS;
-      }
+  }
+  for (const token of tokens) {
+    if ('purpose' in token) {
+      yield formatRule(pageRule(token as PageLayoutToken), '', indent);
+    }
+  }
+  for (const token of tokens) {
+    if ('type' in token) {
+      yield formatRule(sectionRule(token as SectionPatternToken), '', indent);
     }
   }
 
-  // 3. Generate responsive media queries (only if includeClasses is true)
-  if (includeMediaQueries && includeClasses) {
-    const mediaCSS = generateMediaQueries(tokens);
-    if (mediaCSS) {
-      css += mediaCSS;
+  // 3. Responsive media queries
+  if (includeMediaQueries) {
+    for (const block of mediaBlocks(tokens)) {
+      let css = `${block.query} {\n`;
+      for (const rule of block.rules) {
+        css += formatRule(rule, indent, nestedIndent);
+      }
+      yield `${css}}\n`;
     }
   }
+}
 
-  // 4. Format CSS with proper indentation
-  const formatted = formatCSS(css, indent);
+/**
+ * Generate complete CSS from layout tokens
+ *
+ * @param tokens - Array of layout tokens (shells, pages, sections)
+ * @param options - CSS generation options
+ * @returns Complete CSS string with variables, utilities, and media queries
+ *
+ * @example
+ * ```typescript
+ * import { getAllShellTokens, getAllPageLayoutTokens, getAllSectionPatternTokens } from './layout-tokens/index.js';
+ *
+ * const shells = getAllShellTokens();
+ * const pages = getAllPageLayoutTokens();
+ * const sections = getAllSectionPatternTokens();
+ *
+ * const css = generateLayoutCSS([...shells, ...pages, ...sections]);
+ * console.log(css);
+ * ```
+ */
+export function generateLayoutCSS(
+  tokens: LayoutToken[],
+  options: CSSGenerationOptions = {}
+): string {
+  return Array.from(emitLayoutCSS(tokens, options)).join('');
+}
 
-  // 5. Validate CSS syntax
-  if (!validateCSS(formatted)) {
-    throw new Error('Generated CSS has unbalanced braces');
-  }
+/**
+ * Get all built-in layout tokens in stylesheet order
+ */
+function getBuiltinLayoutTokens(): LayoutToken[] {
+  return [...getAllShellTokens(), ...getAllPageLayoutTokens(), ...getAllSectionPatternTokens()];
+}
 
-  return formatted;
+/**
+ * Emit CSS for all layout tokens in the system in chunks
+ *
+ * @param options - CSS generation options
+ * @returns Generator of CSS chunks for all shells, pages, and sections
+ */
+export function emitAllLayoutCSS(
+  options: CSSGenerationOptions = {}
+): Generator<string, void, undefined> {
+  return emitLayoutCSS(getBuiltinLayoutTokens(), options);
 }
 
 /**
@@ -542,11 +548,71 @@ export function generateLayoutCSS(
  * ```
  */
 export function generateAllLayoutCSS(options: CSSGenerationOptions = {}): string {
-  const shells = getAllShellTokens();
-  const pages = getAllPageLayoutTokens();
-  const sections = getAllSectionPatternTokens();
+  return generateLayoutCSS(getBuiltinLayoutTokens(), options);
+}
+
+// ============================================================================
+// Prebuilt Stylesheet
+// ============================================================================
+
+/**
+ * Frozen, content-hashed stylesheet of all built-in layouts
+ */
+export interface PrebuiltLayoutCSS {
+  /** Complete stylesheet */
+  readonly css: string;
+
+  /** SHA-256 of the stylesheet (hex) */
+  readonly hash: string;
+
+  /** Content-addressed file name (e.g., "tekton-layout.3f2a9c1b.css") */
+  readonly fileName: string;
+
+  /** UTF-8 size in bytes */
+  readonly bytes: number;
+}
+
+const prebuiltCache = new Map<string, PrebuiltLayoutCSS>();
+
+/**
+ * Get the prebuilt stylesheet of all built-in layouts
+ * Built-in tokens never change at runtime, so the stylesheet is generated
+ * once per option set and served from memory afterwards. The hash can be
+ * used as an ETag or for immutable caching.
+ *
+ * @param options - CSS generation options
+ * @returns Frozen stylesheet with content hash
+ *
+ * @example
+ * ```typescript
+ * const { css, hash, fileName } = getPrebuiltLayoutCSS();
+ * response.setHeader('ETag', `"${hash}"`);
+ * response.end(css);
+ * ```
+ */
+export function getPrebuiltLayoutCSS(options: CSSGenerationOptions = {}): PrebuiltLayoutCSS {
+  const {
+    includeVariables = true,
+    includeClasses = true,
+    includeMediaQueries = true,
+    indent = '  ',
+  } = options;
+  const key = `${includeVariables}:${includeClasses}:${includeMediaQueries}:${indent}`;
+
+  let prebuilt = prebuiltCache.get(key);
+  if (!prebuilt) {
+    const css = generateAllLayoutCSS(options);
+    const hash = createHash('sha256').update(css).digest('hex');
+    prebuilt = Object.freeze({
+      css,
+      hash,
+      fileName: `tekton-layout.${hash.slice(0, 8)}.css`,
+      bytes: Buffer.byteLength(css),
+    });
+    prebuiltCache.set(key, prebuilt);
+  }
 
-  return generateLayoutCSS([...shells, ...pages, ...sections], options);
+  return prebuilt;
 }
 
 // ============================================================================
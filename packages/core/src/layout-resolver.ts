@@ -13,6 +13,8 @@ import type {
 import { getShellToken } from './layout-tokens/shells.js';
 import { getPageLayoutToken } from './layout-tokens/pages.js';
 import { getSectionPatternToken } from './layout-tokens/sections.js';
+import { createCache } from './cache.js';
+import { getTokenReferences, collectTokenReferences } from './layout-token-index.js';
 
 // ============================================================================
 // Types
@@ -53,7 +55,9 @@ type LayoutType = 'shell' | 'page' | 'section';
  * Layout cache for performance optimization
  * Maps layout ID to resolved layout
  */
-const layoutCache = new Map<string, ResolvedLayout>();
+const layoutCache = createCache<string, ResolvedLayout>('layout', {
+  maxEntries: 256,
+});
 
 /**
  * Clear the layout cache
@@ -118,30 +122,6 @@ export function resolveTokenReference(ref: string): string {
   return `--${ref.replace(/\./g, '-')}`;
 }
 
-/**
- * Extract all token references from an object recursively
- *
- * @param obj - Object to extract token references from
- * @returns Set of unique token references
- */
-function extractTokenReferences(obj: unknown): Set<string> {
-  const refs = new Set<string>();
-
-  function traverse(value: unknown): void {
-    if (typeof value === 'string' && /^[a-z]+\.[a-z-]+(\.[a-z0-9-]+)*$/.test(value)) {
-      // This is a token reference
-      refs.add(value);
-    } else if (typeof value === 'object' && value !== null) {
-      for (const prop of Object.values(value)) {
-        traverse(prop);
-      }
-    }
-  }
-
-  traverse(obj);
-  return refs;
-}
-
 /**
  * Generate CSS variables from token references
  *
@@ -213,11 +193,8 @@ function resolveShellLayout(layoutId: string): ResolvedLayout {
     throw new Error(`Shell token not found: ${layoutId}`);
   }
 
-  // Extract all token references from shell
-  const refs = extractTokenReferences(shell);
-
-  // Generate CSS variables
-  const cssVariables = generateCSSVariables(refs);
+  // Precompiled CSS variables from the layout token index
+  const cssVariables = { ...getTokenReferences(shell).cssVariables };
 
   return {
     shell,
@@ -250,8 +227,8 @@ function resolvePageLayout(layoutId: string): ResolvedLayout {
     sections.push(section);
   }
 
-  // Extract all token references from page and its sections
-  const refs = extractTokenReferences({ page, sections });
+  // Union of precompiled token references of the page and its sections
+  const refs = collectTokenReferences([page, ...sections]);
 
   // Generate CSS variables
   const cssVariables = generateCSSVariables(refs);
@@ -277,11 +254,8 @@ function resolveSectionLayout(layoutId: string): ResolvedLayout {
     throw new Error(`Section pattern token not found: ${layoutId}`);
   }
 
-  // Extract all token references from section
-  const refs = extractTokenReferences(section);
-
-  // Generate CSS variables
-  const cssVariables = generateCSSVariables(refs);
+  // Precompiled CSS variables from the layout token index
+  const cssVariables = { ...getTokenReferences(section).cssVariables };
 
   return {
     sections: [section],
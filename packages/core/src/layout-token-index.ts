@@ -0,0 +1,163 @@
+/**
+ * @tekton/core - Layout Token Index
+ * Precompiled token references and CSS variables for layout tokens
+ * [SPEC-LAYOUT-001] [PHASE-7]
+ */
+
+import type {
+  ShellToken,
+  MobileShellToken,
+  PageLayoutToken,
+  SectionPatternToken,
+} from './layout-tokens/types.js';
+import { getAllShellTokens } from './layout-tokens/shells.js';
+import { getAllMobileShellTokens } from './layout-tokens/mobile-shells.js';
+import { getAllPageLayoutTokens } from './layout-tokens/pages.js';
+import { getAllSectionPatternTokens } from './layout-tokens/sections.js';
+
+// ============================================================================
+// Types
+// ============================================================================
+
+/**
+ * Any layout token covered by the index
+ */
+export type IndexedLayoutToken = ShellToken | MobileShellToken | PageLayoutToken | SectionPatternToken;
+
+/**
+ * Token references of a single layout token
+ * Shared between callers - treat as read-only.
+ */
+export interface LayoutTokenReferences {
+  /** Token references in traversal order (e.g., "atomic.spacing.16") */
+  refs: ReadonlySet<string>;
+
+  /** CSS variable name to token reference (e.g., "--atomic-spacing-16" → "atomic.spacing.16") */
+  cssVariables: Readonly<Record<string, string>>;
+}
+
+// ============================================================================
+// Reference Extraction
+// ============================================================================
+
+/**
+ * Token reference pattern (e.g., "atomic.spacing.16", "semantic.color.primary")
+ */
+const TOKEN_REFERENCE_PATTERN = /^[a-z]+\.[a-z-]+(\.[a-z0-9-]+)*$/;
+
+/**
+ * Collect token references from every string leaf of an object
+ *
+ * @param obj - Object to traverse
+ * @returns Token references and their CSS variables
+ */
+function compileReferences(obj: unknown): LayoutTokenReferences {
+  const refs = new Set<string>();
+
+  function traverse(value: unknown): void {
+    if (typeof value === 'string' && TOKEN_REFERENCE_PATTERN.test(value)) {
+      refs.add(value);
+    } else if (typeof value === 'object' && value !== null) {
+      for (const prop of Object.values(value)) {
+        traverse(prop);
+      }
+    }
+  }
+
+  traverse(obj);
+
+  // "atomic.spacing.16" → "--atomic-spacing-16"
+  const cssVariables: Record<string, string> = {};
+  for (const ref of refs) {
+    cssVariables[`--${ref.replace(/\./g, '-')}`] = ref;
+  }
+
+  return { refs, cssVariables };
+}
+
+// ============================================================================
+// Index
+// ============================================================================
+
+/**
+ * Compiled references keyed by token object
+ * Built-in tokens are compiled once; custom tokens on first lookup.
+ */
+const referencesByToken = new WeakMap<object, LayoutTokenReferences>();
+
+/**
+ * Compiled references of built-in tokens keyed by layout ID
+ */
+let referencesById: Map<string, LayoutTokenReferences> | null = null;
+
+function getIndex(): Map<string, LayoutTokenReferences> {
+  if (referencesById) {
+    return referencesById;
+  }
+
+  const tokens: IndexedLayoutToken[] = [
+    ...getAllShellTokens(),
+    ...getAllMobileShellTokens(),
+    ...getAllPageLayoutTokens(),
+    ...getAllSectionPatternTokens(),
+  ];
+
+  referencesById = new Map();
+  for (const token of tokens) {
+    referencesById.set(token.id, getTokenReferences(token));
+  }
+  return referencesById;
+}
+
+/**
+ * Get the token references of a layout token
+ * Lookups are memoized per token object, so repeated calls are O(1).
+ *
+ * @param token - Layout token (built-in or custom)
+ * @returns Token references and CSS variables
+ *
+ * @example
+ * ```typescript
+ * const { cssVariables } = getTokenReferences(getSectionPatternToken('section.grid-3')!);
+ * // { '--section-grid-3': 'section.grid-3', '--atomic-spacing-6': 'atomic.spacing.6', ... }
+ * ```
+ */
+export function getTokenReferences(token: IndexedLayoutToken): LayoutTokenReferences {
+  let entry = referencesByToken.get(token);
+  if (!entry) {
+    entry = compileReferences(token);
+    referencesByToken.set(token, entry);
+  }
+  return entry;
+}
+
+/**
+ * Get the token references of a built-in layout by ID
+ *
+ * @param layoutId - Layout ID (e.g., "shell.web.dashboard", "shell.mobile.app", "page.dashboard")
+ * @returns Token references, or undefined if the layout is not built in
+ *
+ * @example
+ * ```typescript
+ * getLayoutReferences('page.dashboard')?.refs.has('atomic.spacing.8');
+ * ```
+ */
+export function getLayoutReferences(layoutId: string): LayoutTokenReferences | undefined {
+  return getIndex().get(layoutId);
+}
+
+/**
+ * Union of token references of several layout tokens, in order
+ *
+ * @param tokens - Layout tokens
+ * @returns Unique token references
+ */
+export function collectTokenReferences(tokens: readonly IndexedLayoutToken[]): Set<string> {
+  const refs = new Set<string>();
+  for (const token of tokens) {
+    for (const ref of getTokenReferences(token).refs) {
+      refs.add(ref);
+    }
+  }
+  return refs;
+}
@@ -6,6 +6,7 @@
 
 import { getComponentSchema, type ComponentSchema } from '../../component-schemas.js';
 import type { ComponentDefinition } from '../types.js';
+import { createCache, propsKey } from '../../cache.js';
 import {
   resolveBindings,
   type TokenBindingContext,
@@ -64,9 +65,11 @@ export interface ComponentContext {
 
 /**
  * Component resolution cache
- * Key: `${type}:${JSON.stringify(props)}:${theme}`
+ * Key: `${type}:${propsKey(props)}:${slot}:${theme}`
  */
-const componentCache = new Map<string, ResolvedComponent>();
+const componentCache = createCache<string, ResolvedComponent>('component', {
+  maxEntries: 2000,
+});
 
 /**
  * Clear component resolution cache
@@ -181,11 +184,12 @@ export function resolveComponent(
   context: ComponentContext
 ): ResolvedComponent {
   // Generate cache key (include slot for uniqueness)
-  const cacheKey = `${component.type}:${JSON.stringify(component.props)}:${component.slot || ''}:${context.theme}`;
+  const cacheKey = `${component.type}:${propsKey(component.props)}:${component.slot || ''}:${context.theme}`;
 
   // Check cache (skip for components with children as they need recursive resolution)
-  if (!component.children && componentCache.has(cacheKey)) {
-    return componentCache.get(cacheKey)!;
+  const cached = component.children ? undefined : componentCache.get(cacheKey);
+  if (cached) {
+    return cached;
   }
 
   // Get component schema
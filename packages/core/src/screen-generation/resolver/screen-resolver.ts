@@ -18,6 +18,7 @@ import {
   type ComponentContext,
 } from './component-resolver.js';
 import { tokenRefToCSSVar } from './token-resolver.js';
+import { createCache } from '../../cache.js';
 
 // ============================================================================
 // Types
@@ -115,7 +116,9 @@ export interface ResolvedScreen {
  * Screen resolution cache
  * Key: `${screenId}:${themeId}`
  */
-const screenCache = new Map<string, ResolvedScreen>();
+const screenCache = createCache<string, ResolvedScreen>('screen', {
+  maxEntries: 500,
+});
 
 /**
  * Clear screen resolution cache
@@ -206,34 +209,32 @@ function mergeCSSVariables(
   return merged;
 }
 
+/**
+ * Section CSS variables keyed by resolved layout
+ * Resolved layouts are cached, so each is converted once.
+ */
+const layoutCSSVariables = new WeakMap<ResolvedLayout, Record<string, string>>();
+
 /**
  * Generate CSS variables from token references in layout
  *
- * Extracts all token references from layout structure and
- * generates CSS variable declarations.
+ * Uses the layout's precompiled token references (see layout-token-index)
+ * instead of traversing the layout structure.
  *
  * @param layout - Resolved layout
  * @returns CSS variables map
  */
 function generateLayoutCSSVariables(layout: ResolvedLayout): Record<string, string> {
-  const cssVars: Record<string, string> = {};
-
-  // Extract token references from layout
-  const extractTokens = (obj: unknown): void => {
-    if (typeof obj === 'string' && /^[a-z]+\.[a-z-]+(\.[a-z0-9-]+)*$/.test(obj)) {
-      // This is a token reference
-      const cssVarName = tokenRefToCSSVar(obj);
-      cssVars[cssVarName] = obj;
-    } else if (typeof obj === 'object' && obj !== null) {
-      for (const value of Object.values(obj)) {
-        extractTokens(value);
-      }
+  let cssVars = layoutCSSVariables.get(layout);
+  if (!cssVars) {
+    cssVars = {};
+    for (const tokenRef of Object.values(layout.cssVariables)) {
+      cssVars[tokenRefToCSSVar(tokenRef)] = tokenRef;
     }
-  };
-
-  extractTokens(layout);
+    layoutCSSVariables.set(layout, cssVars);
+  }
 
-  return cssVars;
+  return { ...cssVars };
 }
 
 // ============================================================================
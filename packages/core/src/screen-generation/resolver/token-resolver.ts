@@ -5,6 +5,7 @@
  */
 
 import type { TokenBindings } from '../../component-schemas.js';
+import { createCache, stringEntryBytes } from '../../cache.js';
 
 // ============================================================================
 // Types
@@ -34,9 +35,44 @@ export type ResolvedTokenBindings = Record<string, string>;
 
 /**
  * Token binding cache for performance optimization
- * Key: `${binding}:${JSON.stringify(props)}:${theme}`
+ * Key: binding, theme and the values of the template variables it references
+ * (unrelated props don't affect the result, so they are not part of the key)
  */
-const bindingCache = new Map<string, string>();
+const bindingCache = createCache<string, string>('binding', {
+  maxEntries: 5000,
+  maxBytes: 1024 * 1024,
+  sizeOf: stringEntryBytes,
+});
+
+/**
+ * Template variable names per binding (bindings come from a finite schema set)
+ */
+const templateVarsCache = createCache<string, string[]>('binding-template-vars', {
+  maxEntries: 1000,
+});
+
+/**
+ * Build a cache key from only the props referenced by the binding
+ * Returns null when a referenced prop is missing or not a string/number,
+ * so the uncached path can report the error.
+ */
+function bindingCacheKey(binding: string, context: TokenBindingContext): string | null {
+  let variables = templateVarsCache.get(binding);
+  if (!variables) {
+    variables = extractTemplateVariables(binding);
+    templateVarsCache.set(binding, variables);
+  }
+
+  let key = `${context.theme}\u0000${binding}`;
+  for (const name of variables) {
+    const value = context.props[name];
+    if (typeof value !== 'string' && typeof value !== 'number') {
+      return null;
+    }
+    key += `\u0000${value}`;
+  }
+  return key;
+}
 
 /**
  * Clear token binding cache
@@ -49,6 +85,7 @@ const bindingCache = new Map<string, string>();
  */
 export function clearBindingCache(): void {
   bindingCache.clear();
+  templateVarsCache.clear();
 }
 
 // ============================================================================
@@ -182,10 +219,10 @@ export function tokenRefToCSSVar(tokenRef: string): string {
  */
 export function resolveBinding(binding: string, context: TokenBindingContext): string {
   // Generate cache key
-  const cacheKey = `${binding}:${JSON.stringify(context.props)}:${context.theme}`;
+  const cacheKey = bindingCacheKey(binding, context);
 
   // Check cache
-  const cached = bindingCache.get(cacheKey);
+  const cached = cacheKey !== null ? bindingCache.get(cacheKey) : undefined;
   if (cached) {
     return cached;
   }
@@ -197,7 +234,9 @@ export function resolveBinding(binding: string, context: TokenBindingContext): s
   const cssVar = tokenRefToCSSVar(tokenRef);
 
   // Cache result
-  bindingCache.set(cacheKey, cssVar);
+  if (cacheKey !== null) {
+    bindingCache.set(cacheKey, cssVar);
+  }
 
   return cssVar;
 }
@@ -0,0 +1,515 @@
+/**
+ * @tekton/core - Theme Registry
+ * Memoized v2.1 theme loading with bounded eviction and file-change invalidation
+ * [SPEC-LAYOUT-002] [THEME-V2]
+ */
+
+import { existsSync, readFileSync, readdirSync, statSync, watch, type FSWatcher } from 'node:fs';
+import { join, resolve } from 'node:path';
+import { oklchToCSSV2, type OKLCHColorV2, type ThemeMetaV2, type ThemeV2 } from './theme-v2.js';
+import { resolveTokenReference } from './layout-resolver.js';
+
+// ============================================================================
+// Types
+// ============================================================================
+
+/**
+ * Theme with precomputed derived data
+ * Treat all fields as read-only: the same objects are shared by every caller.
+ */
+export interface CompiledTheme {
+  theme: ThemeV2;
+  /** Flattened resolveTokenRef table: token path -> resolved CSS value */
+  tokenLookup: ReadonlyMap<string, string>;
+  /** CSS custom properties for atomic/semantic/component tokens */
+  cssVariables: Readonly<Record<string, string>>;
+}
+
+export interface ThemeRegistryOptions {
+  /** Themes directory (default: .moai/themes/generated/ from project root) */
+  themesDir?: string;
+  /** Maximum number of parsed themes kept in memory (default: 32) */
+  maxEntries?: number;
+  /** Invalidate through fs.watch instead of per-request mtime checks (default: false) */
+  watch?: boolean;
+}
+
+export interface ThemeRegistryStats {
+  /** Number of registry lookups (get/list/exists) */
+  requests: number;
+  /** Theme lookups served from memory */
+  hits: number;
+  /** Theme lookups that read and parsed the file */
+  misses: number;
+  /** Cached themes re-read because the file changed */
+  reloads: number;
+  /** Entries dropped to stay within maxEntries */
+  evictions: number;
+  /** hits / (hits + misses) */
+  hitRate: number;
+  /** Cached theme count */
+  size: number;
+  /** Lookup latency in milliseconds */
+  totalMs: number;
+  avgMs: number;
+  maxMs: number;
+}
+
+interface RegistryEntry {
+  compiled: CompiledTheme | null;
+  mtimeMs: number;
+  size: number;
+}
+
+// ============================================================================
+// Theme Directory Resolution
+// ============================================================================
+
+/** Project roots found, by working directory (misses are retried) */
+const projectRootCache = new Map<string, string>();
+
+/**
+ * Find project root by looking for .moai directory
+ */
+function findProjectRoot(startDir: string): string | null {
+  const cached = projectRootCache.get(startDir);
+  if (cached !== undefined) {
+    return cached;
+  }
+
+  let currentDir = startDir;
+  const root = '/';
+  let found: string | null = null;
+
+  while (currentDir !== root) {
+    if (existsSync(join(currentDir, '.moai'))) {
+      found = currentDir;
+      break;
+    }
+    currentDir = resolve(currentDir, '..');
+  }
+
+  if (found) {
+    projectRootCache.set(startDir, found);
+  }
+  return found;
+}
+
+/**
+ * Get themes directory path
+ * Returns .moai/themes/generated/ from project root
+ */
+export function getThemesDir(): string | null {
+  const projectRoot = findProjectRoot(process.cwd());
+  if (!projectRoot) {
+    return null;
+  }
+  return join(projectRoot, '.moai', 'themes', 'generated');
+}
+
+/**
+ * Validate theme ID (kebab-case only, prevents path traversal)
+ */
+export function isValidThemeId(themeId: string): boolean {
+  return !!themeId && /^[a-z0-9-]+$/.test(themeId);
+}
+
+// ============================================================================
+// Derived Data
+// ============================================================================
+
+const TOKEN_LAYERS = ['atomic', 'semantic', 'component'] as const;
+
+/** Lookup tables for themes owned by a registry */
+const tokenLookups = new WeakMap<ThemeV2, ReadonlyMap<string, string>>();
+
+/**
+ * Get the precomputed token lookup for a registry-loaded theme
+ * Returns undefined for themes not loaded through a ThemeRegistry.
+ */
+export function getThemeTokenLookup(theme: ThemeV2): ReadonlyMap<string, string> | undefined {
+  return tokenLookups.get(theme);
+}
+
+function isOKLCHObject(value: object): value is OKLCHColorV2 {
+  return 'l' in value && 'c' in value && 'h' in value;
+}
+
+/**
+ * Flatten every path resolveTokenRef can resolve into a lookup table
+ */
+function buildTokenLookup(theme: ThemeV2): Map<string, string> {
+  const lookup = new Map<string, string>();
+
+  // Only dotted paths are references; bare keys are returned as-is by resolveTokenRef
+  function walk(value: unknown, path: string): void {
+    const isRef = path.includes('.');
+    if (typeof value === 'string') {
+      if (isRef) {
+        lookup.set(path, value);
+      }
+    } else if (value && typeof value === 'object') {
+      if (isRef && isOKLCHObject(value)) {
+        lookup.set(path, oklchToCSSV2(value));
+      }
+      for (const [key, child] of Object.entries(value)) {
+        walk(child, path ? `${path}.${key}` : key);
+      }
+    }
+  }
+
+  // Paths from the theme root ("elevation.level.1", "tokens.atomic.spacing.4")
+  walk(theme, '');
+
+  // Layer shorthands resolve from theme.tokens ("atomic.color.brand.500")
+  for (const layer of TOKEN_LAYERS) {
+    walk(theme.tokens?.[layer], layer);
+  }
+
+  return lookup;
+}
+
+function isTokenLayerPath(path: string): boolean {
+  return (TOKEN_LAYERS as readonly string[]).includes(path.slice(0, path.indexOf('.')));
+}
+
+/**
+ * Build CSS custom properties for token layers
+ * "atomic.spacing.4" -> "--atomic-spacing-4"
+ * Token references become var() of the referenced variable
+ * ("atomic.color.brand.500" -> "var(--atomic-color-brand-500)"); references
+ * that do not resolve are left out.
+ */
+function buildCSSVariables(lookup: ReadonlyMap<string, string>): Record<string, string> {
+  const variables: Record<string, string> = {};
+
+  for (const [path, value] of lookup) {
+    if (!isTokenLayerPath(path)) {
+      continue;
+    }
+    if (!isTokenLayerPath(value)) {
+      variables[resolveTokenReference(path)] = value;
+    } else if (lookup.has(value)) {
+      variables[resolveTokenReference(path)] = `var(${resolveTokenReference(value)})`;
+    }
+  }
+
+  return variables;
+}
+
+function compileTheme(theme: ThemeV2): CompiledTheme {
+  const tokenLookup = buildTokenLookup(theme);
+  tokenLookups.set(theme, tokenLookup);
+  return {
+    theme,
+    tokenLookup,
+    cssVariables: Object.freeze(buildCSSVariables(tokenLookup)),
+  };
+}
+
+// ============================================================================
+// Theme Registry
+// ============================================================================
+
+const DEFAULT_MAX_ENTRIES = 32;
+
+/**
+ * Memoized theme registry
+ * Parses each theme file once and re-reads it only when its mtime or size
+ * changes (or, with `watch: true`, when fs.watch reports a change).
+ *
+ * @example
+ * ```typescript
+ * const registry = new ThemeRegistry({ maxEntries: 16 });
+ * const compiled = registry.getCompiled('atlantic-magazine-v1');
+ * compiled?.cssVariables['--atomic-spacing-4'];
+ * registry.getStats().hitRate;
+ * ```
+ */
+export class ThemeRegistry {
+  private readonly options: ThemeRegistryOptions;
+  private readonly maxEntries: number;
+  private readonly entries = new Map<string, RegistryEntry>();
+  private listCache: { dir: string; mtimeMs: number; ids: string[] } | null = null;
+  private watcher: FSWatcher | null = null;
+  private watchedDir: string | null = null;
+  private stats = { requests: 0, hits: 0, misses: 0, reloads: 0, evictions: 0, totalMs: 0, maxMs: 0 };
+
+  constructor(options: ThemeRegistryOptions = {}) {
+    this.options = options;
+    this.maxEntries = Math.max(1, options.maxEntries ?? DEFAULT_MAX_ENTRIES);
+  }
+
+  /**
+   * Load a theme by ID
+   * @returns Cached theme or null if not found / invalid
+   */
+  get(themeId: string): ThemeV2 | null {
+    return this.getCompiled(themeId)?.theme ?? null;
+  }
+
+  /**
+   * Load a theme with its precomputed token lookup and CSS variables
+   */
+  getCompiled(themeId: string): CompiledTheme | null {
+    const start = performance.now();
+    try {
+      return this.lookup(themeId);
+    } finally {
+      this.record(start);
+    }
+  }
+
+  /**
+   * List all available themes
+   */
+  list(): ThemeMetaV2[] {
+    const start = performance.now();
+    try {
+      const themes: ThemeMetaV2[] = [];
+      for (const themeId of this.listIds()) {
+        const theme = this.lookup(themeId)?.theme;
+        if (theme) {
+          themes.push({
+            id: theme.id,
+            name: theme.name,
+            description: theme.description,
+            brandTone: theme.brandTone,
+            schemaVersion: theme.schemaVersion,
+          });
+        }
+      }
+      return themes;
+    } finally {
+      this.record(start);
+    }
+  }
+
+  /**
+   * Check if a theme file exists
+   */
+  has(themeId: string): boolean {
+    const start = performance.now();
+    try {
+      if (!isValidThemeId(themeId)) {
+        return false;
+      }
+      const themesDir = this.resolveThemesDir();
+      if (!themesDir) {
+        return false;
+      }
+      if (this.watcher && this.entries.has(themeId)) {
+        return true;
+      }
+      return existsSync(join(themesDir, `${themeId}.json`));
+    } finally {
+      this.record(start);
+    }
+  }
+
+  /**
+   * Drop one cached theme, or all of them
+   */
+  invalidate(themeId?: string): void {
+    if (themeId === undefined) {
+      this.entries.clear();
+    } else {
+      this.entries.delete(themeId);
+    }
+    this.listCache = null;
+  }
+
+  /**
+   * Cache and latency counters
+   */
+  getStats(): ThemeRegistryStats {
+    const { requests, hits, misses, totalMs } = this.stats;
+    const lookups = hits + misses;
+    return {
+      ...this.stats,
+      hitRate: lookups === 0 ? 0 : hits / lookups,
+      size: this.entries.size,
+      avgMs: requests === 0 ? 0 : totalMs / requests,
+    };
+  }
+
+  resetStats(): void {
+    this.stats = { requests: 0, hits: 0, misses: 0, reloads: 0, evictions: 0, totalMs: 0, maxMs: 0 };
+  }
+
+  /**
+   * Stop watching the themes directory
+   */
+  close(): void {
+    this.watcher?.close();
+    this.watcher = null;
+    this.watchedDir = null;
+  }
+
+  private lookup(themeId: string): CompiledTheme | null {
+    // Security: Prevent path traversal attacks
+    if (!isValidThemeId(themeId)) {
+      return null;
+    }
+
+    const themesDir = this.resolveThemesDir();
+    if (!themesDir) {
+      return null;
+    }
+
+    const themePath = join(themesDir, `${themeId}.json`);
+    const cached = this.entries.get(themeId);
+
+    // With an active watcher, cached entries are trusted until invalidated
+    if (cached && this.watcher) {
+      this.touch(themeId, cached);
+      this.stats.hits++;
+      return cached.compiled;
+    }
+
+    let fileStat;
+    try {
+      fileStat = statSync(themePath);
+    } catch {
+      this.entries.delete(themeId);
+      return null;
+    }
+
+    if (cached && cached.mtimeMs === fileStat.mtimeMs && cached.size === fileStat.size) {
+      this.touch(themeId, cached);
+      this.stats.hits++;
+      return cached.compiled;
+    }
+
+    this.stats.misses++;
+    if (cached) {
+      this.stats.reloads++;
+    }
+
+    const entry: RegistryEntry = {
+      compiled: this.parse(themeId, themePath),
+      mtimeMs: fileStat.mtimeMs,
+      size: fileStat.size,
+    };
+    this.touch(themeId, entry);
+    return entry.compiled;
+  }
+
+  private parse(themeId: string, themePath: string): CompiledTheme | null {
+    try {
+      const content = readFileSync(themePath, 'utf-8');
+      const theme = JSON.parse(content) as ThemeV2;
+
+      // Validate schema version
+      if (theme.schemaVersion !== '2.1') {
+        console.warn(`Theme ${themeId} has invalid schema version: ${theme.schemaVersion}`);
+        return null;
+      }
+
+      return compileTheme(theme);
+    } catch (error) {
+      console.error(`Failed to load theme ${themeId}:`, error);
+      return null;
+    }
+  }
+
+  /**
+   * Insert or refresh an entry in LRU order, evicting the oldest
+   */
+  private touch(themeId: string, entry: RegistryEntry): void {
+    this.entries.delete(themeId);
+    this.entries.set(themeId, entry);
+    while (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next().value as string;
+      this.entries.delete(oldest);
+      this.stats.evictions++;
+    }
+  }
+
+  private listIds(): string[] {
+    const themesDir = this.resolveThemesDir();
+    if (!themesDir) {
+      return [];
+    }
+
+    let dirMtime: number;
+    try {
+      dirMtime = statSync(themesDir).mtimeMs;
+    } catch {
+      return [];
+    }
+
+    if (this.listCache?.dir === themesDir && this.listCache.mtimeMs === dirMtime) {
+      return this.listCache.ids;
+    }
+
+    const ids = readdirSync(themesDir)
+      .filter(f => f.endsWith('.json'))
+      .map(f => f.replace('.json', ''));
+    this.listCache = { dir: themesDir, mtimeMs: dirMtime, ids };
+    return ids;
+  }
+
+  private resolveThemesDir(): string | null {
+    const themesDir = this.options.themesDir ?? getThemesDir();
+    if (themesDir && this.options.watch && this.watchedDir !== themesDir) {
+      this.startWatching(themesDir);
+    }
+    return themesDir;
+  }
+
+  private startWatching(themesDir: string): void {
+    this.close();
+    try {
+      this.watcher = watch(themesDir, { persistent: false }, (_event, filename) => {
+        if (filename && filename.toString().endsWith('.json')) {
+          this.invalidate(filename.toString().replace('.json', ''));
+        } else {
+          this.invalidate();
+        }
+      });
+      this.watcher.on('error', () => this.close());
+      this.watchedDir = themesDir;
+      // Entries cached before the watcher started may already be stale
+      this.invalidate();
+    } catch {
+      // Directory missing or fs.watch unsupported: fall back to mtime checks
+      this.watcher = null;
+      this.watchedDir = themesDir;
+    }
+  }
+
+  private record(start: number): void {
+    const elapsed = performance.now() - start;
+    this.stats.requests++;
+    this.stats.totalMs += elapsed;
+    if (elapsed > this.stats.maxMs) {
+      this.stats.maxMs = elapsed;
+    }
+  }
+}
+
+// ============================================================================
+// Default Registry
+// ============================================================================
+
+let defaultRegistry: ThemeRegistry | null = null;
+
+/**
+ * Get the shared registry used by loadTheme/listThemes
+ */
+export function getThemeRegistry(): ThemeRegistry {
+  if (!defaultRegistry) {
+    defaultRegistry = new ThemeRegistry();
+  }
+  return defaultRegistry;
+}
+
+/**
+ * Replace the shared registry (e.g. to enable watching or change limits)
+ */
+export function configureThemeRegistry(options: ThemeRegistryOptions): ThemeRegistry {
+  defaultRegistry?.close();
+  defaultRegistry = new ThemeRegistry(options);
+  return defaultRegistry;
+}
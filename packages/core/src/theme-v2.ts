@@ -4,8 +4,7 @@
  * [SPEC-LAYOUT-002] [THEME-V2]
  */
 
-import { readFileSync, readdirSync, existsSync } from 'node:fs';
-import { join, resolve } from 'node:path';
+import { getThemeRegistry, getThemeTokenLookup } from './theme-registry.js';
 
 // ============================================================================
 // V2.1 Theme Types (Visual DNA Only - No Layout)
@@ -236,80 +235,19 @@ export interface ThemeMetaV2 {
   schemaVersion: string;
 }
 
-// ============================================================================
-// Theme Directory Resolution
-// ============================================================================
-
-/**
- * Find project root by looking for .moai directory
- */
-function findProjectRoot(startDir: string): string | null {
-  let currentDir = startDir;
-  const root = '/';
-
-  while (currentDir !== root) {
-    if (existsSync(join(currentDir, '.moai'))) {
-      return currentDir;
-    }
-    currentDir = resolve(currentDir, '..');
-  }
-
-  return null;
-}
-
-/**
- * Get themes directory path
- * Returns .moai/themes/generated/ from project root
- */
-function getThemesDir(): string | null {
-  const projectRoot = findProjectRoot(process.cwd());
-  if (!projectRoot) {
-    return null;
-  }
-  return join(projectRoot, '.moai', 'themes', 'generated');
-}
-
 // ============================================================================
 // Theme Loading Functions
 // ============================================================================
 
 /**
  * Load theme from .moai/themes/generated/ directory
+ * Served from the shared ThemeRegistry: each file is parsed once and
+ * re-read only when it changes. Treat the returned object as read-only.
  * @param themeId - Theme identifier (kebab-case, e.g., "atlantic-magazine-v1")
  * @returns Loaded theme or null if not found
  */
 export function loadThemeV2(themeId: string): ThemeV2 | null {
-  // Security: Prevent path traversal attacks
-  if (!themeId || !/^[a-z0-9-]+$/.test(themeId)) {
-    return null;
-  }
-
-  const themesDir = getThemesDir();
-  if (!themesDir || !existsSync(themesDir)) {
-    return null;
-  }
-
-  const themePath = join(themesDir, `${themeId}.json`);
-
-  if (!existsSync(themePath)) {
-    return null;
-  }
-
-  try {
-    const content = readFileSync(themePath, 'utf-8');
-    const theme = JSON.parse(content) as ThemeV2;
-
-    // Validate schema version
-    if (theme.schemaVersion !== '2.1') {
-      console.warn(`Theme ${themeId} has invalid schema version: ${theme.schemaVersion}`);
-      return null;
-    }
-
-    return theme;
-  } catch (error) {
-    console.error(`Failed to load theme ${themeId}:`, error);
-    return null;
-  }
+  return getThemeRegistry().get(themeId);
 }
 
 /**
@@ -317,30 +255,7 @@ export function loadThemeV2(themeId: string): ThemeV2 | null {
  * @returns Array of theme metadata
  */
 export function listThemesV2(): ThemeMetaV2[] {
-  const themesDir = getThemesDir();
-  if (!themesDir || !existsSync(themesDir)) {
-    return [];
-  }
-
-  const files = readdirSync(themesDir).filter(f => f.endsWith('.json'));
-  const themes: ThemeMetaV2[] = [];
-
-  for (const file of files) {
-    const themeId = file.replace('.json', '');
-    const theme = loadThemeV2(themeId);
-
-    if (theme) {
-      themes.push({
-        id: theme.id,
-        name: theme.name,
-        description: theme.description,
-        brandTone: theme.brandTone,
-        schemaVersion: theme.schemaVersion,
-      });
-    }
-  }
-
-  return themes;
+  return getThemeRegistry().list();
 }
 
 /**
@@ -349,16 +264,7 @@ export function listThemesV2(): ThemeMetaV2[] {
  * @returns true if theme exists
  */
 export function themeExistsV2(themeId: string): boolean {
-  if (!themeId || !/^[a-z0-9-]+$/.test(themeId)) {
-    return false;
-  }
-
-  const themesDir = getThemesDir();
-  if (!themesDir) {
-    return false;
-  }
-
-  return existsSync(join(themesDir, `${themeId}.json`));
+  return getThemeRegistry().has(themeId);
 }
 
 // ============================================================================
@@ -384,6 +290,12 @@ export function resolveTokenRef(ref: string, theme: ThemeV2): string | null {
     return ref; // Not a reference, return as-is
   }
 
+  // Registry-loaded themes carry a precomputed lookup table
+  const lookup = getThemeTokenLookup(theme);
+  if (lookup) {
+    return lookup.get(ref) ?? null;
+  }
+
   const parts = ref.split('.');
   // eslint-disable-next-line @typescript-eslint/no-explicit-any
   let current: any = theme;
@@ -0,0 +1,246 @@
+/**
+ * @tekton/core - Worker Pool
+ * Fixed-size worker_threads pool shared by the esbuild plugin and MCP server
+ *
+ * Workers start lazily on first use and are unref'd while idle, so an idle
+ * pool never keeps the process alive. Worker scripts answer jobs through
+ * serveWorkerJobs().
+ */
+
+import { availableParallelism, cpus } from 'node:os';
+import { parentPort, Worker } from 'node:worker_threads';
+
+// ============================================================================
+// Types
+// ============================================================================
+
+export interface WorkerPoolRequest<TJob> {
+  id: number;
+  job: TJob;
+}
+
+export interface WorkerPoolResponse<TResult> {
+  id: number;
+  result?: TResult;
+  /** Set when the job threw inside the worker */
+  error?: string;
+}
+
+export interface WorkerPoolOptions {
+  /** Maximum number of workers (default: one per available CPU) */
+  size?: number;
+  /** Prefix for error messages (default: "Worker pool") */
+  name?: string;
+}
+
+export interface WorkerPoolStats {
+  /** Maximum number of workers */
+  size: number;
+  /** Workers started */
+  workers: number;
+  /** Workers running a job */
+  busy: number;
+  /** Jobs waiting for a worker */
+  queued: number;
+}
+
+interface PendingJob<TJob, TResult> {
+  request: WorkerPoolRequest<TJob>;
+  resolve: (result: TResult) => void;
+  reject: (error: Error) => void;
+}
+
+interface PoolWorker {
+  worker: Worker;
+  /** Completed at least one job (a worker that dies before that is broken) */
+  healthy: boolean;
+}
+
+// ============================================================================
+// Worker Pool
+// ============================================================================
+
+/**
+ * Default pool size: one worker per available CPU
+ */
+export function defaultWorkerPoolSize(): number {
+  return typeof availableParallelism === 'function' ? availableParallelism() : cpus().length;
+}
+
+/**
+ * Fixed-size worker pool
+ * A job is rejected when its worker throws, exits, or answers with an
+ * unexpected id. When a worker dies before completing any job (e.g. the
+ * script fails to load), queued jobs are rejected instead of respawning.
+ *
+ * @example
+ * ```typescript
+ * const pool = new WorkerPool<Job, Result>(new URL('./worker.js', import.meta.url));
+ * const result = await pool.run(job);
+ * await pool.terminate();
+ * ```
+ */
+export class WorkerPool<TJob, TResult> {
+  readonly size: number;
+  private readonly workerUrl: URL | string;
+  private readonly name: string;
+  private readonly workers: PoolWorker[] = [];
+  private readonly idle: PoolWorker[] = [];
+  private readonly queue: Array<PendingJob<TJob, TResult>> = [];
+  private readonly running = new Map<PoolWorker, PendingJob<TJob, TResult>>();
+  private nextId = 0;
+
+  constructor(workerUrl: URL | string, options: WorkerPoolOptions = {}) {
+    this.workerUrl = workerUrl;
+    this.size = Math.max(1, Math.floor(options.size ?? defaultWorkerPoolSize()));
+    this.name = options.name ?? 'Worker pool';
+  }
+
+  /**
+   * Run a job on a worker thread
+   */
+  run(job: TJob): Promise<TResult> {
+    return new Promise((resolve, reject) => {
+      this.queue.push({ request: { id: this.nextId++, job }, resolve, reject });
+      this.dispatch();
+    });
+  }
+
+  stats(): WorkerPoolStats {
+    return {
+      size: this.size,
+      workers: this.workers.length,
+      busy: this.running.size,
+      queued: this.queue.length,
+    };
+  }
+
+  /**
+   * Stop all workers and reject queued and running jobs
+   */
+  async terminate(): Promise<void> {
+    const error = new Error(`${this.name} terminated`);
+    for (const job of this.queue.splice(0)) {
+      job.reject(error);
+    }
+    for (const job of this.running.values()) {
+      job.reject(error);
+    }
+    this.running.clear();
+    const workers = this.workers.splice(0);
+    this.idle.length = 0;
+    await Promise.all(workers.map(({ worker }) => worker.terminate()));
+  }
+
+  private dispatch(): void {
+    while (this.queue.length > 0) {
+      const poolWorker = this.idle.pop() ?? this.spawn();
+      if (!poolWorker) {
+        return;
+      }
+
+      const job = this.queue.shift()!;
+      this.running.set(poolWorker, job);
+      poolWorker.worker.ref();
+      poolWorker.worker.postMessage(job.request);
+    }
+  }
+
+  private spawn(): PoolWorker | undefined {
+    if (this.workers.length >= this.size) {
+      return undefined;
+    }
+
+    const poolWorker: PoolWorker = { worker: new Worker(this.workerUrl), healthy: false };
+    const { worker } = poolWorker;
+
+    worker.on('message', (response: WorkerPoolResponse<TResult>) => {
+      const job = this.running.get(poolWorker);
+      this.running.delete(poolWorker);
+
+      if (!job || job.request.id !== response.id) {
+        // Out of sync with the worker: drop it and fail its job
+        this.remove(poolWorker);
+        void worker.terminate();
+        job?.reject(new Error(`${this.name}: unexpected response id ${response.id}`));
+        this.dispatch();
+        return;
+      }
+
+      poolWorker.healthy = true;
+      worker.unref();
+      this.idle.push(poolWorker);
+      if (response.error !== undefined) {
+        job.reject(new Error(response.error));
+      } else {
+        job.resolve(response.result as TResult);
+      }
+      this.dispatch();
+    });
+
+    worker.on('error', error => this.fail(poolWorker, error));
+    worker.on('messageerror', error => this.fail(poolWorker, error));
+    worker.on('exit', code => {
+      this.fail(poolWorker, new Error(`${this.name}: worker exited with code ${code}`));
+    });
+
+    this.workers.push(poolWorker);
+    return poolWorker;
+  }
+
+  /**
+   * Reject the worker's job and drop the worker
+   */
+  private fail(poolWorker: PoolWorker, error: Error): void {
+    const job = this.running.get(poolWorker);
+    this.running.delete(poolWorker);
+    const wasActive = this.remove(poolWorker);
+    job?.reject(error);
+
+    if (!wasActive) {
+      return;
+    }
+    if (poolWorker.healthy) {
+      this.dispatch();
+    } else if (this.workers.length === 0) {
+      // Nothing left to run queued jobs, and respawning would fail the same way
+      for (const queued of this.queue.splice(0)) {
+        queued.reject(error);
+      }
+    }
+  }
+
+  /**
+   * @returns false if the worker was already removed
+   */
+  private remove(poolWorker: PoolWorker): boolean {
+    const index = this.workers.indexOf(poolWorker);
+    if (index === -1) {
+      return false;
+    }
+    this.workers.splice(index, 1);
+    const idleIndex = this.idle.indexOf(poolWorker);
+    if (idleIndex !== -1) {
+      this.idle.splice(idleIndex, 1);
+    }
+    return true;
+  }
+}
+
+/**
+ * Answer WorkerPool jobs from inside a worker script
+ * Errors thrown by the handler are sent back and reject only that job.
+ */
+export function serveWorkerJobs<TJob, TResult>(
+  handler: (job: TJob) => TResult | Promise<TResult>
+): void {
+  parentPort?.on('message', async (request: WorkerPoolRequest<TJob>) => {
+    let response: WorkerPoolResponse<TResult>;
+    try {
+      response = { id: request.id, result: await handler(request.job) };
+    } catch (error) {
+      response = { id: request.id, error: error instanceof Error ? error.message : String(error) };
+    }
+    parentPort?.postMessage(response);
+  });
+}
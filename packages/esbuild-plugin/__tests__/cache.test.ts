@@ -0,0 +1,96 @@
+/**
+ * @tekton/esbuild-plugin - Violation Cache Tests
+ * [SPEC-STYLED-001] Tests for TAG-006: incremental analysis cache
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { mkdtempSync, rmSync } from 'fs';
+import { tmpdir } from 'os';
+import { join } from 'path';
+import { ViolationCache, hashContent } from '../src/cache.js';
+import { analyzeCode, type Violation } from '../src/analyzer.js';
+
+const STYLED_CODE = `
+  const Card = styled.div\`
+    background: #ffffff;
+    padding: 16px;
+  \`;
+`;
+
+describe('ViolationCache - Content Hashing', () => {
+  it('should produce the same hash for identical content', () => {
+    expect(hashContent(STYLED_CODE)).toBe(hashContent(STYLED_CODE));
+  });
+
+  it('should produce different hashes for different content', () => {
+    expect(hashContent(STYLED_CODE)).not.toBe(hashContent(`${STYLED_CODE}\n`));
+  });
+});
+
+describe('ViolationCache - Lookup', () => {
+  let dir: string;
+
+  beforeEach(() => {
+    dir = mkdtempSync(join(tmpdir(), 'tekton-cache-'));
+  });
+
+  afterEach(() => {
+    rmSync(dir, { recursive: true, force: true });
+  });
+
+  it('should miss for unknown content', async () => {
+    const cache = new ViolationCache(dir);
+    await cache.load();
+
+    expect(cache.get(hashContent(STYLED_CODE), 'a.tsx')).toBeUndefined();
+    expect(cache.misses).toBe(1);
+  });
+
+  it('should return cached violations with the requested file path', async () => {
+    const cache = new ViolationCache(dir);
+    await cache.load();
+
+    const hash = hashContent(STYLED_CODE);
+    cache.set(hash, analyzeCode(STYLED_CODE, 'a.tsx'));
+
+    const cached = cache.get(hash, 'b.tsx') as Violation[];
+    expect(cached).toEqual(analyzeCode(STYLED_CODE, 'b.tsx'));
+    expect(cache.hits).toBe(1);
+  });
+
+  it('should persist entries between instances', async () => {
+    const hash = hashContent(STYLED_CODE);
+    const violations = analyzeCode(STYLED_CODE, 'a.tsx');
+
+    const first = new ViolationCache(dir);
+    await first.load();
+    first.set(hash, violations);
+    await first.save();
+
+    const second = new ViolationCache(dir);
+    await second.load();
+    expect(second.get(hash, 'a.tsx')).toEqual(violations);
+  });
+
+  it('should evict least recently used entries beyond maxEntries', async () => {
+    const cache = new ViolationCache(dir, 2);
+    await cache.load();
+    cache.set('a', []);
+    cache.set('b', []);
+    cache.get('a', 'a.tsx');
+    cache.set('c', []);
+    await cache.save();
+
+    const reloaded = new ViolationCache(dir);
+    await reloaded.load();
+    expect(reloaded.size).toBe(2);
+    expect(reloaded.get('b', 'b.tsx')).toBeUndefined();
+    expect(reloaded.get('a', 'a.tsx')).toEqual([]);
+  });
+
+  it('should start empty when the cache directory does not exist', async () => {
+    const cache = new ViolationCache(join(dir, 'missing'));
+    await cache.load();
+    expect(cache.size).toBe(0);
+  });
+});
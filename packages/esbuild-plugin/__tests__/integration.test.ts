@@ -5,7 +5,13 @@
  */
 
 import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import { existsSync, mkdtempSync, rmSync, writeFileSync } from 'fs';
+import { tmpdir } from 'os';
+import { join } from 'path';
+import { build, context, type Plugin } from 'esbuild';
 import { tektonPlugin } from '../src/index.js';
+import { analyzeCode } from '../src/analyzer.js';
+import { AnalyzerPool } from '../src/worker-pool.js';
 
 // ============================================================================
 // Plugin Configuration
@@ -481,3 +487,183 @@ describe('Integration - Exports', () => {
     expect(true).toBe(true);
   });
 });
+
+// ============================================================================
+// esbuild Builds (cache and worker pool)
+// ============================================================================
+
+const BUTTON_SOURCE = `
+declare const styled: { button: (strings: TemplateStringsArray) => string };
+
+export const Button = styled.button\`
+  color: #ff0000;
+  padding: 12px;
+\`;
+`;
+
+const ENTRY_SOURCE = `
+import { Button } from './button';
+
+declare const styled: { div: (strings: TemplateStringsArray) => string };
+
+export const Card = styled.div\`
+  background: rgb(255, 255, 255);
+\`;
+
+export { Button };
+`;
+
+describe('Integration - esbuild Builds', () => {
+  let dir: string;
+  let entry: string;
+  let report: string[];
+  let logs: string[];
+
+  const buildOptions = (plugin: Plugin) => ({
+    entryPoints: [entry],
+    bundle: true,
+    write: false,
+    logLevel: 'silent' as const,
+    plugins: [plugin],
+  });
+
+  beforeEach(() => {
+    dir = mkdtempSync(join(tmpdir(), 'tekton-build-'));
+    entry = join(dir, 'entry.tsx');
+    writeFileSync(entry, ENTRY_SOURCE);
+    writeFileSync(join(dir, 'button.tsx'), BUTTON_SOURCE);
+
+    report = [];
+    logs = [];
+    vi.spyOn(console, 'error').mockImplementation((message: string) => {
+      report.push(message);
+    });
+    vi.spyOn(console, 'log').mockImplementation((message: string) => {
+      logs.push(message);
+    });
+    vi.spyOn(console, 'warn').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+    rmSync(dir, { recursive: true, force: true });
+  });
+
+  it('should hit the cache for unchanged files across rebuilds', async () => {
+    const plugin = tektonPlugin({ strict: false, verbose: true, cache: join(dir, '.cache') });
+    const ctx = await context(buildOptions(plugin));
+
+    try {
+      await ctx.rebuild();
+      await ctx.rebuild();
+      writeFileSync(join(dir, 'button.tsx'), `${BUTTON_SOURCE}\n// changed\n`);
+      await ctx.rebuild();
+    } finally {
+      await ctx.dispose();
+    }
+
+    expect(logs.filter(line => line.startsWith('[Tekton] Cache:'))).toEqual([
+      '[Tekton] Cache: 0 hit(s), 2 miss(es)',
+      '[Tekton] Cache: 2 hit(s), 0 miss(es)',
+      '[Tekton] Cache: 1 hit(s), 1 miss(es)',
+    ]);
+    // Cached and fresh builds report the same violations
+    expect(report[1]).toBe(report[0]);
+  });
+
+  it('should persist the cache between plugin instances', async () => {
+    const cacheDir = join(dir, '.cache');
+
+    await build(buildOptions(tektonPlugin({ strict: false, verbose: true, cache: cacheDir })));
+    await build(buildOptions(tektonPlugin({ strict: false, verbose: true, cache: cacheDir })));
+
+    expect(logs.filter(line => line.startsWith('[Tekton] Cache:'))).toEqual([
+      '[Tekton] Cache: 0 hit(s), 2 miss(es)',
+      '[Tekton] Cache: 2 hit(s), 0 miss(es)',
+    ]);
+    expect(report[1]).toBe(report[0]);
+  });
+
+  it('should report the same violations with workers as on the main thread', async () => {
+    await build(buildOptions(tektonPlugin({ strict: false })));
+    await build(buildOptions(tektonPlugin({ strict: false, workers: 2 })));
+
+    expect(report).toHaveLength(2);
+    expect(report[1]).toBe(report[0]);
+  });
+
+  it('should fail strict builds the same way with workers', async () => {
+    const inThread = await build(buildOptions(tektonPlugin({ strict: true })));
+    const threaded = await build(buildOptions(tektonPlugin({ strict: true, workers: 2 })));
+
+    expect(inThread.errors.map(error => error.text)).toEqual(
+      threaded.errors.map(error => error.text)
+    );
+  });
+
+  it('should give each build context its own pool and shut it down on dispose', async () => {
+    const terminate = vi.spyOn(AnalyzerPool.prototype, 'terminate');
+    const plugin = tektonPlugin({ strict: false, workers: 2 });
+
+    const first = await context(buildOptions(plugin));
+    await first.rebuild();
+    await first.dispose();
+    expect(terminate).toHaveBeenCalledTimes(1);
+
+    // A second context from the same plugin instance still has a live pool
+    const second = await context(buildOptions(plugin));
+    await second.rebuild();
+    await second.dispose();
+    expect(terminate).toHaveBeenCalledTimes(2);
+
+    expect(report).toHaveLength(2);
+    expect(report[1]).toBe(report[0]);
+  });
+});
+
+// ============================================================================
+// Analyzer Worker Pool
+// ============================================================================
+
+describe('Integration - AnalyzerPool', () => {
+  const code = `
+    const Card = styled.div\`
+      background: #ffffff;
+      padding: 16px;
+    \`;
+  `;
+
+  it('should match analyzeCode results', async () => {
+    const pool = new AnalyzerPool(2);
+    try {
+      const results = await Promise.all([
+        pool.analyze(code, 'a.tsx'),
+        pool.analyze(code, 'b.tsx'),
+        pool.analyze('const value = 1;', 'c.ts'),
+      ]);
+
+      expect(results).toEqual([
+        analyzeCode(code, 'a.tsx'),
+        analyzeCode(code, 'b.tsx'),
+        analyzeCode('const value = 1;', 'c.ts'),
+      ]);
+    } finally {
+      await pool.terminate();
+    }
+  });
+
+  // Worker threads need the compiled worker script (pnpm build)
+  it.runIf(existsSync(new URL('../dist/analyzer-worker.js', import.meta.url)))(
+    'should analyze on worker threads when built',
+    async () => {
+      const { AnalyzerPool: BuiltPool } = await import('../dist/worker-pool.js');
+      const pool = new BuiltPool(2);
+      try {
+        expect(pool.threaded).toBe(true);
+        expect(await pool.analyze(code, 'a.tsx')).toEqual(analyzeCode(code, 'a.tsx'));
+      } finally {
+        await pool.terminate();
+      }
+    }
+  );
+});
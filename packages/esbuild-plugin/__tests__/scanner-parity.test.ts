@@ -0,0 +1,144 @@
+/**
+ * @tekton/esbuild-plugin - Scanner Parity Tests
+ * [SPEC-STYLED-001] Single-pass scanner vs. the original per-pattern regexes
+ * over a generated styled-components corpus
+ *
+ * Throughput is measured by bench-scanner.mjs.
+ */
+
+import { describe, it, expect } from 'vitest';
+import { scanTemplate, suggestSpacingToken } from '../src/scanner.js';
+import { analyzeCode } from '../src/analyzer.js';
+
+const COMPONENT_COUNT = 5000;
+
+/**
+ * Generate a styled template mixing token usage and hardcoded values
+ */
+function generateTemplate(i: number): string {
+  return `
+  display: flex;
+  flex-direction: ${i % 2 === 0 ? 'row' : 'column'};
+  background: ${i % 3 === 0 ? '#ffffff' : '${tokens.bg.surface.default}'};
+  color: ${i % 5 === 0 ? 'rgba(0, 0, 0, 0.87)' : '${tokens.fg.primary}'};
+  padding: ${i % 4 === 0 ? '16px' : '${tokens.spacing[4]}'};
+  margin-top: ${i % 7 === 0 ? `${i % 64}px` : '${tokens.spacing[2]}'};
+  border: 1px solid ${i % 11 === 0 ? 'HSL(210, 20%, 50%)' : '${tokens.border.default}'};
+  width: ${i % 13 === 0 ? '320px' : '100%'}; height: ${i % 17 === 0 ? '48px' : 'auto'};
+  border-radius: \${tokens.radius.md};
+  transition: opacity 150ms ease-in-out;
+`;
+}
+
+function generateCorpus(count: number): string[] {
+  return Array.from({ length: count }, (_, i) => generateTemplate(i));
+}
+
+interface Finding {
+  index: number;
+  type: 'color' | 'spacing';
+  value: string;
+  suggestion: string;
+}
+
+/**
+ * Original analyzer logic: five color regexes and one RegExp per spacing
+ * property, each run over the whole template
+ */
+function baselineScan(css: string): Finding[] {
+  const findings: Finding[] = [];
+  const colorPatterns = [
+    /#[0-9a-fA-F]{3,8}\b/g,
+    /\brgb\s*\([^)]+\)/gi,
+    /\brgba\s*\([^)]+\)/gi,
+    /\bhsl\s*\([^)]+\)/gi,
+    /\bhsla\s*\([^)]+\)/gi,
+  ];
+  for (const regex of colorPatterns) {
+    let match;
+    while ((match = regex.exec(css)) !== null) {
+      findings.push({
+        index: match.index,
+        type: 'color',
+        value: match[0],
+        suggestion: 'tokens.bg.* or tokens.fg.*',
+      });
+    }
+  }
+
+  const spacingProps = ['padding', 'margin', 'gap', 'width', 'height', 'top', 'right', 'bottom', 'left'];
+  for (const prop of spacingProps) {
+    const regex = new RegExp(`${prop}\\s*:\\s*(\\d+)px`, 'gi');
+    let match;
+    while ((match = regex.exec(css)) !== null) {
+      const pxValue = parseInt(match[1]!, 10);
+      findings.push({
+        index: match.index,
+        type: 'spacing',
+        value: `${pxValue}px`,
+        suggestion: suggestSpacingToken(pxValue),
+      });
+    }
+  }
+
+  return findings.sort((a, b) => a.index - b.index);
+}
+
+/**
+ * scanTemplate results as template offsets (undoing the line/column mapping)
+ */
+function scan(css: string): Finding[] {
+  const lineOffsets = [0];
+  for (let i = css.indexOf('\n'); i !== -1; i = css.indexOf('\n', i + 1)) {
+    lineOffsets.push(i + 1);
+  }
+  return scanTemplate(css, 'corpus.tsx', 1, 0).map(v => ({
+    index: lineOffsets[v.line - 1]! + v.column,
+    type: v.type as Finding['type'],
+    value: v.value,
+    suggestion: v.suggestion,
+  }));
+}
+
+describe('Scanner Parity - Generated Corpus', () => {
+  const corpus = generateCorpus(COMPONENT_COUNT);
+
+  it(`should find the same violations as the baseline in ${COMPONENT_COUNT} templates`, () => {
+    let total = 0;
+    for (const template of corpus) {
+      const expected = baselineScan(template);
+      expect(scan(template)).toEqual(expected);
+      total += expected.length;
+    }
+
+    expect(total).toBeGreaterThan(COMPONENT_COUNT);
+  });
+
+  it('should match the baseline on edge cases', () => {
+    for (const css of [
+      'color: RGB(1, 2, 3); background: hsla(0, 0%, 0%, 0.5);',
+      'padding:0px;margin :  24px; gap: 8px',
+      'box-shadow: 0 0 0 #abc, 0 0 0 #AABBCCDD; color: #12;',
+      'top: 4px;\nright: 8px;\n\nbottom: 12px;\r\nleft: 96px;',
+      'max-height: 100px; min-width: 7px; line-height: 20px;',
+      '',
+    ]) {
+      expect(scan(css)).toEqual(baselineScan(css));
+    }
+  });
+
+  it('should report every baseline violation through analyzeCode', () => {
+    const code = corpus
+      .map((template, i) => `export const C${i} = styled.div\`${template}\`;`)
+      .join('\n');
+    const expected = corpus.reduce((sum, template) => sum + baselineScan(template).length, 0);
+
+    const violations = analyzeCode(code, 'corpus.tsx');
+
+    expect(violations).toHaveLength(expected);
+    // Positions come from the source file, so lines increase monotonically
+    for (let i = 1; i < violations.length; i++) {
+      expect(violations[i]!.line).toBeGreaterThanOrEqual(violations[i - 1]!.line);
+    }
+  });
+});
@@ -0,0 +1,88 @@
+/**
+ * @tekton/esbuild-plugin - Scanner Tests
+ * [SPEC-STYLED-001] Tests for TAG-007: single-pass template scanning
+ * REQ-STY-008: Report file location, line number, and violation type
+ */
+
+import { describe, it, expect } from 'vitest';
+import { scanTemplate, suggestSpacingToken } from '../src/scanner.js';
+import { analyzeCode } from '../src/analyzer.js';
+
+// ============================================================================
+// Detection
+// ============================================================================
+
+describe('Scanner - Detection', () => {
+  it('should report colors and spacing in source order', () => {
+    const css = 'padding: 16px; color: #fff; margin: 8px; background: rgba(0, 0, 0, 0.5);';
+    const violations = scanTemplate(css, 'a.tsx', 1, 0);
+
+    expect(violations.map(v => v.value)).toEqual(['16px', '#fff', '8px', 'rgba(0, 0, 0, 0.5)']);
+    expect(violations.map(v => v.type)).toEqual(['spacing', 'color', 'spacing', 'color']);
+  });
+
+  it('should detect hyphenated spacing properties', () => {
+    const css = 'margin-left: 8px; padding-top: 4px; min-width: 20px;';
+    const violations = scanTemplate(css, 'a.tsx', 1, 0);
+
+    expect(violations).toHaveLength(3);
+    expect(violations[0].suggestion).toBe('tokens.spacing[2]');
+  });
+
+  it('should return no violations for token-based templates', () => {
+    const css = 'display: flex; gap: ${tokens.spacing[4]}; color: var(--fg);';
+    expect(scanTemplate(css, 'a.tsx', 1, 0)).toHaveLength(0);
+  });
+
+  it('should be reusable across calls', () => {
+    const css = 'color: #000;';
+    expect(scanTemplate(css, 'a.tsx', 1, 0)).toHaveLength(1);
+    expect(scanTemplate(css, 'a.tsx', 1, 0)).toHaveLength(1);
+  });
+});
+
+// ============================================================================
+// Line and Column Reporting
+// ============================================================================
+
+describe('Scanner - Positions', () => {
+  it('should offset columns on the first line by the base column', () => {
+    const violations = scanTemplate('color: #fff;', 'a.tsx', 5, 10);
+
+    expect(violations[0].line).toBe(5);
+    expect(violations[0].column).toBe(17);
+  });
+
+  it('should advance lines inside multi-line templates', () => {
+    const css = '\n  background: #ffffff;\n\n  padding: 16px;\n';
+    const violations = scanTemplate(css, 'a.tsx', 3, 20);
+
+    expect(violations[0].line).toBe(4);
+    expect(violations[0].column).toBe(14);
+    expect(violations[1].line).toBe(6);
+    expect(violations[1].column).toBe(2);
+  });
+
+  it('should report source lines through analyzeCode', () => {
+    const code = [
+      'const Card = styled.div`',
+      '  background: #ffffff;',
+      '  padding: 16px;',
+      '`;',
+    ].join('\n');
+    const violations = analyzeCode(code, 'test.tsx');
+
+    expect(violations.map(v => v.line)).toEqual([2, 3]);
+    expect(violations.map(v => v.column)).toEqual([14, 2]);
+  });
+});
+
+describe('Scanner - Spacing Suggestions', () => {
+  it('should map scale values to tokens', () => {
+    expect(suggestSpacingToken(16)).toBe('tokens.spacing[4]');
+  });
+
+  it('should flag values outside the scale', () => {
+    expect(suggestSpacingToken(13)).toContain('not in scale');
+  });
+});
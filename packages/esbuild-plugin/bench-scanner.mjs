@@ -0,0 +1,73 @@
+#!/usr/bin/env node
+/**
+ * Template Scanner Benchmark
+ *
+ * Measures scanTemplate and analyzeCode throughput over a generated corpus
+ * of styled components. Requires a build (`pnpm build`) before running.
+ *
+ * Usage: node bench-scanner.mjs [count]
+ *   node bench-scanner.mjs          # 5000 components
+ *   node bench-scanner.mjs 20000    # custom size
+ */
+
+import { scanTemplate } from './dist/scanner.js';
+import { analyzeCode } from './dist/analyzer.js';
+
+const COMPONENT_COUNT = Number(process.argv[2]) || 5000;
+const ROUNDS = 5;
+
+/**
+ * Generate a styled template mixing token usage and hardcoded values
+ */
+function generateTemplate(i) {
+  return `
+  display: flex;
+  flex-direction: ${i % 2 === 0 ? 'row' : 'column'};
+  background: ${i % 3 === 0 ? '#ffffff' : '${tokens.bg.surface.default}'};
+  color: ${i % 5 === 0 ? 'rgba(0, 0, 0, 0.87)' : '${tokens.fg.primary}'};
+  padding: ${i % 4 === 0 ? '16px' : '${tokens.spacing[4]}'};
+  margin-top: ${i % 7 === 0 ? `${i % 64}px` : '${tokens.spacing[2]}'};
+  border-radius: \${tokens.radius.md};
+  transition: opacity 150ms ease-in-out;
+`;
+}
+
+function megabytes(strings) {
+  return strings.reduce((sum, s) => sum + Buffer.byteLength(s), 0) / (1024 * 1024);
+}
+
+/**
+ * Best of ROUNDS runs, in seconds
+ */
+function best(fn) {
+  let result;
+  let fastest = Infinity;
+  for (let round = 0; round < ROUNDS; round++) {
+    const start = performance.now();
+    result = fn();
+    fastest = Math.min(fastest, (performance.now() - start) / 1000);
+  }
+  return { result, seconds: fastest };
+}
+
+const corpus = Array.from({ length: COMPONENT_COUNT }, (_, i) => generateTemplate(i));
+const corpusMB = megabytes(corpus);
+
+const scan = best(() =>
+  corpus.reduce((found, template) => found + scanTemplate(template, 'bench.tsx', 1, 0).length, 0)
+);
+console.log(
+  `scanTemplate: ${COMPONENT_COUNT} templates, ${corpusMB.toFixed(2)} MB, ` +
+    `${(corpusMB / scan.seconds).toFixed(1)} MB/s, ${scan.result} violations`
+);
+
+const code = corpus
+  .map((template, i) => `export const C${i} = styled.div\`${template}\`;`)
+  .join('\n');
+const codeMB = megabytes([code]);
+
+const analyze = best(() => analyzeCode(code, 'bench.tsx').length);
+console.log(
+  `analyzeCode:  ${codeMB.toFixed(2)} MB, ${(codeMB / analyze.seconds).toFixed(1)} MB/s, ` +
+    `${analyze.result} violations`
+);
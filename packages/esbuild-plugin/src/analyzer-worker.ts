@@ -0,0 +1,11 @@
+/**
+ * @tekton/esbuild-plugin - Analyzer Worker
+ * [SPEC-STYLED-001] [TAG-007]
+ * worker_threads entry point that runs analyzeCode off the main thread
+ */
+
+import { serveWorkerJobs } from '@tekton/core/worker-pool';
+import { analyzeCode, type Violation } from './analyzer.js';
+import type { AnalyzeJob } from './worker-pool.js';
+
+serveWorkerJobs<AnalyzeJob, Violation[]>(job => analyzeCode(job.code, job.filename));
@@ -0,0 +1,150 @@
+/**
+ * @tekton/esbuild-plugin - Violation Cache
+ * [SPEC-STYLED-001] [TAG-006]
+ * Persistent, content-hash keyed cache of analyzer results
+ */
+
+import { createHash } from 'crypto';
+import { mkdir, readFile, rename, writeFile } from 'fs/promises';
+import { join } from 'path';
+import type { Violation } from './analyzer.js';
+
+/**
+ * Bump whenever analyzer output changes for the same input,
+ * so stale cache files are discarded instead of reused.
+ */
+export const CACHE_VERSION = 2;
+
+export const DEFAULT_CACHE_DIR = join('node_modules', '.cache', 'tekton-esbuild-plugin');
+
+const CACHE_FILE = 'violations.json';
+const DEFAULT_MAX_ENTRIES = 20000;
+
+/**
+ * Violation without the file path; the path is re-attached on lookup so
+ * identical files share one cache entry.
+ */
+type CachedViolation = Omit<Violation, 'file'>;
+
+interface CacheFile {
+  version: number;
+  entries: Record<string, CachedViolation[]>;
+}
+
+/**
+ * Hash file contents for cache lookup
+ */
+export function hashContent(code: string): string {
+  return createHash('sha1').update(code).digest('hex');
+}
+
+/**
+ * Content-hash keyed violation cache persisted between builds
+ * Entries are kept in LRU order and trimmed to maxEntries on save.
+ */
+export class ViolationCache {
+  private readonly filePath: string;
+  private readonly maxEntries: number;
+  private entries = new Map<string, CachedViolation[]>();
+  private loading: Promise<void> | null = null;
+  private dirty = false;
+
+  hits = 0;
+  misses = 0;
+
+  constructor(private readonly dir: string = DEFAULT_CACHE_DIR, maxEntries = DEFAULT_MAX_ENTRIES) {
+    this.filePath = join(dir, CACHE_FILE);
+    this.maxEntries = maxEntries;
+  }
+
+  /**
+   * Load the cache file once; missing or incompatible files start empty
+   */
+  load(): Promise<void> {
+    if (!this.loading) {
+      this.loading = this.readFromDisk();
+    }
+    return this.loading;
+  }
+
+  /**
+   * Look up cached violations for a file by content hash
+   */
+  get(hash: string, file: string): Violation[] | undefined {
+    const cached = this.entries.get(hash);
+    if (!cached) {
+      this.misses++;
+      return undefined;
+    }
+
+    this.hits++;
+    // Refresh LRU position
+    this.entries.delete(hash);
+    this.entries.set(hash, cached);
+
+    return cached.map(v => ({ ...v, file }));
+  }
+
+  /**
+   * Store analyzer results for a content hash
+   */
+  set(hash: string, violations: Violation[]): void {
+    this.entries.delete(hash);
+    this.entries.set(
+      hash,
+      violations.map(({ file: _file, ...rest }) => rest)
+    );
+    this.dirty = true;
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  /**
+   * Write the cache to disk if it changed since the last save
+   */
+  async save(): Promise<void> {
+    if (!this.dirty) {
+      return;
+    }
+
+    while (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next().value as string;
+      this.entries.delete(oldest);
+    }
+
+    const data: CacheFile = {
+      version: CACHE_VERSION,
+      entries: Object.fromEntries(this.entries),
+    };
+
+    try {
+      await mkdir(this.dir, { recursive: true });
+      // Write-then-rename so concurrent builds never read a partial file
+      const tmpPath = `${this.filePath}.${process.pid}.tmp`;
+      await writeFile(tmpPath, JSON.stringify(data), 'utf8');
+      await rename(tmpPath, this.filePath);
+      this.dirty = false;
+    } catch (error) {
+      console.warn(`[Tekton] Failed to write cache ${this.filePath}:`, (error as Error).message);
+    }
+  }
+
+  private async readFromDisk(): Promise<void> {
+    try {
+      const data = JSON.parse(await readFile(this.filePath, 'utf8')) as CacheFile;
+      if (data.version === CACHE_VERSION && data.entries) {
+        // Keep entries added before the load finished (most recent last)
+        const current = this.entries;
+        this.entries = new Map(Object.entries(data.entries));
+        for (const [hash, violations] of current) {
+          this.entries.delete(hash);
+          this.entries.set(hash, violations);
+        }
+      }
+    } catch {
+      // No cache yet or unreadable cache: start empty
+    }
+  }
+}
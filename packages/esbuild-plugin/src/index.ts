@@ -8,6 +8,8 @@
 import type { Plugin } from 'esbuild';
 import { analyzeCode, type Violation } from './analyzer.js';
 import { generateReport, calculateCompliance } from './reporter.js';
+import { DEFAULT_CACHE_DIR, ViolationCache, hashContent } from './cache.js';
+import { AnalyzerPool, defaultPoolSize } from './worker-pool.js';
 
 export interface TektonPluginOptions {
   /**
@@ -42,6 +44,21 @@ export interface TektonPluginOptions {
    * Enable verbose logging
    */
   verbose?: boolean;
+
+  /**
+   * Persist analyzer results on disk, keyed by file content hash, so
+   * unchanged files skip parsing across builds and watch rebuilds.
+   * `true` uses node_modules/.cache/tekton-esbuild-plugin, a string sets the directory.
+   * (default: false)
+   */
+  cache?: boolean | string;
+
+  /**
+   * Analyze files on a worker_threads pool.
+   * `true` sizes the pool to the CPU count, a number sets the pool size.
+   * (default: false - analyze on the main thread)
+   */
+  workers?: boolean | number;
 }
 
 const DEFAULT_INCLUDE = [/\.tsx?$/];
@@ -52,7 +69,6 @@ const DEFAULT_EXCLUDE = [/node_modules/, /\.test\.tsx?$/, /\.spec\.tsx?$/, /__te
  * REQ-STY-006: Build validation
  */
 export function tektonPlugin(options: TektonPluginOptions = {}): Plugin {
-  const violations: Violation[] = [];
   // Handle null/undefined options
   const opts = options || {};
   const {
@@ -62,11 +78,24 @@ export function tektonPlugin(options: TektonPluginOptions = {}): Plugin {
     threshold = 100,
     reportPath,
     verbose = false,
+    cache = false,
+    workers = false,
   } = opts;
 
+  const violationCache = cache
+    ? new ViolationCache(typeof cache === 'string' ? cache : DEFAULT_CACHE_DIR)
+    : null;
+  const poolSize = workers === true ? defaultPoolSize() : typeof workers === 'number' ? workers : 0;
+
   return {
     name: 'tekton-token-validator',
     setup(build) {
+      // One pool per build context, so disposing one context never affects
+      // another context created from the same plugin instance
+      const pool = poolSize > 0 ? new AnalyzerPool(poolSize) : null;
+      // Violations per file for the current build; cleared after each
+      // report so watch-mode rebuilds don't accumulate stale entries
+      const violationsByFile = new Map<string, Violation[]>();
       // Track analyzed files
       let filesAnalyzed = 0;
 
@@ -81,8 +110,8 @@ export function tektonPlugin(options: TektonPluginOptions = {}): Plugin {
         const fs = await import('fs/promises');
         const code = await fs.readFile(args.path, 'utf8');
 
-        const fileViolations = analyzeCode(code, args.path);
-        violations.push(...fileViolations);
+        const fileViolations = await analyzeFile(code, args.path, pool);
+        violationsByFile.set(args.path, fileViolations);
 
         filesAnalyzed++;
 
@@ -95,10 +124,25 @@ export function tektonPlugin(options: TektonPluginOptions = {}): Plugin {
       });
 
       // Report results at build end
-      build.onEnd(result => {
+      build.onEnd(async result => {
+        const violations = [...violationsByFile.values()].flat();
+        violationsByFile.clear();
+
         if (filesAnalyzed === 0 && verbose) {
           console.log('[Tekton] No files were analyzed. Check include/exclude patterns.');
         }
+        filesAnalyzed = 0;
+
+        if (violationCache) {
+          await violationCache.save();
+          if (verbose) {
+            console.log(
+              `[Tekton] Cache: ${violationCache.hits} hit(s), ${violationCache.misses} miss(es)`
+            );
+          }
+          violationCache.hits = 0;
+          violationCache.misses = 0;
+        }
 
         if (violations.length > 0) {
           const report = generateReport(violations);
@@ -131,8 +175,40 @@ export function tektonPlugin(options: TektonPluginOptions = {}): Plugin {
           console.log('✅ [Tekton] Token compliance: 100% - No violations found');
         }
       });
+
+      // Release worker threads when the build context is disposed
+      build.onDispose?.(() => {
+        void pool?.terminate();
+      });
     },
   };
+
+  /**
+   * Analyze a file, consulting the cache and worker pool when enabled
+   */
+  async function analyzeFile(
+    code: string,
+    path: string,
+    pool: AnalyzerPool | null
+  ): Promise<Violation[]> {
+    let hash: string | undefined;
+    if (violationCache) {
+      await violationCache.load();
+      hash = hashContent(code);
+      const cached = violationCache.get(hash, path);
+      if (cached) {
+        return cached;
+      }
+    }
+
+    const fileViolations = pool ? await pool.analyze(code, path) : analyzeCode(code, path);
+
+    if (violationCache && hash) {
+      violationCache.set(hash, fileViolations);
+    }
+
+    return fileViolations;
+  }
 }
 
 /**
@@ -158,3 +234,5 @@ function shouldProcess(path: string, include: RegExp[], exclude: RegExp[]): bool
 
 export default tektonPlugin;
 export type { Violation } from './analyzer.js';
+export { ViolationCache, hashContent } from './cache.js';
+export { AnalyzerPool } from './worker-pool.js';
@@ -0,0 +1,100 @@
+/**
+ * @tekton/esbuild-plugin - Template Scanner
+ * [SPEC-STYLED-001] [TAG-007]
+ * Single-pass detection of hardcoded values in styled templates
+ */
+
+import type { Violation } from './analyzer.js';
+
+const COLOR_SUGGESTION = 'tokens.bg.* or tokens.fg.*';
+
+/**
+ * Combined matcher, compiled once and reused for every template
+ * Group 1: hex color (REQ-STY-015)
+ * Group 2: rgb()/rgba()/hsl()/hsla() color (REQ-STY-015)
+ * Group 3: pixel value of a spacing property (REQ-STY-016)
+ */
+const VIOLATION_PATTERN =
+  /(#[0-9a-fA-F]{3,8}\b)|(\b(?:rgba?|hsla?)\s*\([^)]+\))|(?:padding|margin|gap|width|height|top|right|bottom|left)\s*:\s*(\d+)px/gi;
+
+/**
+ * Scan a template string for hardcoded color and spacing values
+ * Reads the string once and reports violations in source order, with
+ * line/column adjusted for newlines inside multi-line templates.
+ * REQ-STY-008: Report file location, line number, and violation type
+ */
+export function scanTemplate(
+  css: string,
+  file: string,
+  baseLine: number,
+  baseColumn: number
+): Violation[] {
+  const violations: Violation[] = [];
+  const regex = VIOLATION_PATTERN;
+  regex.lastIndex = 0;
+
+  // Incremental line tracking: matches arrive in ascending order
+  let line = baseLine;
+  let lineStart = 0;
+
+  let match: RegExpExecArray | null;
+  while ((match = regex.exec(css)) !== null) {
+    const index = match.index;
+
+    let newline = css.indexOf('\n', lineStart);
+    while (newline !== -1 && newline < index) {
+      line++;
+      lineStart = newline + 1;
+      newline = css.indexOf('\n', lineStart);
+    }
+
+    const column = line === baseLine ? baseColumn + index : index - lineStart;
+
+    if (match[3] !== undefined) {
+      const pxValue = parseInt(match[3], 10);
+      violations.push({
+        file,
+        line,
+        column,
+        type: 'spacing',
+        value: `${pxValue}px`,
+        suggestion: suggestSpacingToken(pxValue),
+      });
+    } else {
+      violations.push({
+        file,
+        line,
+        column,
+        type: 'color',
+        value: match[0],
+        suggestion: COLOR_SUGGESTION,
+      });
+    }
+  }
+
+  return violations;
+}
+
+const SPACING_SCALE: Record<number, string> = {
+  0: 'tokens.spacing[0]',
+  4: 'tokens.spacing[1]',
+  8: 'tokens.spacing[2]',
+  12: 'tokens.spacing[3]',
+  16: 'tokens.spacing[4]',
+  20: 'tokens.spacing[5]',
+  24: 'tokens.spacing[6]',
+  32: 'tokens.spacing[8]',
+  40: 'tokens.spacing[10]',
+  48: 'tokens.spacing[12]',
+  64: 'tokens.spacing[16]',
+  80: 'tokens.spacing[20]',
+  96: 'tokens.spacing[24]',
+};
+
+/**
+ * Suggest appropriate spacing token
+ * REQ-STY-019: Provide auto-fix suggestions
+ */
+export function suggestSpacingToken(px: number): string {
+  return SPACING_SCALE[px] || `tokens.spacing[?] (${px}px not in scale)`;
+}
@@ -0,0 +1,62 @@
+/**
+ * @tekton/esbuild-plugin - Analyzer Worker Pool
+ * [SPEC-STYLED-001] [TAG-006]
+ * Spreads analyzeCode calls across a fixed pool of worker threads
+ */
+
+import { existsSync } from 'fs';
+import { fileURLToPath } from 'url';
+import { WorkerPool, defaultWorkerPoolSize } from '@tekton/core/worker-pool';
+import { analyzeCode, type Violation } from './analyzer.js';
+
+export interface AnalyzeJob {
+  code: string;
+  filename: string;
+}
+
+const WORKER_URL = new URL('./analyzer-worker.js', import.meta.url);
+
+/**
+ * Default pool size: one worker per available CPU
+ */
+export function defaultPoolSize(): number {
+  return defaultWorkerPoolSize();
+}
+
+/**
+ * Fixed-size worker pool for analyzer jobs
+ * Workers start lazily on first use and are unref'd so an idle pool
+ * never keeps the process alive. When the compiled worker script is not
+ * available (e.g. running from TypeScript sources), code is analyzed on
+ * the calling thread instead.
+ */
+export class AnalyzerPool {
+  private readonly pool: WorkerPool<AnalyzeJob, Violation[]> | null;
+
+  constructor(size: number = defaultPoolSize()) {
+    this.pool = existsSync(fileURLToPath(WORKER_URL))
+      ? new WorkerPool(WORKER_URL, { size, name: '[Tekton] Analyzer pool' })
+      : null;
+  }
+
+  /**
+   * Whether jobs run on worker threads
+   */
+  get threaded(): boolean {
+    return this.pool !== null;
+  }
+
+  /**
+   * Analyze code on a worker thread
+   */
+  async analyze(code: string, filename: string): Promise<Violation[]> {
+    return this.pool ? this.pool.run({ code, filename }) : analyzeCode(code, filename);
+  }
+
+  /**
+   * Stop all workers and reject pending jobs
+   */
+  async terminate(): Promise<void> {
+    await this.pool?.terminate();
+  }
+}
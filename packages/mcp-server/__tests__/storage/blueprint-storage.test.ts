@@ -4,7 +4,7 @@
  */
 
 import { describe, it, expect, beforeEach, afterEach } from 'vitest';
-import { rmSync, existsSync } from 'fs';
+import { rmSync, existsSync, mkdirSync, readFileSync } from 'fs';
 import { BlueprintStorage } from '../../src/storage/blueprint-storage.js';
 import type { Blueprint } from '@tekton/core';
 
@@ -188,3 +188,209 @@ describe('BlueprintStorage', () => {
     });
   });
 });
+
+describe('BlueprintStorage - index, cache and TTL', () => {
+  const testStorageDir = '.tekton-test/storage-index';
+  let storage: BlueprintStorage;
+
+  const makeBlueprint = (themeId: string, name = 'Test Blueprint'): Blueprint => ({
+    id: 'test-bp',
+    name,
+    themeId,
+    layout: 'single-column',
+    components: [],
+  });
+
+  beforeEach(() => {
+    rmSync(testStorageDir, { recursive: true, force: true });
+    storage = new BlueprintStorage({ baseDir: testStorageDir, sweepIntervalMs: 0 });
+  });
+
+  afterEach(async () => {
+    await storage.close();
+    rmSync(testStorageDir, { recursive: true, force: true });
+  });
+
+  it('should append saved blueprints to the index', async () => {
+    const id = await storage.saveBlueprint(makeBlueprint('theme-a'));
+    await storage.close();
+
+    const index = readFileSync(`${testStorageDir}/index.jsonl`, 'utf-8');
+    expect(index).toContain(id);
+  });
+
+  it('should list blueprints by themeId', async () => {
+    const a = await storage.saveBlueprint(makeBlueprint('theme-a'));
+    await storage.saveBlueprint(makeBlueprint('theme-b'));
+    const c = await storage.saveBlueprint(makeBlueprint('theme-a'));
+
+    const listed = await storage.listBlueprints({ themeId: 'theme-a' });
+    expect(listed.map(m => m.timestamp).sort()).toEqual([a, c].sort());
+  });
+
+  it('should filter listings by createdAt range and limit', async () => {
+    await storage.saveBlueprint(makeBlueprint('theme-a'));
+    await storage.saveBlueprint(makeBlueprint('theme-a'));
+
+    expect(await storage.listBlueprints({ createdAfter: new Date(Date.now() + 60_000) })).toEqual(
+      []
+    );
+    expect(await storage.listBlueprints({ limit: 1 })).toHaveLength(1);
+  });
+
+  it('should reload the index in a new instance', async () => {
+    const id = await storage.saveBlueprint(makeBlueprint('theme-a', 'Persisted'));
+    await storage.close();
+
+    const reopened = new BlueprintStorage({ baseDir: testStorageDir, sweepIntervalMs: 0 });
+    expect((await reopened.loadBlueprint(id))?.name).toBe('Persisted');
+    expect((await reopened.listBlueprints({ themeId: 'theme-a' })).length).toBe(1);
+    await reopened.close();
+  });
+
+  it('should rebuild a missing index from blueprint directories', async () => {
+    const id = await storage.saveBlueprint(makeBlueprint('theme-a'));
+    await storage.close();
+    rmSync(`${testStorageDir}/index.jsonl`);
+
+    const reopened = new BlueprintStorage({ baseDir: testStorageDir, sweepIntervalMs: 0 });
+    expect(await reopened.blueprintExists(id)).toBe(true);
+    await reopened.close();
+  });
+
+  it('should serve recently used blueprints from the LRU cache', async () => {
+    const id = await storage.saveBlueprint(makeBlueprint('theme-a', 'Cached'));
+    rmSync(`${storage.getBlueprintDir(id)}/blueprint.json`);
+
+    expect((await storage.loadBlueprint(id))?.name).toBe('Cached');
+  });
+
+  it('should save and load in bulk preserving order', async () => {
+    const ids = await storage.saveBlueprints([
+      makeBlueprint('theme-a', 'one'),
+      makeBlueprint('theme-b', 'two'),
+      makeBlueprint('theme-c', 'three'),
+    ]);
+
+    const loaded = await storage.loadBlueprints([...ids, 'bp-1-missing']);
+    expect(loaded.map(bp => bp?.name ?? null)).toEqual(['one', 'two', 'three', null]);
+  });
+
+  it('should delete blueprints', async () => {
+    const id = await storage.saveBlueprint(makeBlueprint('theme-a'));
+
+    expect(await storage.deleteBlueprint(id)).toBe(true);
+    expect(await storage.blueprintExists(id)).toBe(false);
+    expect(existsSync(storage.getBlueprintDir(id))).toBe(false);
+    expect(await storage.deleteBlueprint(id)).toBe(false);
+  });
+
+  it('should sweep expired blueprints', async () => {
+    const id = await storage.saveBlueprint(makeBlueprint('theme-a'));
+    const metadata = await storage.loadMetadata(id);
+
+    const removed = await storage.sweepExpired(metadata!.ttl + 1);
+
+    expect(removed).toBe(1);
+    expect(existsSync(storage.getBlueprintDir(id))).toBe(false);
+    expect(await storage.listBlueprints()).toEqual([]);
+  });
+
+  it('should find blueprints saved by another process', async () => {
+    await storage.listBlueprints();
+
+    const other = new BlueprintStorage({ baseDir: testStorageDir, sweepIntervalMs: 0 });
+    const id = await other.saveBlueprint(makeBlueprint('theme-a', 'From other'));
+    await other.close();
+
+    expect((await storage.loadBlueprint(id))?.name).toBe('From other');
+    expect(await storage.blueprintExists(id)).toBe(true);
+  });
+
+  it('should list blueprints saved and deleted by another process', async () => {
+    const own = await storage.saveBlueprint(makeBlueprint('theme-a'));
+    expect(await storage.listBlueprints()).toHaveLength(1);
+
+    const other = new BlueprintStorage({ baseDir: testStorageDir, sweepIntervalMs: 0 });
+    const foreign = await other.saveBlueprint(makeBlueprint('theme-b'));
+    await other.deleteBlueprint(own);
+    await other.close();
+
+    const listed = await storage.listBlueprints();
+    expect(listed.map(m => m.timestamp)).toEqual([foreign]);
+    expect((await storage.listBlueprints({ themeId: 'theme-b' })).length).toBe(1);
+  });
+
+  it('should reload an index compacted by another process', async () => {
+    const first = await storage.saveBlueprint(makeBlueprint('theme-a'));
+    const second = await storage.saveBlueprint(makeBlueprint('theme-a'));
+    await storage.listBlueprints();
+
+    const other = new BlueprintStorage({ baseDir: testStorageDir, sweepIntervalMs: 0 });
+    await other.deleteBlueprint(first);
+    (other as unknown as { indexRecords: number }).indexRecords = 4096;
+    await other.sweepExpired();
+    await other.close();
+
+    const listed = await storage.listBlueprints();
+    expect(listed.map(m => m.timestamp)).toEqual([second]);
+  });
+
+  it('should not let callers change cached blueprints', async () => {
+    const blueprint = makeBlueprint('theme-a', 'Original');
+    const id = await storage.saveBlueprint(blueprint);
+    blueprint.name = 'Changed after save';
+
+    const loaded = await storage.loadBlueprint(id);
+    expect(loaded?.name).toBe('Original');
+    loaded!.name = 'Changed after load';
+    loaded!.components.push({ type: 'Text', props: {} } as Blueprint['components'][number]);
+
+    const again = await storage.loadBlueprint(id);
+    expect(again?.name).toBe('Original');
+    expect(again?.components).toEqual([]);
+  });
+
+  it('should recover from a failed index append', async () => {
+    await storage.listBlueprints();
+    rmSync(`${testStorageDir}/index.jsonl`, { force: true });
+    mkdirSync(`${testStorageDir}/index.jsonl`);
+
+    await expect(storage.saveBlueprint(makeBlueprint('theme-a'))).rejects.toThrow();
+    expect(await storage.listBlueprints()).toEqual([]);
+
+    rmSync(`${testStorageDir}/index.jsonl`, { recursive: true });
+    const id = await storage.saveBlueprint(makeBlueprint('theme-a'));
+    expect(await storage.blueprintExists(id)).toBe(true);
+  });
+
+  it('should keep other processes\' entries when compacting the index', async () => {
+    const own = await storage.saveBlueprint(makeBlueprint('theme-a'));
+
+    const other = new BlueprintStorage({ baseDir: testStorageDir, sweepIntervalMs: 0 });
+    const foreign = await other.saveBlueprint(makeBlueprint('theme-b'));
+    await other.close();
+
+    // Force compaction on the next sweep
+    (storage as unknown as { indexRecords: number }).indexRecords = 4096;
+    await storage.sweepExpired();
+    await storage.close();
+
+    const reopened = new BlueprintStorage({ baseDir: testStorageDir, sweepIntervalMs: 0 });
+    const listed = await reopened.listBlueprints();
+    expect(listed.map(m => m.timestamp).sort()).toEqual([own, foreign].sort());
+    await reopened.close();
+  });
+
+  it('should not return blueprints past their TTL', async () => {
+    const expiring = new BlueprintStorage({
+      baseDir: testStorageDir,
+      ttlDays: -1,
+      sweepIntervalMs: 0,
+    });
+    const id = await expiring.saveBlueprint(makeBlueprint('theme-a'));
+
+    expect(await expiring.loadBlueprint(id)).toBeNull();
+    await expiring.close();
+  });
+});
@@ -0,0 +1,120 @@
+/**
+ * Export Batch Tool Tests
+ * Parallel batch export with shared theme CSS and streamed results
+ */
+
+import { describe, it, expect } from 'vitest';
+import { exportBatchTool } from '../../src/tools/export-batch.js';
+import { exportScreenTool } from '../../src/tools/export-screen.js';
+import { generateBlueprintTool } from '../../src/tools/generate-blueprint.js';
+import type { ExportBatchItem } from '../../src/schemas/mcp-schemas.js';
+
+async function makeBlueprint(description: string) {
+  const genResult = await generateBlueprintTool({
+    description,
+    layout: 'single-column',
+    themeId: 'classic-magazine-v1',
+  });
+  expect(genResult.success).toBe(true);
+  return genResult.blueprint!;
+}
+
+const screenDefinition = {
+  id: 'batch-screen',
+  name: 'Batch Screen',
+  shell: 'shell.web.dashboard',
+  page: 'page.dashboard',
+  sections: [
+    {
+      id: 'header',
+      pattern: 'section.container',
+      components: [{ type: 'Heading', props: { level: 1, children: 'Batch' } }],
+    },
+  ],
+};
+
+describe('exportBatchTool', () => {
+  it('should export stored blueprints, inline blueprints and screens in batch order', async () => {
+    const stored = await makeBlueprint('Stored screen for batch export');
+    const inline = await makeBlueprint('Inline screen for batch export');
+
+    const result = await exportBatchTool({
+      blueprintIds: [stored.id],
+      blueprints: [inline],
+      screenDefinitions: [screenDefinition],
+      format: 'tsx',
+    });
+
+    expect(result.success).toBe(true);
+    expect(result.results!.map(item => [item.index, item.kind, item.id])).toEqual([
+      [0, 'blueprint', stored.id],
+      [1, 'blueprint', inline.id],
+      [2, 'screen', 'batch-screen'],
+    ]);
+    expect(result.stats).toMatchObject({ total: 3, succeeded: 3, failed: 0 });
+  });
+
+  it('should produce the same code as export-screen', async () => {
+    const blueprint = await makeBlueprint('Batch parity test screen');
+
+    const single = await exportScreenTool({ blueprint, format: 'vue' });
+    const batch = await exportBatchTool({ blueprints: [blueprint], format: 'vue' });
+
+    expect(batch.results![0]!.code).toBe(single.code);
+  });
+
+  it('should report missing blueprints without failing the rest', async () => {
+    const blueprint = await makeBlueprint('Batch partial failure screen');
+
+    const result = await exportBatchTool({
+      blueprintIds: ['bp-1-missing', blueprint.id],
+    });
+
+    expect(result.success).toBe(false);
+    expect(result.results![0]).toMatchObject({
+      success: false,
+      error: 'Blueprint not found: bp-1-missing',
+    });
+    expect(result.results![1]!.success).toBe(true);
+    expect(result.stats).toMatchObject({ total: 2, succeeded: 1, failed: 1 });
+  });
+
+  it('should generate theme CSS once per theme', async () => {
+    const blueprints = await Promise.all([
+      makeBlueprint('Shared theme screen one'),
+      makeBlueprint('Shared theme screen two'),
+    ]);
+
+    const result = await exportBatchTool({ blueprints, includeCSS: true });
+
+    expect(Object.keys(result.css!)).toEqual(['classic-magazine-v1']);
+    expect(result.css!['classic-magazine-v1']).toContain(':root');
+    expect(result.results!.every(item => item.themeId === 'classic-magazine-v1')).toBe(true);
+  });
+
+  it('should stream each result as it completes', async () => {
+    const blueprints = await Promise.all(
+      Array.from({ length: 5 }, (_, i) => makeBlueprint(`Streamed batch screen ${i}`))
+    );
+    const streamed: Array<[ExportBatchItem, number, number]> = [];
+
+    const result = await exportBatchTool({ blueprints, concurrency: 2 }, (item, completed, total) => {
+      streamed.push([item, completed, total]);
+    });
+
+    expect(streamed.map(([, completed]) => completed)).toEqual([1, 2, 3, 4, 5]);
+    expect(streamed.every(([, , total]) => total === 5)).toBe(true);
+    expect(streamed.map(([item]) => item.index).sort()).toEqual([0, 1, 2, 3, 4]);
+    expect(result.results).toHaveLength(5);
+  });
+
+  it('should not fail the batch when the result handler throws', async () => {
+    const blueprint = await makeBlueprint('Throwing handler screen');
+
+    const result = await exportBatchTool({ blueprints: [blueprint] }, () => {
+      throw new Error('handler failed');
+    });
+
+    expect(result.success).toBe(true);
+  });
+});
@@ -0,0 +1,39 @@
+/**
+ * Stats Tool Tests
+ * Tool latency, cache, theme registry and export pool statistics
+ */
+
+import { describe, it, expect, beforeEach } from 'vitest';
+import { getThemeRegistry, loadTheme } from '@tekton/core';
+import { statsTool } from '../../src/tools/stats.js';
+import { recordToolCall, resetToolStats } from '../../src/utils/metrics.js';
+
+describe('statsTool', () => {
+  beforeEach(() => {
+    resetToolStats();
+    getThemeRegistry().resetStats();
+  });
+
+  it('should report tool, theme registry and export pool statistics', async () => {
+    recordToolCall('list-themes', 2);
+    loadTheme('classic-magazine-v1');
+
+    const result = await statsTool();
+
+    expect(result.success).toBe(true);
+    expect(result.tools!.map(stats => stats.tool)).toEqual(['list-themes']);
+    expect(result.themeRegistry!.requests).toBeGreaterThan(0);
+    expect(result.exportPool).toMatchObject({ busy: 0, queued: 0 });
+  });
+
+  it('should reset tool and theme registry statistics', async () => {
+    recordToolCall('list-themes', 2);
+    loadTheme('classic-magazine-v1');
+
+    await statsTool({ reset: true });
+    const result = await statsTool();
+
+    expect(result.tools).toEqual([]);
+    expect(result.themeRegistry!.requests).toBe(0);
+  });
+});
@@ -0,0 +1,122 @@
+/**
+ * Metrics Utility Tests
+ * Per-tool latency histograms and counters
+ */
+
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
+import {
+  LATENCY_BUCKETS_MS,
+  getToolStats,
+  logToolStats,
+  measureTool,
+  recordToolCall,
+  resetToolStats,
+} from '../../src/utils/metrics.js';
+
+describe('metrics utility', () => {
+  beforeEach(() => {
+    resetToolStats();
+  });
+
+  describe('recordToolCall()', () => {
+    it('should count calls, errors and latency per tool', () => {
+      recordToolCall('export-screen', 4);
+      recordToolCall('export-screen', 8, false);
+      recordToolCall('list-themes', 1);
+
+      const [exportStats, listStats] = getToolStats();
+
+      expect(exportStats).toMatchObject({
+        tool: 'export-screen',
+        calls: 2,
+        errors: 1,
+        totalMs: 12,
+        minMs: 4,
+        maxMs: 8,
+        meanMs: 6,
+      });
+      expect(listStats).toMatchObject({ tool: 'list-themes', calls: 1, errors: 0 });
+    });
+
+    it('should fill histogram buckets by upper bound', () => {
+      recordToolCall('stats', 0.5);
+      recordToolCall('stats', 1);
+      recordToolCall('stats', 7);
+      recordToolCall('stats', 60_000);
+
+      const { histogram } = getToolStats()[0]!;
+
+      expect(histogram).toHaveLength(LATENCY_BUCKETS_MS.length + 1);
+      expect(histogram[0]).toEqual({ le: 1, count: 2 });
+      expect(histogram.find(bucket => bucket.le === 10)!.count).toBe(1);
+      expect(histogram[histogram.length - 1]).toEqual({ le: null, count: 1 });
+    });
+
+    it('should estimate percentiles from the histogram', () => {
+      for (let ms = 1; ms <= 100; ms++) {
+        recordToolCall('export-batch', ms);
+      }
+
+      const stats = getToolStats()[0]!;
+
+      expect(stats.p50Ms).toBe(50);
+      expect(stats.p95Ms).toBe(100);
+      expect(stats.p99Ms).toBe(100);
+    });
+
+    it('should cap percentiles at the slowest call', () => {
+      recordToolCall('list_tokens', 3);
+
+      expect(getToolStats()[0]!.p99Ms).toBe(3);
+    });
+  });
+
+  describe('measureTool()', () => {
+    it('should record successful calls and return the result', async () => {
+      const result = await measureTool('generate_screen', async () => 'done');
+
+      expect(result).toBe('done');
+      expect(getToolStats()[0]).toMatchObject({ calls: 1, errors: 0 });
+    });
+
+    it('should record rejections as errors and rethrow', async () => {
+      await expect(
+        measureTool('generate_screen', async () => {
+          throw new Error('boom');
+        })
+      ).rejects.toThrow('boom');
+
+      expect(getToolStats()[0]).toMatchObject({ calls: 1, errors: 1 });
+    });
+  });
+
+  describe('logToolStats()', () => {
+    let consoleErrorSpy: ReturnType<typeof vi.spyOn>;
+
+    beforeEach(() => {
+      consoleErrorSpy = vi.spyOn(console, 'error').mockImplementation(() => {});
+    });
+
+    afterEach(() => {
+      consoleErrorSpy.mockRestore();
+    });
+
+    it('should write one line per tool to stderr', () => {
+      recordToolCall('export-screen', 2);
+      recordToolCall('preview-theme', 5);
+
+      logToolStats();
+
+      expect(consoleErrorSpy).toHaveBeenCalledTimes(2);
+      expect(consoleErrorSpy.mock.calls[0]![0]).toContain('[INFO] [stats] export-screen: 1 calls');
+    });
+  });
+
+  it('should clear statistics on reset', () => {
+    recordToolCall('export-screen', 2);
+
+    resetToolStats();
+
+    expect(getToolStats()).toEqual([]);
+  });
+});
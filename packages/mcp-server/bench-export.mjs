@@ -0,0 +1,136 @@
+#!/usr/bin/env node
+/**
+ * Export Load Generator
+ *
+ * Measures export throughput with 1, 10 and 100 parallel exports, comparing
+ * individual export-screen / generate_screen calls against one export-batch
+ * call. Blueprints render on the main thread; screen definitions are
+ * generated on the export worker pool.
+ * Requires a build (`pnpm build`) before running.
+ *
+ * Usage: node bench-export.mjs [parallel...]
+ *   node bench-export.mjs            # 1, 10 and 100
+ *   node bench-export.mjs 500        # custom size
+ *
+ * Set TEKTON_EXPORT_WORKERS to change the worker pool size (0 = main thread).
+ */
+
+import { exportScreenTool } from './dist/tools/export-screen.js';
+import { generateScreenTool } from './dist/tools/generate-screen.js';
+import { exportBatchTool } from './dist/tools/export-batch.js';
+import { getExportPool, shutdownExportPool } from './dist/workers/export-pool.js';
+import { getToolStats, measureTool, resetToolStats } from './dist/utils/metrics.js';
+
+const SIZES = process.argv.slice(2).map(Number).filter(Boolean);
+const PARALLEL = SIZES.length > 0 ? SIZES : [1, 10, 100];
+const ROUNDS = 20;
+
+function makeBlueprint(i) {
+  return {
+    id: `bench-${i}`,
+    name: `Benchmark Screen ${i}`,
+    themeId: 'classic-magazine-v1',
+    layout: 'dashboard',
+    components: [
+      { type: 'Heading', props: { level: 1 }, children: [`Title ${i}`] },
+      {
+        type: 'Card',
+        props: {},
+        children: [
+          { type: 'Text', props: {}, children: [`Body ${i}`] },
+          { type: 'Button', props: { variant: 'primary' }, children: ['Submit'] },
+        ],
+      },
+    ],
+  };
+}
+
+function makeScreen(i) {
+  return {
+    id: `bench-screen-${i}`,
+    name: `Benchmark Screen ${i}`,
+    shell: 'shell.web.dashboard',
+    page: 'page.dashboard',
+    sections: [
+      {
+        id: 'header',
+        pattern: 'section.container',
+        components: [{ type: 'Heading', props: { level: 1, children: `Title ${i}` } }],
+      },
+    ],
+  };
+}
+
+function report(label, parallel, elapsedMs) {
+  const exports = parallel * ROUNDS;
+  const stats = getToolStats().find(s => s.tool === label);
+  console.log(
+    `  ${label.padEnd(24)} ${((exports * 1000) / elapsedMs).toFixed(1).padStart(9)} exports/s  ` +
+      `call p50 ${stats.p50Ms.toFixed(1)}ms  p95 ${stats.p95Ms.toFixed(1)}ms  max ${stats.maxMs.toFixed(1)}ms`
+  );
+}
+
+async function measure(label, parallel, fn) {
+  const startedAt = performance.now();
+  for (let round = 0; round < ROUNDS; round++) {
+    await fn();
+  }
+  report(label, parallel, performance.now() - startedAt);
+}
+
+async function batch(input) {
+  const result = await exportBatchTool(input);
+  if (!result.success) {
+    throw new Error(`Batch failed: ${result.error ?? JSON.stringify(result.stats)}`);
+  }
+  return result;
+}
+
+async function run(parallel) {
+  const blueprints = Array.from({ length: parallel }, (_, i) => makeBlueprint(i));
+  const screenDefinitions = Array.from({ length: parallel }, (_, i) => makeScreen(i));
+  console.log(`\n${parallel} parallel export(s), ${ROUNDS} rounds`);
+  resetToolStats();
+
+  // Individual calls, as the server dispatches export-screen / generate_screen
+  await measure('export-screen', parallel, () =>
+    Promise.all(
+      blueprints.map(blueprint =>
+        measureTool('export-screen', () => exportScreenTool({ blueprint, format: 'tsx' }))
+      )
+    )
+  );
+  await measure('generate_screen', parallel, () =>
+    Promise.all(
+      screenDefinitions.map(screenDefinition =>
+        measureTool('generate_screen', () =>
+          generateScreenTool({ screenDefinition, outputFormat: 'react' })
+        )
+      )
+    )
+  );
+
+  // One batch call per round
+  await measure('export-batch (blueprints)', parallel, () =>
+    measureTool('export-batch (blueprints)', () => batch({ blueprints, format: 'tsx' }))
+  );
+  await measure('export-batch (screens)', parallel, () =>
+    measureTool('export-batch (screens)', () => batch({ screenDefinitions, outputFormat: 'react' }))
+  );
+}
+
+console.log(`Export worker pool: ${getExportPool().stats().size} worker(s)`);
+
+// Warm up workers and module caches
+await batch({
+  blueprints: [makeBlueprint(0)],
+  screenDefinitions: Array.from({ length: getExportPool().parallelism * 20 }, (_, i) =>
+    makeScreen(i)
+  ),
+});
+
+for (const parallel of PARALLEL) {
+  await run(parallel);
+}
+
+await shutdownExportPool();
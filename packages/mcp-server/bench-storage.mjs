@@ -0,0 +1,114 @@
+#!/usr/bin/env node
+/**
+ * Blueprint Storage Benchmark
+ *
+ * Measures save/load latency of BlueprintStorage with 10k and 100k stored
+ * blueprints. Requires a build (`pnpm build`) before running.
+ *
+ * Usage: node bench-storage.mjs [count...]
+ *   node bench-storage.mjs            # 10000 and 100000
+ *   node bench-storage.mjs 5000       # custom size
+ */
+
+import { mkdtempSync, rmSync } from 'fs';
+import { tmpdir } from 'os';
+import { join } from 'path';
+import { BlueprintStorage } from './dist/storage/blueprint-storage.js';
+
+const SIZES = process.argv.slice(2).map(Number).filter(Boolean);
+const COUNTS = SIZES.length > 0 ? SIZES : [10_000, 100_000];
+const SAMPLES = 1_000;
+
+function makeBlueprint(i) {
+  return {
+    id: `bench-${i}`,
+    name: `Benchmark Blueprint ${i}`,
+    themeId: `theme-${i % 8}`,
+    layout: 'single-column',
+    components: [
+      { type: 'Heading', props: { level: 1 }, children: [`Title ${i}`] },
+      { type: 'Button', props: { variant: 'primary' }, children: ['Submit'] },
+    ],
+  };
+}
+
+function percentile(sorted, p) {
+  return sorted[Math.min(sorted.length - 1, Math.floor((sorted.length * p) / 100))];
+}
+
+function summarize(label, samples) {
+  const sorted = [...samples].sort((a, b) => a - b);
+  const mean = sorted.reduce((sum, v) => sum + v, 0) / sorted.length;
+  console.log(
+    `  ${label.padEnd(22)} mean ${mean.toFixed(3)}ms  p50 ${percentile(sorted, 50).toFixed(3)}ms  ` +
+      `p99 ${percentile(sorted, 99).toFixed(3)}ms`
+  );
+}
+
+async function timeEach(items, fn) {
+  const samples = [];
+  for (const item of items) {
+    const start = performance.now();
+    await fn(item);
+    samples.push(performance.now() - start);
+  }
+  return samples;
+}
+
+async function run(count) {
+  const baseDir = mkdtempSync(join(tmpdir(), 'tekton-bench-'));
+  console.log(`\n📦 ${count.toLocaleString()} stored blueprints (${baseDir})`);
+
+  try {
+    const storage = new BlueprintStorage({ baseDir, sweepIntervalMs: 0 });
+
+    // Populate with the bulk API
+    let start = performance.now();
+    const ids = await storage.saveBlueprints(
+      Array.from({ length: count }, (_, i) => makeBlueprint(i))
+    );
+    const fillSeconds = (performance.now() - start) / 1000;
+    console.log(
+      `  bulk save              ${fillSeconds.toFixed(2)}s (${Math.round(count / fillSeconds)} blueprints/s)`
+    );
+
+    // Cold start: index replay without scanning directories
+    const reopened = new BlueprintStorage({ baseDir, sweepIntervalMs: 0, cacheSize: 256 });
+    start = performance.now();
+    await reopened.listBlueprints({ limit: 1 });
+    console.log(`  index load             ${(performance.now() - start).toFixed(2)}ms`);
+
+    const sampleIds = Array.from(
+      { length: SAMPLES },
+      () => ids[Math.floor(Math.random() * ids.length)]
+    );
+
+    summarize('save (single)', await timeEach(
+      Array.from({ length: SAMPLES }, (_, i) => makeBlueprint(count + i)),
+      bp => reopened.saveBlueprint(bp)
+    ));
+    summarize('load (cold)', await timeEach(sampleIds, id => reopened.loadBlueprint(id)));
+    summarize('load (LRU hit)', await timeEach(sampleIds.slice(-128), id => reopened.loadBlueprint(id)));
+    summarize('metadata lookup', await timeEach(sampleIds, id => reopened.loadMetadata(id)));
+    summarize('list by themeId', await timeEach(
+      Array.from({ length: 100 }, (_, i) => `theme-${i % 8}`),
+      themeId => reopened.listBlueprints({ themeId, limit: 50 })
+    ));
+
+    start = performance.now();
+    const loaded = await reopened.loadBlueprints(sampleIds);
+    console.log(
+      `  bulk load (${SAMPLES})       ${(performance.now() - start).toFixed(2)}ms, ` +
+        `${loaded.filter(Boolean).length} found`
+    );
+
+    await storage.close();
+    await reopened.close();
+  } finally {
+    rmSync(baseDir, { recursive: true, force: true });
+  }
+}
+
+for (const count of COUNTS) {
+  await run(count);
+}
@@ -3,6 +3,7 @@ import { Server } from '@modelcontextprotocol/sdk/server/index.js';
 import { StdioServerTransport } from '@modelcontextprotocol/sdk/server/stdio.js';
 import { ListToolsRequestSchema, CallToolRequestSchema } from '@modelcontextprotocol/sdk/types.js';
 import { info, error as logError } from './utils/logger.js';
+import { recordToolCall, startStatsReporter } from './utils/metrics.js';
 import { generateBlueprintTool } from './tools/generate-blueprint.js';
 import { previewThemeTool } from './tools/preview-theme.js';
 import { listThemesTool } from './tools/list-themes.js';
@@ -12,6 +13,8 @@ import { validateScreenTool } from './tools/validate-screen.js';
 import { listTokensTool } from './tools/list-tokens.js';
 import { listIconLibrariesTool } from './tools/list-icon-libraries.js';
 import { previewIconLibraryTool } from './tools/preview-icon-library.js';
+import { exportBatchTool } from './tools/export-batch.js';
+import { statsTool } from './tools/stats.js';
 import {
   GenerateBlueprintInputSchema,
   PreviewThemeInputSchema,
@@ -22,6 +25,8 @@ import {
   ListTokensInputSchema,
   ListIconLibrariesInputSchema,
   PreviewIconLibraryInputSchema,
+  ExportBatchInputSchema,
+  StatsInputSchema,
 } from './schemas/mcp-schemas.js';
 
 const server = new Server(
@@ -223,6 +228,88 @@ server.setRequestHandler(ListToolsRequestSchema, async () => {
           },
         },
       },
+      {
+        name: 'export-batch',
+        description:
+          'Export many blueprints and screen definitions in one call (parallel, progress notification per completed export)',
+        inputSchema: {
+          type: 'object',
+          properties: {
+            blueprintIds: {
+              type: 'array',
+              description: 'Stored blueprint IDs',
+              items: { type: 'string' },
+              maxItems: 1000,
+            },
+            blueprints: {
+              type: 'array',
+              description: 'Blueprint objects',
+              items: { type: 'object' },
+              maxItems: 1000,
+            },
+            screenDefinitions: {
+              type: 'array',
+              description: 'JSON screen definitions',
+              items: { type: 'object' },
+              maxItems: 1000,
+            },
+            format: {
+              type: 'string',
+              description: 'Export format for blueprints (default: tsx)',
+              enum: ['jsx', 'tsx', 'vue'],
+            },
+            outputFormat: {
+              type: 'string',
+              description: 'Output format for screen definitions (default: react)',
+              enum: ['css-in-js', 'tailwind', 'react'],
+            },
+            options: {
+              type: 'object',
+              description: 'Generation options for screen definitions',
+              properties: {
+                cssFramework: {
+                  type: 'string',
+                  enum: ['styled-components', 'emotion'],
+                },
+                typescript: { type: 'boolean' },
+                prettier: { type: 'boolean' },
+              },
+            },
+            includeCSS: {
+              type: 'boolean',
+              description: 'Include CSS Variables once per theme (default: false)',
+            },
+            includeComponents: {
+              type: 'boolean',
+              description: 'Include Tier 1 component code once per component type (default: false)',
+            },
+            themeId: {
+              type: 'string',
+              description: "Theme ID for CSS generation (default: each blueprint's themeId)",
+              pattern: '^[a-z0-9-]+$',
+            },
+            concurrency: {
+              type: 'number',
+              description: 'Maximum exports in flight (default: worker pool size)',
+              minimum: 1,
+              maximum: 64,
+            },
+          },
+        },
+      },
+      {
+        name: 'stats',
+        description: 'Per-tool latency histograms and counters, resolver cache and export pool statistics',
+        inputSchema: {
+          type: 'object',
+          properties: {
+            reset: {
+              type: 'boolean',
+              description: 'Clear tool statistics after reading them (default: false)',
+            },
+          },
+        },
+      },
     ],
   };
 });
@@ -231,8 +318,25 @@ server.setRequestHandler(ListToolsRequestSchema, async () => {
 // Task #10: CallToolRequestSchema Handler
 // ============================================================================
 
-server.setRequestHandler(CallToolRequestSchema, async request => {
+server.setRequestHandler(CallToolRequestSchema, async (request, extra) => {
   const { name, arguments: args } = request.params;
+  const startedAt = performance.now();
+  // Metrics are keyed by registered tool names only; other names share one bucket
+  let metricName = name;
+  let failed = false;
+
+  // Tools report failures as { success: false } rather than throwing
+  const respond = (result: { success: boolean }) => {
+    failed = !result.success;
+    return {
+      content: [
+        {
+          type: 'text',
+          text: JSON.stringify(result, null, 2),
+        },
+      ],
+    };
+  };
 
   info(`CallTool request: ${name}`);
 
@@ -243,14 +347,7 @@ server.setRequestHandler(CallToolRequestSchema, async request => {
         const validatedInput = GenerateBlueprintInputSchema.parse(args);
         const result = await generateBlueprintTool(validatedInput);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify(result, null, 2),
-            },
-          ],
-        };
+        return respond(result);
       }
 
       case 'list-icon-libraries': {
@@ -258,14 +355,7 @@ server.setRequestHandler(CallToolRequestSchema, async request => {
         ListIconLibrariesInputSchema.parse(args);
         const result = await listIconLibrariesTool();
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify(result, null, 2),
-            },
-          ],
-        };
+        return respond(result);
       }
 
       case 'preview-icon-library': {
@@ -273,14 +363,7 @@ server.setRequestHandler(CallToolRequestSchema, async request => {
         const validatedInput = PreviewIconLibraryInputSchema.parse(args);
         const result = await previewIconLibraryTool(validatedInput);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify(result, null, 2),
-            },
-          ],
-        };
+        return respond(result);
       }
 
       case 'list-themes': {
@@ -288,14 +371,7 @@ server.setRequestHandler(CallToolRequestSchema, async request => {
         ListThemesInputSchema.parse(args);
         const result = await listThemesTool();
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify(result, null, 2),
-            },
-          ],
-        };
+        return respond(result);
       }
 
       case 'preview-theme': {
@@ -303,14 +379,7 @@ server.setRequestHandler(CallToolRequestSchema, async request => {
         const validatedInput = PreviewThemeInputSchema.parse(args);
         const result = await previewThemeTool(validatedInput);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify(result, null, 2),
-            },
-          ],
-        };
+        return respond(result);
       }
 
       case 'export-screen': {
@@ -318,14 +387,7 @@ server.setRequestHandler(CallToolRequestSchema, async request => {
         const validatedInput = ExportScreenInputSchema.parse(args);
         const result = await exportScreenTool(validatedInput);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify(result, null, 2),
-            },
-          ],
-        };
+        return respond(result);
       }
 
       case 'generate_screen': {
@@ -333,14 +395,7 @@ server.setRequestHandler(CallToolRequestSchema, async request => {
         const validatedInput = GenerateScreenInputSchema.parse(args);
         const result = await generateScreenTool(validatedInput);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify(result, null, 2),
-            },
-          ],
-        };
+        return respond(result);
       }
 
       case 'validate_screen': {
@@ -348,14 +403,7 @@ server.setRequestHandler(CallToolRequestSchema, async request => {
         const validatedInput = ValidateScreenInputSchema.parse(args);
         const result = await validateScreenTool(validatedInput);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify(result, null, 2),
-            },
-          ],
-        };
+        return respond(result);
       }
 
       case 'list_tokens': {
@@ -363,20 +411,48 @@ server.setRequestHandler(CallToolRequestSchema, async request => {
         const validatedInput = ListTokensInputSchema.parse(args);
         const result = await listTokensTool(validatedInput);
 
-        return {
-          content: [
-            {
-              type: 'text',
-              text: JSON.stringify(result, null, 2),
-            },
-          ],
-        };
+        return respond(result);
+      }
+
+      case 'export-batch': {
+        // Validate input
+        const validatedInput = ExportBatchInputSchema.parse(args);
+        const progressToken = request.params._meta?.progressToken;
+
+        // Report each completed export as a progress notification when the client asked for progress
+        const result = await exportBatchTool(
+          validatedInput,
+          progressToken === undefined
+            ? undefined
+            : (item, completed, total) =>
+                extra.sendNotification({
+                  method: 'notifications/progress',
+                  params: {
+                    progressToken,
+                    progress: completed,
+                    total,
+                    message: `${item.success ? 'exported' : 'failed'} ${item.id ?? `#${item.index}`}`,
+                  },
+                })
+        );
+
+        return respond(result);
+      }
+
+      case 'stats': {
+        // Validate input
+        const validatedInput = StatsInputSchema.parse(args);
+        const result = await statsTool(validatedInput);
+
+        return respond(result);
       }
 
       default:
+        metricName = 'unknown';
         throw new Error(`Unknown tool: ${name}`);
     }
   } catch (error) {
+    failed = true;
     logError(`Tool execution error: ${error}`);
 
     return {
@@ -395,6 +471,10 @@ server.setRequestHandler(CallToolRequestSchema, async request => {
       ],
       isError: true,
     };
+  } finally {
+    const durationMs = performance.now() - startedAt;
+    recordToolCall(metricName, durationMs, !failed);
+    info(`CallTool ${name} ${failed ? 'failed' : 'completed'} in ${durationMs.toFixed(1)}ms`);
   }
 });
 
@@ -411,5 +491,11 @@ await server.connect(transport);
 
 info('Tekton MCP Server connected via stdio transport');
 info(
-  '9 MCP tools registered: generate-blueprint, list-themes, preview-theme, list-icon-libraries, preview-icon-library, export-screen, generate_screen, validate_screen, list_tokens'
+  '11 MCP tools registered: generate-blueprint, list-themes, preview-theme, list-icon-libraries, preview-icon-library, export-screen, generate_screen, validate_screen, list_tokens, export-batch, stats'
 );
+
+// Periodic per-tool latency summary (e.g. TEKTON_STATS_INTERVAL_MS=60000)
+const statsIntervalMs = Number(process.env.TEKTON_STATS_INTERVAL_MS);
+if (statsIntervalMs > 0) {
+  startStatsReporter(statsIntervalMs);
+}
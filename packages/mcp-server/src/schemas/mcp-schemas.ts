@@ -550,3 +550,163 @@ export const PreviewIconLibraryOutputSchema = z.object({
 });
 
 export type PreviewIconLibraryOutput = z.infer<typeof PreviewIconLibraryOutputSchema>;
+
+// ============================================================================
+// Batch Export Tool Schemas
+// ============================================================================
+
+/**
+ * Export Batch Input Schema
+ * Blueprints (stored or inline) and screen definitions exported in one call
+ */
+export const ExportBatchInputSchema = z
+  .object({
+    /** Stored blueprint IDs (loaded from blueprint storage) */
+    blueprintIds: z.array(z.string()).max(1000).optional(),
+    /** Inline blueprint objects */
+    blueprints: z.array(z.unknown()).max(1000).optional(),
+    /** JSON screen definitions (see generate_screen) */
+    screenDefinitions: z.array(z.unknown()).max(1000).optional(),
+    /** Output format for blueprints */
+    format: ExportFormatSchema.optional().default('tsx'),
+    /** Output format for screen definitions */
+    outputFormat: OutputFormatSchema.optional().default('react'),
+    /** Generation options for screen definitions */
+    options: GenerationOptionsSchema.optional(),
+    /** Include CSS Variables once per theme used in the batch */
+    includeCSS: z.boolean().optional().default(false),
+    /** Include Tier 1 component code once per component type used in the batch */
+    includeComponents: z.boolean().optional().default(false),
+    /** Theme ID for CSS generation (default: each blueprint's themeId) */
+    themeId: ThemeIdSchema.optional(),
+    /** Maximum exports in flight (default: worker pool size) */
+    concurrency: z.number().int().min(1).max(64).optional(),
+  })
+  .refine(
+    input =>
+      (input.blueprintIds?.length ?? 0) +
+        (input.blueprints?.length ?? 0) +
+        (input.screenDefinitions?.length ?? 0) >
+      0,
+    { message: 'At least one of blueprintIds, blueprints or screenDefinitions is required' }
+  );
+
+export type ExportBatchInput = z.input<typeof ExportBatchInputSchema>;
+
+/**
+ * Result of a single export within a batch
+ */
+export const ExportBatchItemSchema = z.object({
+  /** Position in the batch (blueprintIds, then blueprints, then screenDefinitions) */
+  index: z.number(),
+  kind: z.enum(['blueprint', 'screen']),
+  /** Blueprint or screen ID, if known */
+  id: z.string().optional(),
+  success: z.boolean(),
+  code: z.string().optional(),
+  /** Theme whose CSS applies (key into css) */
+  themeId: z.string().optional(),
+  /** Component types used (keys into components) */
+  componentTypes: z.array(z.string()).optional(),
+  errors: z.array(z.string()).optional(),
+  error: z.string().optional(),
+  /** Export time in milliseconds */
+  durationMs: z.number(),
+});
+
+export type ExportBatchItem = z.infer<typeof ExportBatchItemSchema>;
+
+/**
+ * Export Batch Output Schema
+ */
+export const ExportBatchOutputSchema = z.object({
+  success: z.boolean(),
+  /** Results in batch order */
+  results: z.array(ExportBatchItemSchema).optional(),
+  /** CSS Variables by theme ID (if includeCSS was true) */
+  css: z.record(z.string()).optional(),
+  /** Tier 1 component code (if includeComponents was true) */
+  components: z.array(ComponentResolutionSchema).optional(),
+  stats: z
+    .object({
+      total: z.number(),
+      succeeded: z.number(),
+      failed: z.number(),
+      workers: z.number(),
+      durationMs: z.number(),
+      /** Exports per second */
+      throughput: z.number(),
+    })
+    .optional(),
+  error: z.string().optional(),
+});
+
+export type ExportBatchOutput = z.infer<typeof ExportBatchOutputSchema>;
+
+// ============================================================================
+// Stats Tool Schemas
+// ============================================================================
+
+/**
+ * Stats Input Schema
+ */
+export const StatsInputSchema = z.object({
+  /** Clear tool and theme registry statistics after reading them */
+  reset: z.boolean().optional().default(false),
+});
+
+export type StatsInput = z.input<typeof StatsInputSchema>;
+
+/**
+ * Per-tool latency statistics
+ */
+export const ToolStatsSchema = z.object({
+  tool: z.string(),
+  calls: z.number(),
+  errors: z.number(),
+  totalMs: z.number(),
+  minMs: z.number(),
+  maxMs: z.number(),
+  meanMs: z.number(),
+  p50Ms: z.number(),
+  p95Ms: z.number(),
+  p99Ms: z.number(),
+  histogram: z.array(z.object({ le: z.number().nullable(), count: z.number() })),
+});
+
+/**
+ * Stats Output Schema
+ */
+export const StatsOutputSchema = z.object({
+  success: z.boolean(),
+  tools: z.array(ToolStatsSchema).optional(),
+  /** Resolver cache statistics from @tekton/core */
+  caches: z.array(z.record(z.unknown())).optional(),
+  /** Theme registry cache and latency counters from @tekton/core */
+  themeRegistry: z
+    .object({
+      requests: z.number(),
+      hits: z.number(),
+      misses: z.number(),
+      reloads: z.number(),
+      evictions: z.number(),
+      hitRate: z.number(),
+      size: z.number(),
+      totalMs: z.number(),
+      avgMs: z.number(),
+      maxMs: z.number(),
+    })
+    .optional(),
+  /** Export worker pool state */
+  exportPool: z
+    .object({
+      size: z.number(),
+      workers: z.number(),
+      busy: z.number(),
+      queued: z.number(),
+    })
+    .optional(),
+  error: z.string().optional(),
+});
+
+export type StatsOutput = z.infer<typeof StatsOutputSchema>;
@@ -1,13 +1,29 @@
 /**
  * Blueprint storage with timestamp-based file system
  * SPEC-MCP-002: File Storage Structure
+ *
+ * Layout:
+ *   {baseDir}/{blueprintId}/blueprint.json
+ *   {baseDir}/{blueprintId}/metadata.json
+ *   {baseDir}/index.jsonl   (append-only metadata index)
+ *
+ * All I/O is asynchronous. Metadata lookups and listings are served from the
+ * in-memory index, recently used blueprints from an LRU cache (as copies, so
+ * callers cannot change cached entries), and expired blueprints are removed
+ * by a background TTL sweeper. Several processes may share baseDir: listings
+ * replay index records appended since the last read whenever the index file
+ * changes, and lookups that miss the index fall back to the blueprint
+ * directory.
  */
 
-import { existsSync, mkdirSync, readFileSync, writeFileSync } from 'fs';
+import { appendFile, mkdir, open, readFile, readdir, rename, rm, stat, writeFile } from 'fs/promises';
+import type { FileHandle } from 'fs/promises';
 import { join } from 'path';
 import type { Blueprint } from '@tekton/core';
-import { generateTimestampId, isValidBlueprintId } from './timestamp-manager.js';
+import { generateRandomSuffix, isValidBlueprintId } from './timestamp-manager.js';
 import { createStorageError } from '../utils/error-handler.js';
+import { error as logError } from '../utils/logger.js';
+import { mapWithConcurrency } from '../utils/concurrency.js';
 
 /**
  * Blueprint metadata for storage index
@@ -16,7 +32,7 @@ export interface BlueprintMetadata {
   timestamp: string;
   themeId: string;
   createdAt: string;
-  ttl: number; // Time-to-live in milliseconds
+  ttl: number; // Expiry time in epoch milliseconds
 }
 
 /**
@@ -25,6 +41,19 @@ export interface BlueprintMetadata {
 export interface StorageConfig {
   baseDir: string; // Default: .tekton/blueprints
   ttlDays: number; // Default: 30 days
+  cacheSize: number; // Default: 256 blueprints kept in memory
+  sweepIntervalMs: number; // Default: 1 hour, 0 disables the background sweeper
+  concurrency: number; // Default: 32 parallel file operations for bulk APIs
+}
+
+/**
+ * Filter options for listing blueprints
+ */
+export interface ListBlueprintsOptions {
+  themeId?: string;
+  createdAfter?: string | Date;
+  createdBefore?: string | Date;
+  limit?: number;
 }
 
 /**
@@ -33,18 +62,54 @@ export interface StorageConfig {
 const DEFAULT_CONFIG: StorageConfig = {
   baseDir: '.tekton/blueprints',
   ttlDays: 30,
+  cacheSize: 256,
+  sweepIntervalMs: 60 * 60 * 1000,
+  concurrency: 32,
 };
 
+const INDEX_FILE = 'index.jsonl';
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+/**
+ * Append-only index record
+ */
+type IndexRecord = ({ op: 'put' } & BlueprintMetadata) | { op: 'del'; timestamp: string };
+
+/**
+ * Identity of the index file contents already applied to the in-memory index
+ */
+interface IndexFileState {
+  ino: number;
+  size: number;
+  mtimeMs: number;
+  /** Bytes replayed so far (up to the last complete line) */
+  offset: number;
+}
+
 /**
  * Blueprint storage manager
  * SPEC: File Storage Structure
  */
 export class BlueprintStorage {
   private config: StorageConfig;
+  private readonly cache = new Map<string, Blueprint>();
+  private readonly index = new Map<string, BlueprintMetadata>();
+  private readonly byTheme = new Map<string, Set<string>>();
+  /** IDs reserved by saves whose index record is not written yet */
+  private readonly pending = new Map<string, BlueprintMetadata>();
+  private indexRecords = 0;
+  private indexFile: IndexFileState | null = null;
+  private ready: Promise<void> | null = null;
+  private refreshing: Promise<void> | null = null;
+  private indexWrite: Promise<void> = Promise.resolve();
+  private sweepTimer: NodeJS.Timeout | null = null;
+  private sweeping: Promise<number> | null = null;
 
   constructor(config: Partial<StorageConfig> = {}) {
     this.config = { ...DEFAULT_CONFIG, ...config };
-    this.ensureBaseDir();
+    if (this.config.sweepIntervalMs > 0) {
+      this.startSweeper(this.config.sweepIntervalMs);
+    }
   }
 
   /**
@@ -56,26 +121,45 @@ export class BlueprintStorage {
    */
   async saveBlueprint(blueprint: Blueprint): Promise<string> {
     try {
-      // Generate unique timestamp ID with collision detection
-      const timestampId = generateTimestampId(this.config.baseDir);
-      const blueprintDir = join(this.config.baseDir, timestampId);
-
-      // Create directory
-      mkdirSync(blueprintDir, { recursive: true });
+      await this.init();
 
-      // Save blueprint.json
-      const blueprintPath = join(blueprintDir, 'blueprint.json');
-      writeFileSync(blueprintPath, JSON.stringify(blueprint, null, 2), 'utf-8');
+      // Generate unique timestamp ID; collisions are checked against the index
+      const timestampId = this.generateId();
+      const blueprintDir = join(this.config.baseDir, timestampId);
 
-      // Save metadata.json
       const metadata: BlueprintMetadata = {
         timestamp: timestampId,
         themeId: blueprint.themeId,
         createdAt: new Date().toISOString(),
-        ttl: Date.now() + this.config.ttlDays * 24 * 60 * 60 * 1000,
+        ttl: Date.now() + this.config.ttlDays * DAY_MS,
       };
-      const metadataPath = join(blueprintDir, 'metadata.json');
-      writeFileSync(metadataPath, JSON.stringify(metadata, null, 2), 'utf-8');
+
+      // Reserve the ID before the first await so concurrent saves never collide
+      this.addToIndex(metadata);
+      this.pending.set(timestampId, metadata);
+
+      try {
+        await mkdir(blueprintDir, { recursive: true });
+        await Promise.all([
+          writeFile(join(blueprintDir, 'blueprint.json'), JSON.stringify(blueprint), 'utf-8'),
+          writeFile(join(blueprintDir, 'metadata.json'), JSON.stringify(metadata), 'utf-8'),
+        ]);
+      } catch (writeError) {
+        this.pending.delete(timestampId);
+        this.removeFromIndex(timestampId);
+        throw writeError;
+      }
+
+      try {
+        await this.appendIndex({ op: 'put', ...metadata });
+      } catch (appendError) {
+        this.removeFromIndex(timestampId);
+        await rm(blueprintDir, { recursive: true, force: true });
+        throw appendError;
+      } finally {
+        this.pending.delete(timestampId);
+      }
+      this.remember(timestampId, structuredClone(blueprint));
 
       return timestampId;
     } catch (error) {
@@ -84,8 +168,21 @@ export class BlueprintStorage {
     }
   }
 
+  /**
+   * Save many blueprints with bounded parallelism
+   *
+   * @param blueprints - Blueprints to save
+   * @returns Blueprint IDs in input order
+   */
+  async saveBlueprints(blueprints: Blueprint[]): Promise<string[]> {
+    return mapWithConcurrency(blueprints, this.config.concurrency, blueprint =>
+      this.saveBlueprint(blueprint)
+    );
+  }
+
   /**
    * Load blueprint from storage by ID
+   * Each call returns a new copy; changing it does not affect the store.
    *
    * @param blueprintId - Timestamp-based blueprint ID
    * @returns Blueprint or null if not found
@@ -96,18 +193,38 @@ export class BlueprintStorage {
         return null;
       }
 
-      const blueprintPath = join(this.config.baseDir, blueprintId, 'blueprint.json');
-      if (!existsSync(blueprintPath)) {
+      const metadata = await this.lookupMetadata(blueprintId);
+      if (!metadata || this.isExpired(metadata)) {
         return null;
       }
 
-      const blueprintJson = readFileSync(blueprintPath, 'utf-8');
-      return JSON.parse(blueprintJson) as Blueprint;
+      const cached = this.cache.get(blueprintId);
+      if (cached) {
+        this.remember(blueprintId, cached);
+        return structuredClone(cached);
+      }
+
+      const blueprintPath = join(this.config.baseDir, blueprintId, 'blueprint.json');
+      const json = await readFile(blueprintPath, 'utf-8');
+      this.remember(blueprintId, JSON.parse(json) as Blueprint);
+      return JSON.parse(json) as Blueprint;
     } catch (error) {
       return null;
     }
   }
 
+  /**
+   * Load many blueprints with bounded parallelism
+   *
+   * @param blueprintIds - Blueprint IDs to load
+   * @returns Blueprints in input order (null for missing entries)
+   */
+  async loadBlueprints(blueprintIds: string[]): Promise<Array<Blueprint | null>> {
+    return mapWithConcurrency(blueprintIds, this.config.concurrency, id =>
+      this.loadBlueprint(id)
+    );
+  }
+
   /**
    * Load blueprint metadata
    *
@@ -116,13 +233,8 @@ export class BlueprintStorage {
    */
   async loadMetadata(blueprintId: string): Promise<BlueprintMetadata | null> {
     try {
-      const metadataPath = join(this.config.baseDir, blueprintId, 'metadata.json');
-      if (!existsSync(metadataPath)) {
-        return null;
-      }
-
-      const metadataJson = readFileSync(metadataPath, 'utf-8');
-      return JSON.parse(metadataJson) as BlueprintMetadata;
+      const metadata = await this.lookupMetadata(blueprintId);
+      return metadata && !this.isExpired(metadata) ? { ...metadata } : null;
     } catch (error) {
       return null;
     }
@@ -132,8 +244,130 @@ export class BlueprintStorage {
    * Check if blueprint exists
    */
   async blueprintExists(blueprintId: string): Promise<boolean> {
-    const blueprintPath = join(this.config.baseDir, blueprintId, 'blueprint.json');
-    return existsSync(blueprintPath);
+    return (await this.loadMetadata(blueprintId)) !== null;
+  }
+
+  /**
+   * List stored blueprint metadata from the index, oldest first
+   * Records appended by other processes since the last listing are applied
+   * first.
+   *
+   * @param options - Optional themeId / createdAt range filters and limit
+   */
+  async listBlueprints(options: ListBlueprintsOptions = {}): Promise<BlueprintMetadata[]> {
+    await this.init();
+    await this.refreshIndex();
+
+    const after = options.createdAfter ? toIsoString(options.createdAfter) : undefined;
+    const before = options.createdBefore ? toIsoString(options.createdBefore) : undefined;
+
+    let ids: Iterable<string>;
+    if (options.themeId !== undefined) {
+      ids = this.byTheme.get(options.themeId) ?? [];
+    } else {
+      ids = this.index.keys();
+    }
+
+    const results: BlueprintMetadata[] = [];
+    for (const id of ids) {
+      const metadata = this.index.get(id);
+      if (!metadata || this.isExpired(metadata)) {
+        continue;
+      }
+      if (after && metadata.createdAt < after) {
+        continue;
+      }
+      if (before && metadata.createdAt > before) {
+        continue;
+      }
+      results.push({ ...metadata });
+    }
+
+    results.sort((a, b) => (a.createdAt < b.createdAt ? -1 : a.createdAt > b.createdAt ? 1 : 0));
+
+    return options.limit !== undefined ? results.slice(0, options.limit) : results;
+  }
+
+  /**
+   * Delete a blueprint and its index entry
+   *
+   * @returns true if the blueprint existed
+   */
+  async deleteBlueprint(blueprintId: string): Promise<boolean> {
+    if (!isValidBlueprintId(blueprintId)) {
+      return false;
+    }
+
+    if (!(await this.lookupMetadata(blueprintId))) {
+      return false;
+    }
+
+    this.removeFromIndex(blueprintId);
+    this.cache.delete(blueprintId);
+    await rm(this.getBlueprintDir(blueprintId), { recursive: true, force: true });
+    await this.appendIndex({ op: 'del', timestamp: blueprintId });
+    return true;
+  }
+
+  /**
+   * Remove all blueprints whose TTL has passed
+   *
+   * @param now - Reference time in epoch milliseconds
+   * @returns Number of blueprints removed
+   */
+  async sweepExpired(now: number = Date.now()): Promise<number> {
+    if (this.sweeping) {
+      return this.sweeping;
+    }
+
+    this.sweeping = (async () => {
+      await this.init();
+      await this.refreshIndex();
+
+      const expired = [...this.index.values()]
+        .filter(metadata => metadata.ttl <= now)
+        .map(metadata => metadata.timestamp);
+
+      await mapWithConcurrency(expired, this.config.concurrency, id => this.deleteBlueprint(id));
+      await this.compactIndexIfNeeded();
+      return expired.length;
+    })();
+
+    try {
+      return await this.sweeping;
+    } finally {
+      this.sweeping = null;
+    }
+  }
+
+  /**
+   * Start the background TTL sweeper
+   * The timer is unref'd so it never keeps the process alive.
+   */
+  startSweeper(intervalMs: number = this.config.sweepIntervalMs): void {
+    this.stopSweeper();
+    this.sweepTimer = setInterval(() => {
+      this.sweepExpired().catch(err => logError('Blueprint TTL sweep failed:', err));
+    }, intervalMs);
+    this.sweepTimer.unref();
+  }
+
+  /**
+   * Stop the background TTL sweeper
+   */
+  stopSweeper(): void {
+    if (this.sweepTimer) {
+      clearInterval(this.sweepTimer);
+      this.sweepTimer = null;
+    }
+  }
+
+  /**
+   * Stop background work and wait for pending index writes
+   */
+  async close(): Promise<void> {
+    this.stopSweeper();
+    await this.indexWrite;
   }
 
   /**
@@ -144,13 +378,293 @@ export class BlueprintStorage {
   }
 
   /**
-   * Ensure base directory exists
+   * Find metadata in the index, falling back to the blueprint directory for
+   * blueprints saved by another process after the index was loaded
+   */
+  private async lookupMetadata(blueprintId: string): Promise<BlueprintMetadata | null> {
+    if (!isValidBlueprintId(blueprintId)) {
+      return null;
+    }
+
+    await this.init();
+    const indexed = this.index.get(blueprintId);
+    if (indexed) {
+      return indexed;
+    }
+
+    try {
+      const metadataPath = join(this.getBlueprintDir(blueprintId), 'metadata.json');
+      const metadata = JSON.parse(await readFile(metadataPath, 'utf-8')) as BlueprintMetadata;
+      if (metadata.timestamp !== blueprintId) {
+        return null;
+      }
+      this.addToIndex(metadata);
+      return metadata;
+    } catch {
+      return null;
+    }
+  }
+
+  /**
+   * Ensure base directory exists and load the index (once)
+   */
+  private init(): Promise<void> {
+    if (!this.ready) {
+      this.ready = this.loadIndex().catch(err => {
+        this.ready = null;
+        throw err;
+      });
+    }
+    return this.ready;
+  }
+
+  /**
+   * Replay the append-only index, or rebuild it from blueprint
+   * directories for stores created before the index existed
+   */
+  private async loadIndex(): Promise<void> {
+    await mkdir(this.config.baseDir, { recursive: true });
+
+    const read = await this.readIndexFile(null);
+    if (!read) {
+      await this.rebuildIndex();
+      return;
+    }
+
+    this.indexRecords += this.replayIndex(read.content);
+    this.indexFile = read.state;
+  }
+
+  /**
+   * Apply index changes made since the last read (by this or another process)
+   * Appended records are replayed incrementally; a replaced index (e.g.
+   * compacted elsewhere) is replayed in full.
    */
-  private ensureBaseDir(): void {
-    if (!existsSync(this.config.baseDir)) {
-      mkdirSync(this.config.baseDir, { recursive: true });
+  private refreshIndex(): Promise<void> {
+    if (!this.refreshing) {
+      this.refreshing = this.enqueueIndexWrite(() => this.refreshIndexNow()).finally(() => {
+        this.refreshing = null;
+      });
     }
+    return this.refreshing;
   }
+
+  /**
+   * refreshIndex body; runs on the index write queue
+   */
+  private async refreshIndexNow(): Promise<void> {
+    const read = await this.readIndexFile(this.indexFile);
+    if (!read) {
+      return;
+    }
+
+    if (read.full) {
+      // Rebuild from the file, keeping saves whose record is not written yet
+      this.index.clear();
+      this.byTheme.clear();
+      this.indexRecords = 0;
+      for (const metadata of this.pending.values()) {
+        this.addToIndex(metadata);
+      }
+    }
+    this.indexRecords += this.replayIndex(read.content);
+    this.indexFile = read.state;
+  }
+
+  /**
+   * Read the index file from where `known` stopped
+   * Reads from the start when the file was replaced or truncated (full).
+   * Only complete lines are returned; a partially written last line is read
+   * again next time.
+   *
+   * @returns null if the index file cannot be read
+   */
+  private async readIndexFile(
+    known: IndexFileState | null
+  ): Promise<{ content: string; state: IndexFileState; full: boolean } | null> {
+    let handle: FileHandle | undefined;
+    try {
+      handle = await open(this.indexPath(), 'r');
+      const { ino, size, mtimeMs } = await handle.stat();
+      if (known && ino === known.ino && size === known.size && mtimeMs === known.mtimeMs) {
+        return { content: '', state: known, full: false };
+      }
+
+      const full = !known || ino !== known.ino || size < known.offset;
+      const start = known && !full ? known.offset : 0;
+      const buffer = Buffer.alloc(size - start);
+      const { bytesRead } = await handle.read(buffer, 0, buffer.length, start);
+      const read = buffer.subarray(0, bytesRead);
+      const complete = read.subarray(0, read.lastIndexOf(0x0a) + 1);
+
+      return {
+        content: complete.toString('utf-8'),
+        state: { ino, size, mtimeMs, offset: start + complete.length },
+        full,
+      };
+    } catch {
+      return null;
+    } finally {
+      await handle?.close();
+    }
+  }
+
+  /**
+   * Apply index records to the in-memory index
+   *
+   * @returns Number of records read
+   */
+  private replayIndex(content: string): number {
+    let records = 0;
+    for (const line of content.split('\n')) {
+      if (!line) {
+        continue;
+      }
+      records++;
+      try {
+        const record = JSON.parse(line) as IndexRecord;
+        if (record.op === 'put') {
+          const { op: _op, ...metadata } = record;
+          this.addToIndex(metadata);
+        } else if (record.op === 'del') {
+          this.removeFromIndex(record.timestamp);
+        }
+      } catch {
+        // Skip a torn trailing line from an interrupted write
+      }
+    }
+    return records;
+  }
+
+  private async rebuildIndex(): Promise<void> {
+    const entries = await readdir(this.config.baseDir, { withFileTypes: true });
+    const ids = entries
+      .filter(entry => entry.isDirectory() && isValidBlueprintId(entry.name))
+      .map(entry => entry.name);
+
+    const metadataList = await mapWithConcurrency(ids, this.config.concurrency, async id => {
+      try {
+        const json = await readFile(join(this.config.baseDir, id, 'metadata.json'), 'utf-8');
+        return JSON.parse(json) as BlueprintMetadata;
+      } catch {
+        return null;
+      }
+    });
+
+    for (const metadata of metadataList) {
+      if (metadata) {
+        this.addToIndex(metadata);
+      }
+    }
+
+    await this.writeIndexSnapshot();
+  }
+
+  private async compactIndexIfNeeded(): Promise<void> {
+    // Rewrite once tombstones and superseded records outnumber live entries
+    if (this.indexRecords > Math.max(1024, this.index.size * 2)) {
+      await this.writeIndexSnapshot({ merge: true });
+    }
+  }
+
+  /**
+   * Rewrite the index from the in-memory view
+   * With merge, records appended by other processes are replayed first so
+   * the snapshot does not drop their blueprints.
+   */
+  private writeIndexSnapshot({ merge = false }: { merge?: boolean } = {}): Promise<void> {
+    return this.enqueueIndexWrite(async () => {
+      if (merge) {
+        await this.refreshIndexNow();
+      }
+      const lines = [...this.index.values()].map(m => JSON.stringify({ op: 'put', ...m }));
+      const content = lines.length ? `${lines.join('\n')}\n` : '';
+      const tmpPath = `${this.indexPath()}.${process.pid}.tmp`;
+      await writeFile(tmpPath, content, 'utf-8');
+      await rename(tmpPath, this.indexPath());
+      this.indexRecords = lines.length;
+
+      const { ino, size, mtimeMs } = await stat(this.indexPath());
+      this.indexFile = { ino, size, mtimeMs, offset: Buffer.byteLength(content) };
+    });
+  }
+
+  private appendIndex(record: IndexRecord): Promise<void> {
+    return this.enqueueIndexWrite(async () => {
+      // Counted in indexRecords when refreshIndex reads it back
+      await appendFile(this.indexPath(), `${JSON.stringify(record)}\n`, 'utf-8');
+    });
+  }
+
+  /**
+   * Serialize index writes so concurrent writers never interleave lines
+   * A failed write rejects only its own caller; later writes still run.
+   */
+  private enqueueIndexWrite(write: () => Promise<void>): Promise<void> {
+    const result = this.indexWrite.then(write);
+    this.indexWrite = result.catch(() => {});
+    return result;
+  }
+
+  private addToIndex(metadata: BlueprintMetadata): void {
+    this.removeFromIndex(metadata.timestamp);
+    this.index.set(metadata.timestamp, metadata);
+    let themeIds = this.byTheme.get(metadata.themeId);
+    if (!themeIds) {
+      themeIds = new Set();
+      this.byTheme.set(metadata.themeId, themeIds);
+    }
+    themeIds.add(metadata.timestamp);
+  }
+
+  private removeFromIndex(blueprintId: string): void {
+    const existing = this.index.get(blueprintId);
+    if (!existing) {
+      return;
+    }
+    this.index.delete(blueprintId);
+    const themeIds = this.byTheme.get(existing.themeId);
+    themeIds?.delete(blueprintId);
+    if (themeIds && themeIds.size === 0) {
+      this.byTheme.delete(existing.themeId);
+    }
+  }
+
+  /**
+   * Insert or refresh an LRU entry, evicting the least recently used
+   */
+  private remember(blueprintId: string, blueprint: Blueprint): void {
+    if (this.config.cacheSize <= 0) {
+      return;
+    }
+    this.cache.delete(blueprintId);
+    this.cache.set(blueprintId, blueprint);
+    if (this.cache.size > this.config.cacheSize) {
+      const oldest = this.cache.keys().next().value as string;
+      this.cache.delete(oldest);
+    }
+  }
+
+  private generateId(): string {
+    // Format: bp-{timestamp}-{suffix}
+    let id: string;
+    do {
+      id = `bp-${Date.now()}-${generateRandomSuffix(6)}`;
+    } while (this.index.has(id));
+    return id;
+  }
+
+  private isExpired(metadata: BlueprintMetadata): boolean {
+    return metadata.ttl <= Date.now();
+  }
+
+  private indexPath(): string {
+    return join(this.config.baseDir, INDEX_FILE);
+  }
+}
+
+function toIsoString(value: string | Date): string {
+  return value instanceof Date ? value.toISOString() : value;
 }
 
 /**
@@ -0,0 +1,267 @@
+/**
+ * Export Batch MCP Tool
+ * Exports many blueprints and screen definitions in one call
+ *
+ * - Screen generation fans out across the export worker pool; blueprint
+ *   renders take microseconds, less than a worker round trip, so they run
+ *   on the calling thread
+ * - Theme CSS and Tier 1 component code are resolved once per batch
+ * - Each result is reported through onResult as soon as it completes
+ */
+
+import { loadTheme } from '@tekton/core';
+import type { Blueprint } from '@tekton/core';
+import {
+  GenerationOptionsSchema,
+  type ComponentResolution,
+  type ExportBatchInput,
+  type ExportBatchItem,
+  type ExportBatchOutput,
+} from '../schemas/mcp-schemas.js';
+import { getDefaultStorage } from '../storage/blueprint-storage.js';
+import { generateCSS, isTier1Component, resolveFromTier1 } from '../generators/index.js';
+import { mapWithConcurrency } from '../utils/concurrency.js';
+import { extractErrorMessage } from '../utils/error-handler.js';
+import { error as logError } from '../utils/logger.js';
+import { getExportPool } from '../workers/export-pool.js';
+import { runExportJob, type ExportJob } from '../workers/export-job.js';
+import { extractComponentTypes } from './export-screen.js';
+
+/**
+ * Called with each result as soon as it completes
+ *
+ * @param item - Completed export
+ * @param completed - Number of completed exports so far
+ * @param total - Batch size
+ */
+export type ExportBatchResultHandler = (
+  item: ExportBatchItem,
+  completed: number,
+  total: number
+) => void | Promise<void>;
+
+interface BatchEntry {
+  index: number;
+  kind: ExportBatchItem['kind'];
+  id?: string;
+  job?: ExportJob;
+  themeId?: string;
+  componentTypes?: string[];
+  /** Set when the entry cannot be exported (e.g. blueprint not found) */
+  error?: string;
+}
+
+function readId(value: unknown): string | undefined {
+  if (typeof value === 'object' && value !== null && 'id' in value) {
+    const id = (value as { id: unknown }).id;
+    return typeof id === 'string' ? id : undefined;
+  }
+  return undefined;
+}
+
+/**
+ * Shared theme CSS and Tier 1 components for one batch
+ */
+class BatchResources {
+  readonly css: Record<string, string> = {};
+  readonly components = new Map<string, ComponentResolution>();
+  private readonly themesSeen = new Set<string>();
+
+  /**
+   * Generate CSS Variables for a theme (once per batch)
+   */
+  addTheme(themeId: string): void {
+    if (this.themesSeen.has(themeId)) {
+      return;
+    }
+    this.themesSeen.add(themeId);
+
+    try {
+      const theme = loadTheme(themeId);
+      if (theme) {
+        const cssResult = generateCSS(theme);
+        if (cssResult.success && cssResult.css) {
+          this.css[themeId] = cssResult.css;
+        }
+      }
+    } catch (cssError) {
+      // CSS 생성 실패는 경고만 (전체 실패 아님)
+      logError(`[Export Batch] CSS generation failed for theme ${themeId}:`, cssError);
+    }
+  }
+
+  /**
+   * Resolve Tier 1 component code (once per component type per batch)
+   */
+  addComponent(componentName: string): void {
+    if (this.components.has(componentName) || !isTier1Component(componentName)) {
+      return;
+    }
+
+    const resolution = resolveFromTier1(componentName);
+    if (resolution.success) {
+      this.components.set(componentName, {
+        componentName,
+        code: resolution.code || '',
+        source: resolution.source || 'tier1-example',
+      });
+    }
+  }
+}
+
+/**
+ * Export batch MCP tool implementation
+ *
+ * @param input - Blueprint IDs, blueprints and/or screen definitions with output formats
+ * @param onResult - Optional handler called as each export completes
+ * @returns All results in batch order with shared CSS, components and timing
+ */
+export async function exportBatchTool(
+  input: ExportBatchInput,
+  onResult?: ExportBatchResultHandler
+): Promise<ExportBatchOutput> {
+  const startedAt = performance.now();
+
+  try {
+    const {
+      blueprintIds = [],
+      blueprints = [],
+      screenDefinitions = [],
+      format = 'tsx',
+      outputFormat = 'react',
+      includeCSS = false,
+      includeComponents = false,
+      themeId,
+      concurrency,
+    } = input;
+    const options = input.options ? GenerationOptionsSchema.parse(input.options) : undefined;
+
+    // Stored blueprints are loaded in one bulk read
+    const stored =
+      blueprintIds.length > 0 ? await getDefaultStorage().loadBlueprints(blueprintIds) : [];
+
+    const entries: BatchEntry[] = [];
+    const resources = new BatchResources();
+
+    const addBlueprint = (blueprint: unknown, id: string | undefined): void => {
+      const entry: BatchEntry = {
+        index: entries.length,
+        kind: 'blueprint',
+        id,
+        job: { kind: 'blueprint', blueprint, format },
+      };
+
+      if (typeof blueprint === 'object' && blueprint !== null) {
+        const bp = blueprint as Blueprint;
+        const entryThemeId = themeId ?? bp.themeId;
+        if (includeCSS && entryThemeId) {
+          resources.addTheme(entryThemeId);
+          entry.themeId = entryThemeId;
+        }
+        if (includeComponents) {
+          entry.componentTypes = extractComponentTypes(bp);
+          entry.componentTypes.forEach(type => resources.addComponent(type));
+        }
+      }
+
+      entries.push(entry);
+    };
+
+    blueprintIds.forEach((id, i) => {
+      const blueprint = stored[i];
+      if (blueprint) {
+        addBlueprint(blueprint, id);
+      } else {
+        entries.push({
+          index: entries.length,
+          kind: 'blueprint',
+          id,
+          error: `Blueprint not found: ${id}`,
+        });
+      }
+    });
+
+    blueprints.forEach(blueprint => addBlueprint(blueprint, readId(blueprint)));
+
+    screenDefinitions.forEach(screenDefinition => {
+      entries.push({
+        index: entries.length,
+        kind: 'screen',
+        id: readId(screenDefinition),
+        job: { kind: 'screen', screenDefinition, outputFormat, options },
+      });
+    });
+
+    // Fan out across the worker pool, reporting each result as it completes
+    const pool = getExportPool();
+    const total = entries.length;
+    let completed = 0;
+
+    const results = await mapWithConcurrency(
+      entries,
+      concurrency ?? pool.parallelism,
+      async entry => {
+        const item: ExportBatchItem = {
+          index: entry.index,
+          kind: entry.kind,
+          id: entry.id,
+          success: false,
+          themeId: entry.themeId,
+          componentTypes: entry.componentTypes,
+          durationMs: 0,
+        };
+
+        if (entry.job) {
+          try {
+            const result =
+              entry.job.kind === 'screen'
+                ? await pool.run(entry.job)
+                : await runExportJob(entry.job);
+            item.success = result.success;
+            item.code = result.code;
+            item.errors = result.errors;
+            item.error = result.error;
+            item.durationMs = result.durationMs;
+          } catch (error) {
+            item.error = extractErrorMessage(error);
+          }
+        } else {
+          item.error = entry.error;
+        }
+
+        completed++;
+        if (onResult) {
+          try {
+            await onResult(item, completed, total);
+          } catch (handlerError) {
+            logError(`[Export Batch] Result handler failed:`, handlerError);
+          }
+        }
+        return item;
+      }
+    );
+
+    const succeeded = results.filter(item => item.success).length;
+    const durationMs = performance.now() - startedAt;
+
+    return {
+      success: succeeded === total,
+      results,
+      css: includeCSS ? resources.css : undefined,
+      components: includeComponents ? [...resources.components.values()] : undefined,
+      stats: {
+        total,
+        succeeded,
+        failed: total - succeeded,
+        workers: pool.stats().size,
+        durationMs,
+        throughput: durationMs > 0 ? (total * 1000) / durationMs : total,
+      },
+    };
+  } catch (error) {
+    return {
+      success: false,
+      error: extractErrorMessage(error),
+    };
+  }
+}
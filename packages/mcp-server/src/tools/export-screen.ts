@@ -235,7 +235,7 @@ async function resolveComponent(
 /**
  * Blueprint에서 사용된 컴포넌트 타입 추출
  */
-function extractComponentTypes(blueprint: Blueprint): string[] {
+export function extractComponentTypes(blueprint: Blueprint): string[] {
   const types = new Set<string>();
 
   function traverse(node: Blueprint['components'][number]) {
@@ -0,0 +1,42 @@
+/**
+ * Stats MCP Tool
+ * Reports per-tool latency, resolver cache, theme registry and export pool statistics
+ */
+
+import { getCacheStats, getThemeRegistry } from '@tekton/core';
+import type { StatsInput, StatsOutput } from '../schemas/mcp-schemas.js';
+import { extractErrorMessage } from '../utils/error-handler.js';
+import { getToolStats, logToolStats, resetToolStats } from '../utils/metrics.js';
+import { getExportPool } from '../workers/export-pool.js';
+
+/**
+ * Get server statistics
+ *
+ * @param input - Optional reset flag
+ * @returns Tool latency histograms and counters, cache, theme registry and pool statistics
+ */
+export async function statsTool(input: StatsInput = {}): Promise<StatsOutput> {
+  try {
+    const tools = getToolStats();
+    const themeRegistry = getThemeRegistry().getStats();
+    logToolStats();
+
+    if (input.reset) {
+      resetToolStats();
+      getThemeRegistry().resetStats();
+    }
+
+    return {
+      success: true,
+      tools,
+      caches: getCacheStats().map(stats => ({ ...stats })),
+      themeRegistry,
+      exportPool: getExportPool().stats(),
+    };
+  } catch (error) {
+    return {
+      success: false,
+      error: extractErrorMessage(error),
+    };
+  }
+}
@@ -0,0 +1,25 @@
+/**
+ * Concurrency helpers for MCP server
+ */
+
+/**
+ * Map items through an async function with at most `limit` in flight
+ */
+export async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+
+  const workers = Array.from({ length: Math.min(Math.max(1, limit), items.length) }, async () => {
+    while (next < items.length) {
+      const i = next++;
+      results[i] = await fn(items[i] as T, i);
+    }
+  });
+
+  await Promise.all(workers);
+  return results;
+}
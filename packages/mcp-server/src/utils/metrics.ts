@@ -0,0 +1,180 @@
+/**
+ * Per-tool latency metrics for MCP server
+ * Fixed-bucket histograms and counters, reported via the stats tool and logger
+ */
+
+import { info } from './logger.js';
+
+/**
+ * Histogram bucket upper bounds in milliseconds (last bucket is unbounded)
+ */
+export const LATENCY_BUCKETS_MS: readonly number[] = [
+  1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000,
+];
+
+export interface LatencyBucket {
+  /** Upper bound in ms (null for the overflow bucket) */
+  le: number | null;
+  count: number;
+}
+
+export interface ToolStats {
+  tool: string;
+  calls: number;
+  errors: number;
+  totalMs: number;
+  minMs: number;
+  maxMs: number;
+  meanMs: number;
+  /** Percentiles estimated from the histogram (bucket upper bound, capped at maxMs) */
+  p50Ms: number;
+  p95Ms: number;
+  p99Ms: number;
+  histogram: LatencyBucket[];
+}
+
+interface ToolMetrics {
+  calls: number;
+  errors: number;
+  totalMs: number;
+  minMs: number;
+  maxMs: number;
+  counts: number[];
+}
+
+const metrics = new Map<string, ToolMetrics>();
+
+function bucketIndex(durationMs: number): number {
+  for (let i = 0; i < LATENCY_BUCKETS_MS.length; i++) {
+    if (durationMs <= LATENCY_BUCKETS_MS[i]!) {
+      return i;
+    }
+  }
+  return LATENCY_BUCKETS_MS.length;
+}
+
+/**
+ * Record one tool call
+ *
+ * @param tool - Tool name
+ * @param durationMs - Wall-clock duration
+ * @param ok - false if the call failed
+ */
+export function recordToolCall(tool: string, durationMs: number, ok: boolean = true): void {
+  let entry = metrics.get(tool);
+  if (!entry) {
+    entry = {
+      calls: 0,
+      errors: 0,
+      totalMs: 0,
+      minMs: Infinity,
+      maxMs: 0,
+      counts: new Array<number>(LATENCY_BUCKETS_MS.length + 1).fill(0),
+    };
+    metrics.set(tool, entry);
+  }
+
+  entry.calls++;
+  if (!ok) {
+    entry.errors++;
+  }
+  entry.totalMs += durationMs;
+  entry.minMs = Math.min(entry.minMs, durationMs);
+  entry.maxMs = Math.max(entry.maxMs, durationMs);
+  entry.counts[bucketIndex(durationMs)]!++;
+}
+
+/**
+ * Run a function and record its duration under a tool name
+ * Rejections count as errors and are rethrown.
+ */
+export async function measureTool<T>(tool: string, fn: () => Promise<T>): Promise<T> {
+  const startedAt = performance.now();
+  try {
+    const result = await fn();
+    recordToolCall(tool, performance.now() - startedAt, true);
+    return result;
+  } catch (error) {
+    recordToolCall(tool, performance.now() - startedAt, false);
+    throw error;
+  }
+}
+
+function percentile(entry: ToolMetrics, p: number): number {
+  const rank = Math.ceil((entry.calls * p) / 100);
+  let seen = 0;
+  for (let i = 0; i < entry.counts.length; i++) {
+    seen += entry.counts[i]!;
+    if (seen >= rank) {
+      return Math.min(LATENCY_BUCKETS_MS[i] ?? Infinity, entry.maxMs);
+    }
+  }
+  return entry.maxMs;
+}
+
+function snapshot(tool: string, entry: ToolMetrics): ToolStats {
+  return {
+    tool,
+    calls: entry.calls,
+    errors: entry.errors,
+    totalMs: entry.totalMs,
+    minMs: entry.calls === 0 ? 0 : entry.minMs,
+    maxMs: entry.maxMs,
+    meanMs: entry.calls === 0 ? 0 : entry.totalMs / entry.calls,
+    p50Ms: percentile(entry, 50),
+    p95Ms: percentile(entry, 95),
+    p99Ms: percentile(entry, 99),
+    histogram: entry.counts.map((count, i) => ({
+      le: LATENCY_BUCKETS_MS[i] ?? null,
+      count,
+    })),
+  };
+}
+
+/**
+ * Get statistics for every tool called so far, sorted by name
+ *
+ * @example
+ * ```typescript
+ * getToolStats();
+ * // [{ tool: 'export-screen', calls: 12, errors: 0, meanMs: 3.1, p95Ms: 5, ... }]
+ * ```
+ */
+export function getToolStats(): ToolStats[] {
+  return [...metrics.entries()]
+    .sort(([a], [b]) => a.localeCompare(b))
+    .map(([tool, entry]) => snapshot(tool, entry));
+}
+
+/**
+ * Clear all recorded calls
+ */
+export function resetToolStats(): void {
+  metrics.clear();
+}
+
+/**
+ * Write a one-line summary per tool to the logger
+ */
+export function logToolStats(): void {
+  for (const stats of getToolStats()) {
+    info(
+      `[stats] ${stats.tool}: ${stats.calls} calls, ${stats.errors} errors, ` +
+        `mean ${stats.meanMs.toFixed(1)}ms, p50 ${stats.p50Ms.toFixed(1)}ms, ` +
+        `p95 ${stats.p95Ms.toFixed(1)}ms, max ${stats.maxMs.toFixed(1)}ms`
+    );
+  }
+}
+
+/**
+ * Log a summary periodically
+ * The timer is unref'd so it never keeps the process alive.
+ *
+ * @param intervalMs - Interval between summaries
+ * @returns Function that stops the reporter
+ */
+export function startStatsReporter(intervalMs: number): () => void {
+  const timer = setInterval(logToolStats, intervalMs);
+  timer.unref();
+  return () => clearInterval(timer);
+}
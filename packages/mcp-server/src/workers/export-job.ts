@@ -0,0 +1,60 @@
+/**
+ * Export jobs shared by the worker pool and its worker threads
+ * A job is one blueprint export (export-screen) or one screen generation (generate_screen)
+ */
+
+import type { ExportFormat, GenerationOptions, OutputFormat } from '../schemas/mcp-schemas.js';
+import { exportScreenTool } from '../tools/export-screen.js';
+import { generateScreenTool } from '../tools/generate-screen.js';
+import { extractErrorMessage } from '../utils/error-handler.js';
+
+export type ExportJob =
+  | { kind: 'blueprint'; blueprint: unknown; format: ExportFormat }
+  | {
+      kind: 'screen';
+      screenDefinition: unknown;
+      outputFormat: OutputFormat;
+      options?: GenerationOptions;
+    };
+
+export interface ExportJobResult {
+  success: boolean;
+  code?: string;
+  errors?: string[];
+  error?: string;
+  /** Time spent exporting, excluding queueing */
+  durationMs: number;
+}
+
+/**
+ * Run one export job on the current thread
+ * Never rejects: failures are reported in the result.
+ */
+export async function runExportJob(job: ExportJob): Promise<ExportJobResult> {
+  const startedAt = performance.now();
+
+  try {
+    const result =
+      job.kind === 'blueprint'
+        ? await exportScreenTool({ blueprint: job.blueprint, format: job.format })
+        : await generateScreenTool({
+            screenDefinition: job.screenDefinition,
+            outputFormat: job.outputFormat,
+            options: job.options,
+          });
+
+    return {
+      success: result.success,
+      code: result.code,
+      errors: 'errors' in result ? result.errors : undefined,
+      error: result.error,
+      durationMs: performance.now() - startedAt,
+    };
+  } catch (error) {
+    return {
+      success: false,
+      error: extractErrorMessage(error),
+      durationMs: performance.now() - startedAt,
+    };
+  }
+}
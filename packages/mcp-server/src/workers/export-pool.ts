@@ -0,0 +1,95 @@
+/**
+ * Export worker pool
+ * Spreads export jobs across a fixed pool of worker threads
+ *
+ * Built on the shared WorkerPool from @tekton/core. When the compiled worker
+ * script is not available (e.g. running from TypeScript sources) or the pool
+ * size is 0, jobs run on the calling thread instead.
+ */
+
+import { existsSync } from 'fs';
+import { fileURLToPath } from 'url';
+import { WorkerPool, defaultWorkerPoolSize, type WorkerPoolStats } from '@tekton/core';
+import { runExportJob, type ExportJob, type ExportJobResult } from './export-job.js';
+
+export interface ExportPoolStats extends WorkerPoolStats {
+  /** Maximum number of workers (0 = jobs run on the calling thread) */
+  size: number;
+}
+
+const WORKER_URL = new URL('./export-worker.js', import.meta.url);
+
+/**
+ * Default pool size
+ * TEKTON_EXPORT_WORKERS overrides it (0 disables worker threads); otherwise
+ * one worker per available CPU, leaving one for the MCP transport (so jobs
+ * run on the calling thread on a single-CPU machine).
+ */
+export function defaultPoolSize(): number {
+  const configured = Number.parseInt(process.env.TEKTON_EXPORT_WORKERS ?? '', 10);
+  if (Number.isFinite(configured) && configured >= 0) {
+    return configured;
+  }
+  return Math.max(0, defaultWorkerPoolSize() - 1);
+}
+
+/**
+ * Fixed-size worker pool for export jobs
+ */
+export class ExportPool {
+  private readonly pool: WorkerPool<ExportJob, ExportJobResult> | null;
+
+  constructor(size: number = defaultPoolSize()) {
+    const workerScript = fileURLToPath(WORKER_URL);
+    this.pool =
+      size >= 1 && existsSync(workerScript)
+        ? new WorkerPool(WORKER_URL, { size, name: 'Export pool' })
+        : null;
+  }
+
+  /**
+   * Number of jobs that can run in parallel
+   */
+  get parallelism(): number {
+    return this.pool?.size ?? 1;
+  }
+
+  /**
+   * Run an export job on a worker thread
+   */
+  run(job: ExportJob): Promise<ExportJobResult> {
+    return this.pool ? this.pool.run(job) : runExportJob(job);
+  }
+
+  stats(): ExportPoolStats {
+    return this.pool?.stats() ?? { size: 0, workers: 0, busy: 0, queued: 0 };
+  }
+
+  /**
+   * Stop all workers and reject pending jobs
+   */
+  async terminate(): Promise<void> {
+    await this.pool?.terminate();
+  }
+}
+
+let defaultPool: ExportPool | null = null;
+
+/**
+ * Get the shared export pool (created on first use)
+ */
+export function getExportPool(): ExportPool {
+  if (!defaultPool) {
+    defaultPool = new ExportPool();
+  }
+  return defaultPool;
+}
+
+/**
+ * Terminate the shared export pool
+ */
+export async function shutdownExportPool(): Promise<void> {
+  const pool = defaultPool;
+  defaultPool = null;
+  await pool?.terminate();
+}
@@ -0,0 +1,9 @@
+/**
+ * Export worker
+ * worker_threads entry point that runs export jobs off the main thread
+ */
+
+import { serveWorkerJobs } from '@tekton/core';
+import { runExportJob } from './export-job.js';
+
+serveWorkerJobs(runExportJob);
@@ -1,12 +1,36 @@
 import type { OKLCHColor, RGBColor } from './schemas';
 
+/**
+ * OKLCH colors in struct-of-arrays layout
+ * Index i across l, c and h is one color
+ */
+export interface OKLCHBatch {
+  l: Float64Array;
+  c: Float64Array;
+  h: Float64Array;
+}
+
+/**
+ * RGB colors (0-255 channels) in struct-of-arrays layout
+ * Index i across r, g and b is one color
+ */
+export interface RGBBatch {
+  r: Float64Array;
+  g: Float64Array;
+  b: Float64Array;
+}
+
+/**
+ * Scratch buffer for single-color conversions
+ */
+const scratch = new Float64Array(3);
+
 /**
  * Convert OKLCH to linear RGB
  * Based on OKLab color space conversion
+ * Writes r, g, b into out[0..2]
  */
-function oklchToLinearRgb(oklch: OKLCHColor): { r: number; g: number; b: number } {
-  const { l, c, h } = oklch;
-
+function oklchToLinearRgb(l: number, c: number, h: number, out: Float64Array): void {
   // Convert OKLCH to OKLab
   const hRad = (h * Math.PI) / 180;
   const a = c * Math.cos(hRad);
@@ -21,11 +45,9 @@ function oklchToLinearRgb(oklch: OKLCHColor): { r: number; g: number; b: number
   const m3 = m_ * m_ * m_;
   const s3 = s_ * s_ * s_;
 
-  return {
-    r: +4.0767416621 * l3 - 3.3077115913 * m3 + 0.2309699292 * s3,
-    g: -1.2684380046 * l3 + 2.6097574011 * m3 - 0.3413193965 * s3,
-    b: -0.0041960863 * l3 - 0.7034186147 * m3 + 1.707614701 * s3,
-  };
+  out[0] = +4.0767416621 * l3 - 3.3077115913 * m3 + 0.2309699292 * s3;
+  out[1] = -1.2684380046 * l3 + 2.6097574011 * m3 - 0.3413193965 * s3;
+  out[2] = -0.0041960863 * l3 - 0.7034186147 * m3 + 1.707614701 * s3;
 }
 
 /**
@@ -50,6 +72,28 @@ function srgbToLinear(srgb: number): number {
   return (Math.sign(srgb) || 1) * Math.pow((abs + 0.055) / 1.055, 2.4);
 }
 
+/**
+ * Lookup table of srgbToLinear for 8-bit channels (built on first use)
+ */
+let srgbToLinearTable: Float64Array | null = null;
+
+/**
+ * Convert a 0-255 sRGB channel to linear RGB
+ * Integer channels are served from the lookup table
+ */
+function srgbByteToLinear(channel: number): number {
+  if ((channel & 255) !== channel) {
+    return srgbToLinear(channel / 255);
+  }
+  if (!srgbToLinearTable) {
+    srgbToLinearTable = new Float64Array(256);
+    for (let i = 0; i < 256; i++) {
+      srgbToLinearTable[i] = srgbToLinear(i / 255);
+    }
+  }
+  return srgbToLinearTable[channel];
+}
+
 /**
  * Clamp value between 0 and 1
  */
@@ -57,26 +101,34 @@ function clamp01(value: number): number {
   return Math.max(0, Math.min(1, value));
 }
 
+/**
+ * Convert a linear RGB channel to a 0-255 sRGB channel
+ */
+function linearToSrgbByte(linear: number): number {
+  return Math.round(clamp01(linearToSrgb(linear)) * 255);
+}
+
 /**
  * Convert OKLCH to RGB
  */
 export function oklchToRgb(oklch: OKLCHColor): RGBColor {
-  const linear = oklchToLinearRgb(oklch);
+  oklchToLinearRgb(oklch.l, oklch.c, oklch.h, scratch);
 
-  const r = Math.round(clamp01(linearToSrgb(linear.r)) * 255);
-  const g = Math.round(clamp01(linearToSrgb(linear.g)) * 255);
-  const b = Math.round(clamp01(linearToSrgb(linear.b)) * 255);
+  const r = linearToSrgbByte(scratch[0]);
+  const g = linearToSrgbByte(scratch[1]);
+  const b = linearToSrgbByte(scratch[2]);
 
   return { r, g, b };
 }
 
 /**
- * Convert RGB to linear RGB then to OKLab
+ * Convert RGB to linear RGB then to OKLab, then to OKLCH
+ * Writes l, c, h into out[0..2]
  */
-function rgbToOklab(rgb: RGBColor): { l: number; a: number; b: number } {
-  const r = srgbToLinear(rgb.r / 255);
-  const g = srgbToLinear(rgb.g / 255);
-  const b = srgbToLinear(rgb.b / 255);
+function rgbToOklchComponents(red: number, green: number, blue: number, out: Float64Array): void {
+  const r = srgbByteToLinear(red);
+  const g = srgbByteToLinear(green);
+  const b = srgbByteToLinear(blue);
 
   const l = 0.4122214708 * r + 0.5363325363 * g + 0.0514459929 * b;
   const m = 0.2119034982 * r + 0.6806995451 * g + 0.1073969566 * b;
@@ -86,28 +138,28 @@ function rgbToOklab(rgb: RGBColor): { l: number; a: number; b: number } {
   const m_ = Math.cbrt(m);
   const s_ = Math.cbrt(s);
 
-  return {
-    l: 0.2104542553 * l_ + 0.793617785 * m_ - 0.0040720468 * s_,
-    a: 1.9779984951 * l_ - 2.428592205 * m_ + 0.4505937099 * s_,
-    b: 0.0259040371 * l_ + 0.7827717662 * m_ - 0.808675766 * s_,
-  };
-}
-
-/**
- * Convert RGB to OKLCH
- */
-export function rgbToOklch(rgb: RGBColor): OKLCHColor {
-  const { l, a, b } = rgbToOklab(rgb);
+  const labL = 0.2104542553 * l_ + 0.793617785 * m_ - 0.0040720468 * s_;
+  const labA = 1.9779984951 * l_ - 2.428592205 * m_ + 0.4505937099 * s_;
+  const labB = 0.0259040371 * l_ + 0.7827717662 * m_ - 0.808675766 * s_;
 
-  const c = Math.sqrt(a * a + b * b);
-  let h = (Math.atan2(b, a) * 180) / Math.PI;
+  let h = (Math.atan2(labB, labA) * 180) / Math.PI;
 
   // Normalize hue to 0-360
   if (h < 0) {
     h += 360;
   }
 
-  return { l, c, h };
+  out[0] = labL;
+  out[1] = Math.sqrt(labA * labA + labB * labB);
+  out[2] = h;
+}
+
+/**
+ * Convert RGB to OKLCH
+ */
+export function rgbToOklch(rgb: RGBColor): OKLCHColor {
+  rgbToOklchComponents(rgb.r, rgb.g, rgb.b, scratch);
+  return { l: scratch[0], c: scratch[1], h: scratch[2] };
 }
 
 /**
@@ -134,3 +186,93 @@ export function hexToOklch(hex: string): OKLCHColor {
 
   return rgbToOklch({ r, g, b });
 }
+
+/**
+ * Pack OKLCH colors into struct-of-arrays layout
+ */
+export function toOKLCHBatch(colors: readonly OKLCHColor[]): OKLCHBatch {
+  const n = colors.length;
+  const batch: OKLCHBatch = {
+    l: new Float64Array(n),
+    c: new Float64Array(n),
+    h: new Float64Array(n),
+  };
+
+  for (let i = 0; i < n; i++) {
+    batch.l[i] = colors[i].l;
+    batch.c[i] = colors[i].c;
+    batch.h[i] = colors[i].h;
+  }
+
+  return batch;
+}
+
+/**
+ * Pack RGB colors into struct-of-arrays layout
+ */
+export function toRGBBatch(colors: readonly RGBColor[]): RGBBatch {
+  const n = colors.length;
+  const batch: RGBBatch = {
+    r: new Float64Array(n),
+    g: new Float64Array(n),
+    b: new Float64Array(n),
+  };
+
+  for (let i = 0; i < n; i++) {
+    batch.r[i] = colors[i].r;
+    batch.g[i] = colors[i].g;
+    batch.b[i] = colors[i].b;
+  }
+
+  return batch;
+}
+
+/**
+ * Convert a batch of OKLCH colors to RGB
+ * Produces the same values as oklchToRgb for every color
+ *
+ * @param out - Optional output batch to reuse (must have the same length)
+ */
+export function oklchToRgbBatch(colors: OKLCHBatch, out?: RGBBatch): RGBBatch {
+  const n = colors.l.length;
+  const result = out ?? {
+    r: new Float64Array(n),
+    g: new Float64Array(n),
+    b: new Float64Array(n),
+  };
+  const linear = new Float64Array(3);
+
+  for (let i = 0; i < n; i++) {
+    oklchToLinearRgb(colors.l[i], colors.c[i], colors.h[i], linear);
+    result.r[i] = linearToSrgbByte(linear[0]);
+    result.g[i] = linearToSrgbByte(linear[1]);
+    result.b[i] = linearToSrgbByte(linear[2]);
+  }
+
+  return result;
+}
+
+/**
+ * Convert a batch of RGB colors to OKLCH
+ * Produces the same values as rgbToOklch for every color
+ *
+ * @param out - Optional output batch to reuse (must have the same length)
+ */
+export function rgbToOklchBatch(colors: RGBBatch, out?: OKLCHBatch): OKLCHBatch {
+  const n = colors.r.length;
+  const result = out ?? {
+    l: new Float64Array(n),
+    c: new Float64Array(n),
+    h: new Float64Array(n),
+  };
+  const lch = new Float64Array(3);
+
+  for (let i = 0; i < n; i++) {
+    rgbToOklchComponents(colors.r[i], colors.g[i], colors.b[i], lch);
+    result.l[i] = lch[0];
+    result.c[i] = lch[1];
+    result.h[i] = lch[2];
+  }
+
+  return result;
+}
@@ -1,13 +0,0 @@
-export * from './schemas';
-export { oklchToRgb, rgbToOklch, oklchToHex, hexToOklch } from './color-conversion';
-export { generateLightnessScale, generateColorScales } from './scale-generator';
-export { calculateContrastRatio, checkWCAGCompliance, validateColorPair } from './wcag-validator';
-export { generateToken, generateTokenId, TokenGenerator, type TokenGeneratorConfig, } from './token-generator';
-export { buttonTheme, inputTheme, cardTheme, badgeTheme, alertTheme, linkTheme, checkboxTheme, radioTheme, generateComponentThemes, generateComponentPresets, // Backward compatibility alias
-COMPONENT_THEMES, } from './component-themes';
-export { generateNeutralPalette, type NeutralPaletteConfig } from './generator/neutral-palette';
-export { mapSemanticTokens, type SemanticTokenConfig, type SemanticTokens, } from './generator/semantic-mapper';
-export { exportToCSS, exportToDTCG, exportToTailwind, type ExportConfig } from './generator/output';
-export { QuestionnaireSchema, DEFAULT_QUESTIONNAIRE, type Questionnaire, } from './generator/questionnaire';
-export declare const VERSION = "0.1.0";
-//# sourceMappingURL=index.d.ts.map
\ No newline at end of file
@@ -1,25 +0,0 @@
-// Main entry point for Tekton design token generator
-// Schemas and types
-export * from './schemas';
-// Color conversion utilities
-export { oklchToRgb, rgbToOklch, oklchToHex, hexToOklch } from './color-conversion';
-// Scale generation
-export { generateLightnessScale, generateColorScales } from './scale-generator';
-// WCAG validation
-export { calculateContrastRatio, checkWCAGCompliance, validateColorPair } from './wcag-validator';
-// Token generation
-export { generateToken, generateTokenId, TokenGenerator, } from './token-generator';
-// Component themes
-export { buttonTheme, inputTheme, cardTheme, badgeTheme, alertTheme, linkTheme, checkboxTheme, radioTheme, generateComponentThemes, generateComponentPresets, // Backward compatibility alias
-COMPONENT_THEMES, } from './component-themes';
-// Neutral palette generation
-export { generateNeutralPalette } from './generator/neutral-palette';
-// Semantic token mapping
-export { mapSemanticTokens, } from './generator/semantic-mapper';
-// Output format exporters
-export { exportToCSS, exportToDTCG, exportToTailwind } from './generator/output';
-// Questionnaire schema
-export { QuestionnaireSchema, DEFAULT_QUESTIONNAIRE, } from './generator/questionnaire';
-// Version
-export const VERSION = '0.1.0';
-//# sourceMappingURL=index.js.map
\ No newline at end of file
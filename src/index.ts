@@ -4,13 +4,37 @@
 export * from './schemas';
 
 // Color conversion utilities
-export { oklchToRgb, rgbToOklch, oklchToHex, hexToOklch } from './color-conversion';
+export {
+  oklchToRgb,
+  rgbToOklch,
+  oklchToHex,
+  hexToOklch,
+  toOKLCHBatch,
+  toRGBBatch,
+  oklchToRgbBatch,
+  rgbToOklchBatch,
+  type OKLCHBatch,
+  type RGBBatch,
+} from './color-conversion';
 
 // Scale generation
-export { generateLightnessScale, generateColorScales } from './scale-generator';
+export { generateLightnessScale, generateColorScales, scalesToOKLCHBatch } from './scale-generator';
 
 // WCAG validation
-export { calculateContrastRatio, checkWCAGCompliance, validateColorPair } from './wcag-validator';
+export {
+  calculateContrastRatio,
+  checkWCAGCompliance,
+  validateColorPair,
+  suggestLightnessAdjustment,
+  solveContrastLightness,
+  repairColorScale,
+  clearContrastSolverCache,
+  calculateRelativeLuminanceBatch,
+  calculateContrastMatrix,
+  checkWCAGComplianceBatch,
+  type ContrastMatrix,
+  type ContrastSolution,
+} from './wcag-validator';
 
 // Token generation
 export {
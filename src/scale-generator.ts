@@ -1,4 +1,5 @@
 import type { OKLCHColor, ColorScale } from './schemas';
+import type { OKLCHBatch } from './color-conversion';
 
 /**
  * Scale step values and their target lightness adjustments
@@ -90,3 +91,36 @@ export function generateColorScales(
 
   return scales;
 }
+
+/**
+ * Flatten color scales into a single OKLCH batch
+ * keys[i] names the color at index i (e.g., "primary.500")
+ */
+export function scalesToOKLCHBatch(scales: Record<string, ColorScale>): {
+  keys: string[];
+  batch: OKLCHBatch;
+} {
+  const names = Object.keys(scales);
+  const n = names.length * SCALE_STEPS.length;
+  const keys: string[] = new Array(n);
+  const batch: OKLCHBatch = {
+    l: new Float64Array(n),
+    c: new Float64Array(n),
+    h: new Float64Array(n),
+  };
+
+  let i = 0;
+  for (const name of names) {
+    const scale = scales[name];
+    for (const step of SCALE_STEPS) {
+      const color = scale[step.toString() as keyof ColorScale];
+      keys[i] = `${name}.${step}`;
+      batch.l[i] = color.l;
+      batch.c[i] = color.c;
+      batch.h[i] = color.h;
+      i++;
+    }
+  }
+
+  return { keys, batch };
+}
@@ -1,41 +1,88 @@
-import type { RGBColor, AccessibilityCheck } from './schemas';
+import type { RGBColor, OKLCHColor, ColorScale, AccessibilityCheck } from './schemas';
+import { oklchToRgb, rgbToOklch, oklchToRgbBatch, type RGBBatch } from './color-conversion';
 
 /**
- * Calculate relative luminance of an RGB color
- * Formula from WCAG 2.1 specification
+ * Contrast ratios between two palettes
+ * ratios[row * cols + col] is the ratio of foreground `row` on background `col`
  */
-function calculateRelativeLuminance(rgb: RGBColor): number {
-  const { r, g, b } = rgb;
+export interface ContrastMatrix {
+  rows: number;
+  cols: number;
+  ratios: Float64Array;
+}
 
-  // Convert to 0-1 range
-  const [rs, gs, bs] = [r / 255, g / 255, b / 255];
+/**
+ * Apply gamma correction to a 0-1 channel (WCAG 2.1)
+ */
+function linearize(channel: number): number {
+  return channel <= 0.03928 ? channel / 12.92 : Math.pow((channel + 0.055) / 1.055, 2.4);
+}
 
-  // Apply gamma correction
-  const linearize = (channel: number): number => {
-    return channel <= 0.03928 ? channel / 12.92 : Math.pow((channel + 0.055) / 1.055, 2.4);
-  };
+/**
+ * Lookup table of linearize for 8-bit channels (built on first use)
+ */
+let linearizeTable: Float64Array | null = null;
 
-  const [rl, gl, bl] = [linearize(rs), linearize(gs), linearize(bs)];
+/**
+ * Linearize a 0-255 channel
+ * Integer channels are served from the lookup table
+ */
+function linearizeByte(channel: number): number {
+  if ((channel & 255) !== channel) {
+    return linearize(channel / 255);
+  }
+  if (!linearizeTable) {
+    linearizeTable = new Float64Array(256);
+    for (let i = 0; i < 256; i++) {
+      linearizeTable[i] = linearize(i / 255);
+    }
+  }
+  return linearizeTable[channel];
+}
 
+/**
+ * Calculate relative luminance of 0-255 RGB channels
+ * Formula from WCAG 2.1 specification
+ */
+function relativeLuminance(r: number, g: number, b: number): number {
   // Calculate luminance with weighted RGB values
-  return 0.2126 * rl + 0.7152 * gl + 0.0722 * bl;
+  return 0.2126 * linearizeByte(r) + 0.7152 * linearizeByte(g) + 0.0722 * linearizeByte(b);
 }
 
 /**
- * Calculate contrast ratio between two RGB colors
- * Returns a value between 1 and 21
- * Formula: (L1 + 0.05) / (L2 + 0.05) where L1 is the lighter color
+ * Calculate relative luminance of an RGB color
+ * Formula from WCAG 2.1 specification
  */
-export function calculateContrastRatio(color1: RGBColor, color2: RGBColor): number {
-  const lum1 = calculateRelativeLuminance(color1);
-  const lum2 = calculateRelativeLuminance(color2);
+function calculateRelativeLuminance(rgb: RGBColor): number {
+  return relativeLuminance(rgb.r, rgb.g, rgb.b);
+}
 
+/**
+ * Contrast ratio between two relative luminances
+ */
+function luminanceContrast(lum1: number, lum2: number): number {
   const lighter = Math.max(lum1, lum2);
   const darker = Math.min(lum1, lum2);
 
   return (lighter + 0.05) / (darker + 0.05);
 }
 
+/**
+ * Minimum contrast ratio for a WCAG level
+ */
+function getWCAGThreshold(level: 'AA' | 'AAA', isLargeText: boolean): number {
+  return isLargeText ? (level === 'AA' ? 3.0 : 4.5) : level === 'AA' ? 4.5 : 7.0;
+}
+
+/**
+ * Calculate contrast ratio between two RGB colors
+ * Returns a value between 1 and 21
+ * Formula: (L1 + 0.05) / (L2 + 0.05) where L1 is the lighter color
+ */
+export function calculateContrastRatio(color1: RGBColor, color2: RGBColor): number {
+  return luminanceContrast(calculateRelativeLuminance(color1), calculateRelativeLuminance(color2));
+}
+
 /**
  * Check if a contrast ratio meets WCAG compliance level
  * WCAG AA: minimum 4.5:1 for normal text, 3:1 for large text
@@ -46,7 +93,7 @@ export function checkWCAGCompliance(
   level: 'AA' | 'AAA',
   isLargeText: boolean = false
 ): AccessibilityCheck {
-  const threshold = isLargeText ? (level === 'AA' ? 3.0 : 4.5) : level === 'AA' ? 4.5 : 7.0;
+  const threshold = getWCAGThreshold(level, isLargeText);
 
   return {
     contrastRatio,
@@ -75,9 +122,239 @@ export function validateColorPair(
   };
 }
 
+/**
+ * Result of the contrast solver
+ */
+export interface ContrastSolution {
+  /** Closest compliant color (same chroma and hue as the input) */
+  color: OKLCHColor;
+  /** sRGB value of the solved color */
+  rgb: RGBColor;
+  /** Contrast ratio of the solved color against the background */
+  contrastRatio: number;
+  /** False when no lightness reaches the level (best effort returned) */
+  passed: boolean;
+  /** oklchToRgb evaluations spent by this call (memoized hits skip the search) */
+  iterations: number;
+}
+
+/**
+ * Lightness precision of the binary search
+ * 2^-14 is finer than one 8-bit sRGB step
+ */
+const LIGHTNESS_EPSILON = 1 / 16384;
+
+/**
+ * Probes per direction used to bracket the nearest compliant lightness
+ * Gamut clipping makes luminance non-monotonic near the extremes, so the
+ * search brackets with coarse probes before bisecting.
+ */
+const LIGHTNESS_PROBES = 16;
+
+/**
+ * Find the compliant lightness closest to `from` in the direction of `to`
+ * Probes the range from near to far, then bisects between the last failing
+ * and the first passing probe.
+ *
+ * @returns Compliant lightness, or null if no probe passes
+ */
+function searchLightness(from: number, to: number, passes: (l: number) => boolean): number | null {
+  let failing = from;
+  let passing: number | null = null;
+
+  for (let k = 1; k <= LIGHTNESS_PROBES; k++) {
+    const probe = from + ((to - from) * k) / LIGHTNESS_PROBES;
+    if (passes(probe)) {
+      passing = probe;
+      break;
+    }
+    failing = probe;
+  }
+
+  if (passing === null) {
+    return null;
+  }
+
+  while (Math.abs(passing - failing) > LIGHTNESS_EPSILON) {
+    const mid = (passing + failing) / 2;
+    if (passes(mid)) {
+      passing = mid;
+    } else {
+      failing = mid;
+    }
+  }
+
+  return passing;
+}
+
+/**
+ * Memoized solved lightness keyed by quantized (color, background, level)
+ * Least recently used entries are evicted first (Map insertion order).
+ */
+const solverCache = new Map<string, number>();
+const SOLVER_CACHE_SIZE = 10000;
+
+/**
+ * Cache key quantization: 2^-14 in lightness and chroma, 1/64 degree in hue
+ * (each below one 8-bit sRGB step), so near-equal inputs share an entry.
+ * Only the key is quantized; results are always checked on the exact input.
+ */
+const CHANNEL_QUANTUM = 16384;
+const HUE_QUANTUM = 64;
+
+/**
+ * Clear memoized contrast solutions
+ */
+export function clearContrastSolverCache(): void {
+  solverCache.clear();
+}
+
+/**
+ * Find the closest WCAG-compliant color by searching OKLCH lightness
+ * Chroma and hue are kept; lightness is searched towards black and towards
+ * white through oklchToRgb (at most 16 probes + 10 halvings per side),
+ * and the compliant candidate nearest to the original lightness wins.
+ * Compliant colors are returned unchanged. Solved lightness is memoized per
+ * quantized input (see CHANNEL_QUANTUM), then re-checked against the exact
+ * chroma and hue and nudged towards the passing side if needed.
+ */
+export function solveContrastLightness(
+  color: OKLCHColor,
+  background: RGBColor,
+  level: 'AA' | 'AAA' = 'AA',
+  isLargeText: boolean = false
+): ContrastSolution {
+  const threshold = getWCAGThreshold(level, isLargeText);
+  const bgLum = calculateRelativeLuminance(background);
+
+  const inputRgb = oklchToRgb(color);
+  const inputRatio = luminanceContrast(calculateRelativeLuminance(inputRgb), bgLum);
+  if (inputRatio >= threshold) {
+    return {
+      color: { ...color },
+      rgb: inputRgb,
+      contrastRatio: inputRatio,
+      passed: true,
+      iterations: 1,
+    };
+  }
+
+  const ql = Math.round(color.l * CHANNEL_QUANTUM);
+  const qc = Math.round(color.c * CHANNEL_QUANTUM);
+  const qh = Math.round(color.h * HUE_QUANTUM);
+  const key = `${ql},${qc},${qh}|${background.r},${background.g},${background.b}|${level}|${isLargeText}`;
+
+  let iterations = 1;
+  let solvedL = solverCache.get(key);
+  if (solvedL !== undefined) {
+    solverCache.delete(key);
+  } else {
+    const search = searchContrastLightness(
+      { l: ql / CHANNEL_QUANTUM, c: qc / CHANNEL_QUANTUM, h: qh / HUE_QUANTUM },
+      threshold,
+      bgLum
+    );
+    solvedL = search.l;
+    iterations += search.iterations;
+    if (solverCache.size >= SOLVER_CACHE_SIZE) {
+      solverCache.delete(solverCache.keys().next().value as string);
+    }
+  }
+  solverCache.set(key, solvedL);
+
+  const solution = settleLightness(color, solvedL, background, threshold, bgLum);
+  solution.iterations += iterations;
+  return solution;
+}
+
+/**
+ * Search the lightness closest to `color.l` that reaches `threshold`
+ * Falls back to the higher-contrast extreme (0 or 1) when neither direction
+ * reaches it.
+ */
+function searchContrastLightness(
+  color: OKLCHColor,
+  threshold: number,
+  bgLum: number
+): { l: number; iterations: number } {
+  let iterations = 0;
+
+  const luminanceAt = (l: number): number => {
+    iterations++;
+    return calculateRelativeLuminance(oklchToRgb({ l, c: color.c, h: color.h }));
+  };
+
+  // Foreground darker than background, or lighter, with enough contrast
+  const darkEnough = (lum: number) => lum <= bgLum && luminanceContrast(lum, bgLum) >= threshold;
+  const lightEnough = (lum: number) => lum >= bgLum && luminanceContrast(lum, bgLum) >= threshold;
+
+  const startLum = luminanceAt(color.l);
+  if (darkEnough(startLum) || lightEnough(startLum)) {
+    return { l: color.l, iterations };
+  }
+
+  // The lighter side only needs to search as far as the darker solution
+  const darker = searchLightness(color.l, 0, l => darkEnough(luminanceAt(l)));
+  const lighterLimit = darker === null ? 1 : Math.min(1, 2 * color.l - darker);
+  const lighter = searchLightness(color.l, lighterLimit, l => lightEnough(luminanceAt(l)));
+
+  if (darker !== null && lighter !== null) {
+    return { l: color.l - darker <= lighter - color.l ? darker : lighter, iterations };
+  }
+  if (darker !== null || lighter !== null) {
+    return { l: (darker ?? lighter) as number, iterations };
+  }
+
+  // Neither direction reaches the level: use the higher-contrast extreme
+  const blackRatio = luminanceContrast(luminanceAt(0), bgLum);
+  const whiteRatio = luminanceContrast(luminanceAt(1), bgLum);
+  return { l: blackRatio >= whiteRatio ? 0 : 1, iterations };
+}
+
+/**
+ * Evaluate a solved lightness with the exact chroma and hue
+ * A lightness solved on the quantized color can land just on the failing
+ * side of the threshold; it is then moved further from the background in
+ * doubling steps until it passes or reaches 0 or 1.
+ */
+function settleLightness(
+  color: OKLCHColor,
+  l: number,
+  background: RGBColor,
+  threshold: number,
+  bgLum: number
+): ContrastSolution {
+  let iterations = 1;
+  let rgb = oklchToRgb({ l, c: color.c, h: color.h });
+  let lum = calculateRelativeLuminance(rgb);
+  const direction = lum <= bgLum ? -1 : 1;
+
+  for (
+    let step = LIGHTNESS_EPSILON;
+    luminanceContrast(lum, bgLum) < threshold && l > 0 && l < 1;
+    step *= 2
+  ) {
+    l = Math.min(1, Math.max(0, l + direction * step));
+    rgb = oklchToRgb({ l, c: color.c, h: color.h });
+    lum = calculateRelativeLuminance(rgb);
+    iterations++;
+  }
+
+  const contrastRatio = calculateContrastRatio(rgb, background);
+  return {
+    color: { l, c: color.c, h: color.h },
+    rgb,
+    contrastRatio,
+    passed: contrastRatio >= threshold,
+    iterations,
+  };
+}
+
 /**
  * Find the minimum lightness adjustment needed for WCAG compliance
- * Returns suggested lightness value, or null if already compliant
+ * Returns the OKLCH lightness (0-1) of the closest compliant foreground with
+ * the same chroma and hue (see solveContrastLightness), or null if already
+ * compliant
  */
 export function suggestLightnessAdjustment(
   foreground: RGBColor,
@@ -91,16 +368,106 @@ export function suggestLightnessAdjustment(
     return null;
   }
 
-  // Simple heuristic: suggest darkening or lightening by 10% increments
-  // In production, this would use OKLCH adjustments
-  const fgLum = calculateRelativeLuminance(foreground);
+  return solveContrastLightness(rgbToOklch(foreground), background, targetLevel).color.l;
+}
+
+/**
+ * Repair every step of a color scale against a background
+ * Compliant steps are kept as-is; failing steps are replaced by the closest
+ * compliant color. Works for scales from generateLightnessScale and
+ * generateNeutralPalette.
+ */
+export function repairColorScale(
+  scale: ColorScale,
+  background: RGBColor,
+  level: 'AA' | 'AAA' = 'AA',
+  isLargeText: boolean = false
+): ColorScale {
+  const steps = Object.keys(scale) as Array<keyof ColorScale>;
+  const n = steps.length;
+  const colors = {
+    l: new Float64Array(n),
+    c: new Float64Array(n),
+    h: new Float64Array(n),
+  };
+  steps.forEach((step, i) => {
+    colors.l[i] = scale[step].l;
+    colors.c[i] = scale[step].c;
+    colors.h[i] = scale[step].h;
+  });
+
+  // Score the whole scale at once, then solve only failing steps
+  const luminance = calculateRelativeLuminanceBatch(oklchToRgbBatch(colors));
   const bgLum = calculateRelativeLuminance(background);
+  const threshold = getWCAGThreshold(level, isLargeText);
 
-  if (fgLum > bgLum) {
-    // Foreground is lighter, suggest darkening it
-    return Math.max(0, fgLum - 0.1);
-  } else {
-    // Foreground is darker, suggest lightening background
-    return Math.min(1, bgLum + 0.1);
+  const repaired = { ...scale };
+  steps.forEach((step, i) => {
+    if (luminanceContrast(luminance[i], bgLum) < threshold) {
+      repaired[step] = solveContrastLightness(scale[step], background, level, isLargeText).color;
+    }
+  });
+
+  return repaired;
+}
+
+/**
+ * Calculate relative luminance for every color in a batch
+ */
+export function calculateRelativeLuminanceBatch(colors: RGBBatch): Float64Array {
+  const n = colors.r.length;
+  const luminance = new Float64Array(n);
+
+  for (let i = 0; i < n; i++) {
+    luminance[i] = relativeLuminance(colors.r[i], colors.g[i], colors.b[i]);
   }
+
+  return luminance;
+}
+
+/**
+ * Calculate contrast ratios for every foreground/background combination
+ * Luminance is computed once per color; each ratio equals calculateContrastRatio
+ * for the same pair. Without backgrounds, the palette is compared with itself.
+ */
+export function calculateContrastMatrix(
+  foregrounds: RGBBatch,
+  backgrounds: RGBBatch = foregrounds
+): ContrastMatrix {
+  const fgLum = calculateRelativeLuminanceBatch(foregrounds);
+  const bgLum =
+    backgrounds === foregrounds ? fgLum : calculateRelativeLuminanceBatch(backgrounds);
+
+  const rows = fgLum.length;
+  const cols = bgLum.length;
+  const ratios = new Float64Array(rows * cols);
+
+  for (let row = 0; row < rows; row++) {
+    const offset = row * cols;
+    const lum = fgLum[row];
+    for (let col = 0; col < cols; col++) {
+      ratios[offset + col] = luminanceContrast(lum, bgLum[col]);
+    }
+  }
+
+  return { rows, cols, ratios };
+}
+
+/**
+ * Check every ratio of a contrast matrix against a WCAG level
+ * Returns 1 for passing pairs and 0 otherwise, in the matrix layout
+ */
+export function checkWCAGComplianceBatch(
+  matrix: ContrastMatrix,
+  level: 'AA' | 'AAA',
+  isLargeText: boolean = false
+): Uint8Array {
+  const threshold = getWCAGThreshold(level, isLargeText);
+  const passed = new Uint8Array(matrix.ratios.length);
+
+  for (let i = 0; i < matrix.ratios.length; i++) {
+    passed[i] = matrix.ratios[i] >= threshold ? 1 : 0;
+  }
+
+  return passed;
 }
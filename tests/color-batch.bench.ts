@@ -0,0 +1,73 @@
+/**
+ * Batch Color Pipeline Benchmark
+ *
+ * Converts a 10k-color OKLCH palette and scores it against 16 backgrounds
+ * with the scalar functions and with the struct-of-arrays batch pipeline,
+ * then builds a 1k x 1k contrast matrix.
+ *
+ * Usage: pnpm bench color-batch
+ */
+
+import { bench, describe } from 'vitest';
+import { oklchToRgb, oklchToRgbBatch, toOKLCHBatch, toRGBBatch } from '../src/color-conversion';
+import {
+  calculateContrastMatrix,
+  calculateContrastRatio,
+  checkWCAGCompliance,
+  checkWCAGComplianceBatch,
+} from '../src/wcag-validator';
+import type { OKLCHColor } from '../src/schemas';
+
+/**
+ * Deterministic pseudo-random palette (mulberry32)
+ */
+function makePalette(size: number, seed: number): OKLCHColor[] {
+  let state = seed;
+  const random = () => {
+    state = (state + 0x6d2b79f5) | 0;
+    let t = Math.imul(state ^ (state >>> 15), 1 | state);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+
+  return Array.from({ length: size }, () => ({
+    l: random(),
+    c: random() * 0.37,
+    h: random() * 360,
+  }));
+}
+
+const palette = makePalette(10_000, 1);
+const backgrounds = makePalette(16, 2).map(oklchToRgb);
+
+describe('Convert and score 10k colors x 16 backgrounds (AA)', () => {
+  bench('scalar oklchToRgb + calculateContrastRatio', () => {
+    for (const fg of palette.map(oklchToRgb)) {
+      for (const bg of backgrounds) {
+        checkWCAGCompliance(calculateContrastRatio(fg, bg), 'AA');
+      }
+    }
+  });
+
+  bench('batch oklchToRgbBatch + calculateContrastMatrix', () => {
+    const rgb = oklchToRgbBatch(toOKLCHBatch(palette));
+    checkWCAGComplianceBatch(calculateContrastMatrix(rgb, toRGBBatch(backgrounds)), 'AA');
+  });
+});
+
+describe('1k x 1k contrast matrix', () => {
+  const rgbColors = palette.slice(0, 1000).map(oklchToRgb);
+  const rgb = oklchToRgbBatch(toOKLCHBatch(palette.slice(0, 1000)));
+
+  bench('scalar calculateContrastRatio', () => {
+    for (const fg of rgbColors) {
+      for (const bg of rgbColors) {
+        calculateContrastRatio(fg, bg);
+      }
+    }
+  });
+
+  bench('calculateContrastMatrix', () => {
+    calculateContrastMatrix(rgb);
+  });
+});
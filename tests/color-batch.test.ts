@@ -0,0 +1,149 @@
+import { describe, it, expect } from 'vitest';
+import {
+  oklchToRgb,
+  rgbToOklch,
+  toOKLCHBatch,
+  toRGBBatch,
+  oklchToRgbBatch,
+  rgbToOklchBatch,
+} from '../src/color-conversion';
+import {
+  calculateContrastRatio,
+  checkWCAGCompliance,
+  calculateContrastMatrix,
+  checkWCAGComplianceBatch,
+} from '../src/wcag-validator';
+import { generateColorScales, scalesToOKLCHBatch } from '../src/scale-generator';
+import type { OKLCHColor, RGBColor } from '../src/schemas';
+
+/**
+ * Deterministic pseudo-random palette (mulberry32)
+ */
+function makePalette(size: number, seed = 42): OKLCHColor[] {
+  let state = seed;
+  const random = () => {
+    state = (state + 0x6d2b79f5) | 0;
+    let t = Math.imul(state ^ (state >>> 15), 1 | state);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+
+  return Array.from({ length: size }, () => ({
+    l: random(),
+    c: random() * 0.37,
+    h: random() * 360,
+  }));
+}
+
+describe('Batch color conversion', () => {
+  const palette = makePalette(500);
+
+  it('should match oklchToRgb for every color', () => {
+    const rgb = oklchToRgbBatch(toOKLCHBatch(palette));
+
+    palette.forEach((color, i) => {
+      expect({ r: rgb.r[i], g: rgb.g[i], b: rgb.b[i] }).toEqual(oklchToRgb(color));
+    });
+  });
+
+  it('should match rgbToOklch for every color', () => {
+    const rgbColors: RGBColor[] = palette.map(oklchToRgb);
+    rgbColors.push({ r: 12.5, g: 0, b: 255 }); // non-integer channel
+    const lch = rgbToOklchBatch(toRGBBatch(rgbColors));
+
+    rgbColors.forEach((color, i) => {
+      expect({ l: lch.l[i], c: lch.c[i], h: lch.h[i] }).toEqual(rgbToOklch(color));
+    });
+  });
+
+  it('should reuse output buffers', () => {
+    const batch = toOKLCHBatch(palette.slice(0, 10));
+    const out = toRGBBatch(Array.from({ length: 10 }, () => ({ r: 0, g: 0, b: 0 })));
+
+    expect(oklchToRgbBatch(batch, out)).toBe(out);
+    expect(out.r[0]).toBe(oklchToRgb(palette[0]).r);
+  });
+});
+
+describe('Contrast matrix', () => {
+  const rgbColors = makePalette(100, 7).map(oklchToRgb);
+  const backgrounds: RGBColor[] = [
+    { r: 255, g: 255, b: 255 },
+    { r: 0, g: 0, b: 0 },
+    { r: 18, g: 18, b: 18 },
+  ];
+
+  it('should match calculateContrastRatio for every pair', () => {
+    const matrix = calculateContrastMatrix(toRGBBatch(rgbColors), toRGBBatch(backgrounds));
+
+    expect(matrix.rows).toBe(100);
+    expect(matrix.cols).toBe(3);
+    rgbColors.forEach((fg, row) => {
+      backgrounds.forEach((bg, col) => {
+        expect(matrix.ratios[row * matrix.cols + col]).toBe(calculateContrastRatio(fg, bg));
+      });
+    });
+  });
+
+  it('should compare a palette with itself by default', () => {
+    const matrix = calculateContrastMatrix(toRGBBatch(backgrounds));
+
+    expect(matrix.rows).toBe(3);
+    expect(matrix.ratios[0]).toBe(1);
+    expect(matrix.ratios[1]).toBe(21);
+  });
+
+  it('should match checkWCAGCompliance for every pair', () => {
+    const matrix = calculateContrastMatrix(toRGBBatch(rgbColors), toRGBBatch(backgrounds));
+
+    for (const level of ['AA', 'AAA'] as const) {
+      const passed = checkWCAGComplianceBatch(matrix, level, true);
+      matrix.ratios.forEach((ratio, i) => {
+        expect(passed[i] === 1).toBe(checkWCAGCompliance(ratio, level, true).passed);
+      });
+    }
+  });
+});
+
+describe('scalesToOKLCHBatch', () => {
+  it('should flatten scales in step order', () => {
+    const scales = generateColorScales({
+      primary: { l: 0.5, c: 0.15, h: 220 },
+      accent: { l: 0.6, c: 0.1, h: 30 },
+    });
+    const { keys, batch } = scalesToOKLCHBatch(scales);
+
+    expect(keys).toHaveLength(22);
+    expect(keys[5]).toBe('primary.500');
+    expect(keys[11]).toBe('accent.50');
+    expect(batch.l[5]).toBe(scales.primary['500'].l);
+    expect(batch.h[11]).toBe(scales.accent['50'].h);
+  });
+});
+
+describe('Batch color pipeline', () => {
+  it('should count the same passing pairs as the scalar pipeline', () => {
+    const palette = makePalette(2000, 1);
+    const backgrounds = makePalette(16, 2).map(oklchToRgb);
+
+    let scalarPasses = 0;
+    for (const fg of palette.map(oklchToRgb)) {
+      for (const bg of backgrounds) {
+        if (checkWCAGCompliance(calculateContrastRatio(fg, bg), 'AA').passed) {
+          scalarPasses++;
+        }
+      }
+    }
+
+    const rgb = oklchToRgbBatch(toOKLCHBatch(palette));
+    const matrix = calculateContrastMatrix(rgb, toRGBBatch(backgrounds));
+    const passed = checkWCAGComplianceBatch(matrix, 'AA');
+    let batchPasses = 0;
+    for (let i = 0; i < passed.length; i++) {
+      batchPasses += passed[i];
+    }
+
+    expect(passed.length).toBe(2000 * 16);
+    expect(batchPasses).toBe(scalarPasses);
+  });
+});
@@ -1,2 +0,0 @@
-export {};
-//# sourceMappingURL=color-conversion.test.d.ts.map
\ No newline at end of file
@@ -0,0 +1,175 @@
+import { describe, it, expect, beforeEach } from 'vitest';
+import {
+  calculateContrastRatio,
+  solveContrastLightness,
+  repairColorScale,
+  clearContrastSolverCache,
+} from '../src/wcag-validator';
+import { oklchToRgb } from '../src/color-conversion';
+import { generateLightnessScale } from '../src/scale-generator';
+import { generateNeutralPalette } from '../src/generator/neutral-palette';
+import type { OKLCHColor, RGBColor } from '../src/schemas';
+
+const WHITE: RGBColor = { r: 255, g: 255, b: 255 };
+const BLACK: RGBColor = { r: 0, g: 0, b: 0 };
+const DARK_SURFACE: RGBColor = { r: 18, g: 18, b: 18 };
+
+function makeColors(size: number): OKLCHColor[] {
+  return Array.from({ length: size }, (_, i) => ({
+    l: ((i * 37) % 100) / 100,
+    c: ((i * 13) % 30) / 100,
+    h: (i * 47) % 360,
+  }));
+}
+
+describe('Contrast Solver', () => {
+  beforeEach(() => {
+    clearContrastSolverCache();
+  });
+
+  describe('solveContrastLightness', () => {
+    it('should keep compliant colors unchanged', () => {
+      const color = { l: 0.3, c: 0.1, h: 250 };
+      const solution = solveContrastLightness(color, WHITE, 'AA');
+
+      expect(solution.passed).toBe(true);
+      expect(solution.color).toEqual(color);
+      expect(solution.iterations).toBe(1);
+    });
+
+    it('should find a compliant color with the same chroma and hue', () => {
+      const color = { l: 0.7, c: 0.15, h: 220 };
+      const solution = solveContrastLightness(color, WHITE, 'AA');
+
+      expect(solution.passed).toBe(true);
+      expect(solution.color.c).toBeCloseTo(color.c, 4);
+      expect(solution.color.h).toBeCloseTo(color.h, 4);
+      expect(solution.color.l).toBeLessThan(color.l);
+      expect(calculateContrastRatio(oklchToRgb(solution.color), WHITE)).toBeGreaterThanOrEqual(4.5);
+    });
+
+    it('should pick the closest compliant lightness', () => {
+      const color = { l: 0.7, c: 0.15, h: 220 };
+      const solution = solveContrastLightness(color, WHITE, 'AA');
+
+      // Slightly lighter than the solution is no longer compliant
+      const lighter = { ...color, l: solution.color.l + 0.005 };
+      expect(calculateContrastRatio(oklchToRgb(lighter), WHITE)).toBeLessThan(4.5);
+    });
+
+    it('should lighten colors on dark backgrounds', () => {
+      const solution = solveContrastLightness({ l: 0.3, c: 0.05, h: 30 }, DARK_SURFACE, 'AAA');
+
+      expect(solution.passed).toBe(true);
+      expect(solution.color.l).toBeGreaterThan(0.3);
+      expect(solution.contrastRatio).toBeGreaterThanOrEqual(7);
+    });
+
+    it('should report best effort when no lightness is compliant', () => {
+      const midGray = { r: 119, g: 119, b: 119 };
+      const solution = solveContrastLightness({ l: 0.5, c: 0, h: 0 }, midGray, 'AAA');
+
+      expect(solution.passed).toBe(false);
+      expect(solution.contrastRatio).toBeLessThan(7);
+    });
+
+    it('should stay within a bounded number of evaluations', () => {
+      for (const color of makeColors(200)) {
+        for (const background of [WHITE, BLACK, DARK_SURFACE]) {
+          expect(solveContrastLightness(color, background, 'AAA').iterations).toBeLessThanOrEqual(
+            53
+          );
+        }
+      }
+    });
+
+    it('should memoize per color, background and level', () => {
+      const color = { l: 0.6, c: 0.1, h: 140 };
+      const first = solveContrastLightness(color, WHITE, 'AA');
+      const again = solveContrastLightness({ ...color }, WHITE, 'AA');
+
+      expect(again).toEqual({ ...first, iterations: again.iterations });
+      expect(again.iterations).toBeLessThan(first.iterations);
+      expect(solveContrastLightness(color, WHITE, 'AAA').color.l).not.toBe(first.color.l);
+    });
+
+    it('should share the search between near-equal colors but keep their chroma and hue', () => {
+      const color = { l: 0.7, c: 0.15, h: 220 };
+      const first = solveContrastLightness(color, WHITE, 'AA');
+      const nearby = { l: color.l + 1e-9, c: color.c - 1e-9, h: color.h + 1e-9 };
+      const solution = solveContrastLightness(nearby, WHITE, 'AA');
+
+      expect(solution.iterations).toBeLessThan(first.iterations);
+      expect(solution.color.l).toBeCloseTo(first.color.l, 3);
+      expect(solution.color.c).toBe(nearby.c);
+      expect(solution.color.h).toBe(nearby.h);
+      expect(solution.passed).toBe(true);
+    });
+
+    it('should measure the returned color, not the cache key', () => {
+      for (const color of makeColors(200)) {
+        const exact = { l: color.l + 0.00003, c: color.c * 0.99991, h: (color.h + 0.0071) % 360 };
+        const solution = solveContrastLightness(exact, WHITE, 'AA');
+
+        expect(solution.color.c).toBe(exact.c);
+        expect(solution.color.h).toBe(exact.h);
+        expect(solution.rgb).toEqual(oklchToRgb(solution.color));
+        expect(solution.contrastRatio).toBe(calculateContrastRatio(solution.rgb, WHITE));
+        expect(solution.passed).toBe(solution.contrastRatio >= 4.5);
+      }
+    });
+  });
+
+  describe('repairColorScale', () => {
+    it('should make every step of a lightness scale compliant', () => {
+      const scale = generateLightnessScale({ l: 0.6, c: 0.15, h: 220 });
+      const repaired = repairColorScale(scale, WHITE, 'AA');
+
+      for (const step of Object.keys(repaired) as Array<keyof typeof repaired>) {
+        const ratio = calculateContrastRatio(oklchToRgb(repaired[step]), WHITE);
+        expect(ratio).toBeGreaterThanOrEqual(4.5);
+      }
+      // Already compliant dark steps are untouched
+      expect(repaired['900']).toEqual(scale['900']);
+    });
+
+    it('should repair neutral palettes', () => {
+      const palette = generateNeutralPalette({ mode: 'dark' });
+      const repaired = repairColorScale(palette, DARK_SURFACE, 'AAA');
+
+      for (const color of Object.values(repaired)) {
+        expect(calculateContrastRatio(oklchToRgb(color), DARK_SURFACE)).toBeGreaterThanOrEqual(7);
+      }
+      expect(repaired['50']).toEqual(palette['50']);
+    });
+
+    it('should make off-grid scales compliant', () => {
+      // Deterministic pseudo-random chroma/hue that never fall on the cache grid
+      let seed = 7;
+      const random = () => {
+        seed = (seed * 16807) % 2147483647;
+        return seed / 2147483647;
+      };
+
+      for (let n = 0; n < 50; n++) {
+        const scale = generateLightnessScale({
+          l: 0.6,
+          c: 0.02 + random() * 0.2,
+          h: random() * 360,
+        });
+        for (const [background, level, threshold] of [
+          [WHITE, 'AA', 4.5],
+          [DARK_SURFACE, 'AAA', 7],
+        ] as const) {
+          const repaired = repairColorScale(scale, background, level);
+          for (const step of Object.keys(repaired) as Array<keyof typeof repaired>) {
+            expect(repaired[step].c).toBe(scale[step].c);
+            expect(repaired[step].h).toBe(scale[step].h);
+            const ratio = calculateContrastRatio(oklchToRgb(repaired[step]), background);
+            expect(ratio).toBeGreaterThanOrEqual(threshold);
+          }
+        }
+      }
+    });
+  });
+});
@@ -1,2 +0,0 @@
-export {};
-//# sourceMappingURL=edge-cases.test.d.ts.map
\ No newline at end of file
@@ -1,2 +0,0 @@
-export {};
-//# sourceMappingURL=output-formats.test.d.ts.map
\ No newline at end of file
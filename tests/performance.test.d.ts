@@ -1,2 +0,0 @@
-export {};
-//# sourceMappingURL=performance.test.d.ts.map
\ No newline at end of file
@@ -1,2 +0,0 @@
-export {};
-//# sourceMappingURL=scale-generator.test.d.ts.map
\ No newline at end of file
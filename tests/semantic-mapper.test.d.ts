@@ -1,2 +0,0 @@
-export {};
-//# sourceMappingURL=semantic-mapper.test.d.ts.map
\ No newline at end of file
@@ -1,2 +0,0 @@
-export {};
-//# sourceMappingURL=integration.test.d.ts.map
\ No newline at end of file
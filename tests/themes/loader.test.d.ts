@@ -1,2 +0,0 @@
-export {};
-//# sourceMappingURL=loader.test.d.ts.map
\ No newline at end of file
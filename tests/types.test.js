@@ -1,22 +0,0 @@
-import { describe, it, expectTypeOf } from 'vitest';
-describe('TypeScript Type Definitions - TASK-004', () => {
-    it('should define OKLCHColor type correctly', () => {
-        expectTypeOf().toMatchTypeOf();
-    });
-    it('should define RGBColor type correctly', () => {
-        expectTypeOf().toMatchTypeOf();
-    });
-    it('should define ColorScale as record of OKLCH colors', () => {
-        expectTypeOf().toMatchTypeOf();
-    });
-    it('should define TokenDefinition with required and optional fields', () => {
-        expectTypeOf().toMatchTypeOf();
-    });
-    it('should define AccessibilityCheck type correctly', () => {
-        expectTypeOf().toMatchTypeOf();
-    });
-    it('should define ComponentPreset type correctly', () => {
-        expectTypeOf().toMatchTypeOf();
-    });
-});
-//# sourceMappingURL=types.test.js.map
\ No newline at end of file
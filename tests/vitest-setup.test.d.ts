@@ -1,2 +0,0 @@
-export {};
-//# sourceMappingURL=vitest-setup.test.d.ts.map
\ No newline at end of file
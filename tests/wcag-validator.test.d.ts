@@ -1,2 +0,0 @@
-export {};
-//# sourceMappingURL=wcag-validator.test.d.ts.map
\ No newline at end of file
@@ -5,6 +5,7 @@ import {
   validateColorPair,
   suggestLightnessAdjustment,
 } from '../src/wcag-validator';
+import { oklchToRgb, rgbToOklch } from '../src/color-conversion';
 
 describe('WCAG AA Validator - TASK-008', () => {
   describe('calculateContrastRatio', () => {
@@ -184,6 +185,15 @@ describe('WCAG AA Validator - TASK-008', () => {
 
       expect(suggestion).not.toBeNull();
     });
+
+    it('should suggest an OKLCH lightness that reaches the level', () => {
+      const foreground = { r: 200, g: 200, b: 200 };
+      const background = { r: 255, g: 255, b: 255 };
+      const suggestion = suggestLightnessAdjustment(foreground, background, 'AA');
+
+      const fixed = oklchToRgb({ ...rgbToOklch(foreground), l: suggestion! });
+      expect(calculateContrastRatio(fixed, background)).toBeGreaterThanOrEqual(4.5);
+    });
   });
 
   describe('edge cases', () => {
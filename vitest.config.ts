@@ -43,5 +43,8 @@ export default defineConfig({
     typecheck: {
       enabled: false,
     },
+    benchmark: {
+      include: ['tests/**/*.bench.ts'],
+    },
   },
 });